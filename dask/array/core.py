@@ -5,7 +5,9 @@ from collections import Iterable, MutableMapping
 from collections import Iterator
 from functools import partial, wraps
 import inspect
+import io
 from itertools import product
+import json
 from numbers import Number
 import operator
 from operator import add, getitem, mul
@@ -17,7 +19,8 @@ import warnings
 
 from toolz.curried import (pipe, partition, concat, pluck, join, first,
                            memoize, map, groupby, valmap, accumulate, merge,
-                           reduce, interleave, sliding_window, assoc)
+                           reduce, interleave, sliding_window, assoc,
+                           partition_all)
 import numpy as np
 
 from . import chunk
@@ -27,6 +30,7 @@ from ..base import Base, tokenize, normalize_token
 from ..utils import (deepmap, ignoring, concrete, is_integer,
                      IndexCallable, funcname, derived_from)
 from ..compatibility import unicode, long, getargspec, zip_longest, apply
+from ..context import _globals
 from ..optimize import cull
 from .. import threaded, core
 
@@ -736,7 +740,7 @@ def topk(k, x):
     return Array(merge(dsk, x.dask), name2, chunks, dtype=x.dtype)
 
 
-def store(sources, targets, lock=True, compute=True, **kwargs):
+def store(sources, targets, lock=True, compute=True, coalesce=None, **kwargs):
     """ Store dask arrays in array-like objects, overwrite data in target
 
     This stores dask arrays into object that supports numpy-style setitem
@@ -757,8 +761,14 @@ def store(sources, targets, lock=True, compute=True, **kwargs):
         Whether or not to lock the data stores while storing.
         Pass True (lock each file individually), False (don't lock) or a
         particular ``threading.Lock`` object to be shared among all writes.
+        With True, NumPy arrays are not locked, and targets with a
+        ``chunks`` attribute, like HDF5 datasets, are only locked between
+        writes that touch the same chunk of the target.
     compute: boolean, optional
         If true compute immediately, return ``dask.delayed.Delayed`` otherwise
+    coalesce: int, optional
+        Merge neighbouring blocks into writes of up to this many bytes,
+        for fewer and larger writes of arrays with small blocks
 
     Examples
     --------
@@ -787,11 +797,22 @@ def store(sources, targets, lock=True, compute=True, **kwargs):
         raise ValueError("Different number of sources [%d] and targets [%d]"
                          % (len(sources), len(targets)))
 
+    if coalesce:
+        sources = [src.rechunk(coalesce_chunks(src.chunks, src.dtype.itemsize,
+                                               coalesce))
+                   for src in sources]
+
     updates = [insert_to_ooc(tgt, src, lock=lock)
                for tgt, src in zip(targets, sources)]
     dsk = merge([src.dask for src in sources] + updates)
     keys = [key for u in updates for key in u]
     if compute:
+        from ..multiprocessing import get as mpget
+        if ((kwargs.get('get') or _globals.get('get')) is mpget and
+                any(isinstance(t, np.ndarray) for t in targets)):
+            raise ValueError("Can't store into NumPy arrays with the "
+                             "multiprocessing scheduler, the writes would "
+                             "go to copies in the worker processes")
         Array._get(dsk, keys, **kwargs)
     else:
         from ..delayed import Delayed
@@ -1457,6 +1478,12 @@ class Array(Base):
         trim: bool
             Whether or not to trim the excess after the map function.  Set this
             to false if your mapping function does this for you.
+        reuse_buffer: bool
+            Copy each block and its neighbours' edges straight into a buffer
+            reused from block to block, rather than creating extended blocks.
+            This saves memory and copies, but ``func`` must not keep
+            references to its input.  Buffers are freed once all blocks have
+            run.  Does not support ``drop_axis=`` or ``new_axis=``.
         **kwargs:
             Other keyword arguments valid in ``map_blocks``
 
@@ -1507,10 +1534,10 @@ class Array(Base):
     def squeeze(self):
         return squeeze(self)
 
-    def rechunk(self, chunks):
+    def rechunk(self, chunks, threshold=None, block_size_limit=None):
         """ See da.rechunk for docstring """
         from .rechunk import rechunk
-        return rechunk(self, chunks)
+        return rechunk(self, chunks, threshold, block_size_limit)
 
     @property
     def real(self):
@@ -1604,7 +1631,8 @@ def ensure_int(f):
 normalize_token.register(Array, lambda a: a.name)
 
 
-def normalize_chunks(chunks, shape=None):
+def normalize_chunks(chunks, shape=None, limit=None, dtype=None,
+                     previous_chunks=None):
     """ Normalize chunks to tuple of tuples
 
     >>> normalize_chunks((2, 2), shape=(5, 6))
@@ -1621,12 +1649,21 @@ def normalize_chunks(chunks, shape=None):
 
     >>> normalize_chunks((), shape=(0, 0))  #  respects null dimensions
     ((), ())
+
+    >>> normalize_chunks((-1, 2), shape=(3, 4))  # -1 spans the whole axis
+    ((3,), (2, 2))
+
+    Chunks given as ``'auto'``, for all or some axes, are chosen to keep
+    blocks under ``limit`` bytes, see ``auto_chunks``.
+
+    >>> normalize_chunks('auto', shape=(1000, 1000), limit=3.2e5, dtype='f8')
+    ((200, 200, 200, 200, 200), (200, 200, 200, 200, 200))
     """
     if chunks is None:
         raise ValueError(chunks_none_error_message)
     if isinstance(chunks, list):
         chunks = tuple(chunks)
-    if isinstance(chunks, Number):
+    if isinstance(chunks, (Number, str, unicode)):
         chunks = (chunks,) * len(shape)
     if not chunks and shape and all(s == 0 for s in shape):
         chunks = ((),) * len(shape)
@@ -1638,7 +1675,11 @@ def normalize_chunks(chunks, shape=None):
                 "Got chunks=%s, shape=%s" % (chunks, shape))
 
     if shape is not None:
-        chunks = tuple(c if c is not None else s for c, s in zip(chunks, shape))
+        chunks = tuple(s if c is None or c == -1 else c
+                       for c, s in zip(chunks, shape))
+        if any(c == 'auto' for c in chunks):
+            chunks = auto_chunks(chunks, shape, limit, dtype,
+                                 previous_chunks)
 
     if chunks and shape is not None:
         chunks = sum((blockdims_from_blockshape((s,), (c,))
@@ -1648,6 +1689,79 @@ def normalize_chunks(chunks, shape=None):
     return tuple(map(tuple, chunks))
 
 
+def auto_chunks(chunks, shape, limit=None, dtype=None, previous_chunks=None):
+    """ Block shape for the axes of ``chunks`` that are ``'auto'``
+
+    Automatic axes share the bytes left under ``limit`` by the other axes
+    as evenly as possible.  If ``previous_chunks`` gives the chunking of the
+    source, like the ``.chunks`` of an HDF5 dataset, automatic block sizes
+    are multiples of it so that no source chunk is read by two blocks.
+
+    Parameters
+    ----------
+    chunks : tuple
+        Block sizes, block dimensions or ``'auto'`` per axis
+    shape : tuple
+    limit : int, optional
+        Largest number of bytes per block.  Defaults to the
+        ``auto_chunk_size`` option or 1e8.
+    dtype : np.dtype
+    previous_chunks : tuple, optional
+        Block sizes or block dimensions of the source per axis
+
+    Examples
+    --------
+    >>> auto_chunks(('auto', 'auto'), (1000, 1000), 8e4, 'f8')
+    (100, 100)
+    >>> auto_chunks(('auto', 10), (1000, 1000), 8e4, 'f8')
+    (1000, 10)
+    >>> auto_chunks(('auto', 'auto'), (1000, 1000), 8e4, 'f8',
+    ...             previous_chunks=(30, 30))
+    (90, 90)
+    """
+    if dtype is None:
+        raise TypeError("dtype is required for automatic chunking")
+    if limit is None:
+        limit = _globals.get('auto_chunk_size', 1e8)
+    if previous_chunks is not None:
+        previous_chunks = tuple(max(c) if isinstance(c, (tuple, list)) else c
+                                for c in previous_chunks)
+        if (len(previous_chunks) != len(shape) or
+                not all(is_integer(c) and c > 0 for c in previous_chunks)):
+            previous_chunks = None
+    if previous_chunks is None:
+        previous_chunks = (1,) * len(shape)
+
+    chunks = list(chunks)
+    auto = [i for i, c in enumerate(chunks) if c == 'auto']
+    budget = limit / np.dtype(dtype).itemsize
+    for i, c in enumerate(chunks):
+        if i not in auto:
+            budget /= max(max(c) if isinstance(c, (tuple, list)) else c, 1)
+
+    # Give whole axes to those that are short, then share out the rest
+    base = dict((i, min(previous_chunks[i], max(shape[i], 1))) for i in auto)
+    while auto:
+        scale = (budget / reduce(mul, [base[i] for i in auto], 1)) ** (
+            1.0 / len(auto))
+        short = [i for i in auto if base[i] * scale >= shape[i]]
+        if not short:
+            break
+        for i in short:
+            chunks[i] = max(shape[i], 1)
+            budget /= chunks[i]
+            auto.remove(i)
+    for i in auto:
+        if base[i] > 1:
+            chunks[i] = max(int(base[i] * scale) // base[i], 1) * base[i]
+        else:
+            # Even out the blocks, as in 1000 -> (500, 500) not (600, 400)
+            size = max(int(scale), 1)
+            n = -(-shape[i] // size)
+            chunks[i] = -(-shape[i] // n)
+    return tuple(chunks)
+
+
 def from_array(x, chunks, name=None, lock=False, fancy=True):
     """ Create dask array from something that looks like an array
 
@@ -1662,6 +1776,10 @@ def from_array(x, chunks, name=None, lock=False, fancy=True):
         - A blockshape like (1000, 1000).
         - Explicit sizes of all blocks along all dimensions
           like ((1000, 1000, 500), (400, 400)).
+        - 'auto', or 'auto' for some dimensions, to pick block sizes under
+          the ``auto_chunk_size`` option in bytes, aligned with the
+          ``.chunks`` of ``x`` if it has them, as HDF5 datasets do.
+        - -1 or None for the full size of a dimension.
     name : str, optional
         The key name to use for the array. Defaults to a hash of ``x``.
     lock : bool or Lock, optional
@@ -1683,7 +1801,8 @@ def from_array(x, chunks, name=None, lock=False, fancy=True):
 
     >>> a = da.from_array(x, chunks=(1000, 1000), lock=True)  # doctest: +SKIP
     """
-    chunks = normalize_chunks(chunks, x.shape)
+    chunks = normalize_chunks(chunks, x.shape, dtype=x.dtype,
+                              previous_chunks=getattr(x, 'chunks', None))
     if len(chunks) != len(x.shape):
         raise ValueError("Input array has %d dimensions but the supplied "
                          "chunks has only %d dimensions" %
@@ -2273,8 +2392,71 @@ def dot(a, b):
     return tensordot(a, b, axes=((a.ndim - 1,), (b.ndim - 2,)))
 
 
+def coalesce_chunks(chunks, itemsize, limit):
+    """ Merge neighbouring chunks while blocks stay below ``limit`` bytes
+
+    The last axis is merged first, so that merged blocks are contiguous in C
+    order as long as possible.
+
+    >>> coalesce_chunks(((2, 2, 2, 2), (2, 2, 2, 2)), 1, 16)
+    ((2, 2, 2, 2), (8,))
+    >>> coalesce_chunks(((2, 2, 2, 2), (2, 2, 2, 2)), 1, 40)
+    ((4, 4), (8,))
+    """
+    chunks = list(chunks)
+    for i in range(len(chunks) - 1, -1, -1):
+        if not chunks[i]:
+            continue
+        other = reduce(mul, [max(c) for j, c in enumerate(chunks)
+                             if j != i and c], 1) * itemsize
+        out = [chunks[i][0]]
+        for c in chunks[i][1:]:
+            if (out[-1] + c) * other <= limit:
+                out[-1] += c
+            else:
+                out.append(c)
+        chunks[i] = tuple(out)
+    return tuple(chunks)
+
+
+def lock_groups(chunks, target_chunks):
+    """ Number blocks along every axis by the target chunks they write to
+
+    Neighbouring blocks get the same number when the boundary between them
+    falls inside a chunk of the target.  Two blocks can only write to the
+    same chunk of the target if they have the same numbers along every axis.
+
+    >>> lock_groups(((2, 2, 2), (5, 5)), (2, 2))
+    ((0, 1, 2), (0, 0))
+    """
+    groups = []
+    for bds, c in zip(chunks, target_chunks):
+        g = [0]
+        pos = 0
+        for b in bds[:-1]:
+            pos += b
+            g.append(g[-1] + (pos % c == 0))
+        groups.append(tuple(g))
+    return tuple(groups)
+
+
 def insert_to_ooc(out, arr, lock=True):
-    if lock is True:
+    target_chunks = getattr(out, 'chunks', None)
+    if lock is True and isinstance(out, np.ndarray):
+        # Writes to disjoint regions of NumPy arrays are safe
+        lock = False
+    elif (lock is True and isinstance(target_chunks, tuple) and
+            len(target_chunks) == arr.ndim and
+            all(is_integer(c) and c > 0 for c in target_chunks)):
+        groups = lock_groups(arr.chunks, target_chunks)
+        if all(len(set(g)) == len(g) for g in groups):
+            # Every block writes to its own chunks of the target
+            lock = False
+        else:
+            lock = dict((idx, Lock()) for idx in product(*map(set, groups)))
+            lock = dict((idx, lock[tuple(g[i] for g, i in zip(groups, idx))])
+                        for idx in product(*map(range, arr.numblocks)))
+    elif lock is True:
         lock = Lock()
 
     def store(x, index, lock):
@@ -2291,7 +2473,8 @@ def insert_to_ooc(out, arr, lock=True):
     slices = slices_from_chunks(arr.chunks)
 
     name = 'store-%s' % arr.name
-    dsk = dict(((name,) + t[1:], (store, t, slc, lock))
+    dsk = dict(((name,) + t[1:],
+                (store, t, slc, lock[t[1:]] if isinstance(lock, dict) else lock))
                for t, slc in zip(core.flatten(arr._keys()), slices))
     return dsk
 
@@ -2878,16 +3061,301 @@ def fromfunction(func, chunks=None, shape=None, dtype=None):
     return Array(dsk, name, chunks, dtype=dtype)
 
 
+def _unique_chunk(x, return_counts=False):
+    """ Sorted unique values of a block, and their counts if asked for """
+    if return_counts:
+        return np.unique(x, return_counts=True)
+    return np.unique(x), None
+
+
+def _unique_combine(parts, return_counts=False):
+    """ Merge ``(values, counts)`` pairs from ``_unique_chunk`` """
+    values = np.concatenate([p[0] for p in parts])
+    if not return_counts:
+        return np.unique(values), None
+    counts = np.concatenate([p[1] for p in parts])
+    order = np.argsort(values, kind='mergesort')
+    values, counts = values[order], counts[order]
+    if not len(values):
+        return values, counts
+    starts = np.flatnonzero(np.concatenate([[True],
+                                            values[1:] != values[:-1]]))
+    return values[starts], np.add.reduceat(counts, starts)
+
+
+def _tree_graph(dsk, name, keys, combine, split_every, *args):
+    """ Add tasks to ``dsk`` merging ``keys`` with ``combine(parts, *args)``
+
+    Parts are merged ``split_every`` at a time, level by level, until at most
+    ``split_every`` keys remain.  Returns those keys for a final task.
+    """
+    split_every = max(split_every or _globals.get('split_every', 4), 2)
+    keys = list(keys)
+    depth = 0
+    while len(keys) > split_every:
+        depth += 1
+        level = '%s-combine-%d' % (name, depth)
+        groups = list(partition_all(split_every, keys))
+        for i, group in enumerate(groups):
+            dsk[(level, i)] = (combine, list(group)) + args
+        keys = [(level, i) for i in range(len(groups))]
+    return keys
+
+
+def _unique_tree(dsk, name, keys, dtype, return_counts, split_every):
+    """ Add a tree reduction of unique values to ``dsk``
+
+    ``keys`` refer to arrays of any shape.  Returns the key of the final
+    ``(values, counts)`` pair.
+    """
+    keys = list(keys) or [np.empty(0, dtype=dtype)]
+    for i, key in enumerate(keys):
+        dsk[(name + '-chunk', i)] = (_unique_chunk, key, return_counts)
+    keys = _tree_graph(dsk, name, [(name + '-chunk', i)
+                                   for i in range(len(keys))],
+                       _unique_combine, split_every, return_counts)
+    dsk[(name + '-agg', 0)] = (_unique_combine, keys, return_counts)
+    return (name + '-agg', 0)
+
+
 @wraps(np.unique)
-def unique(x):
-    name = 'unique-' + x.name
-    dsk = dict(((name, i), (np.unique, key)) for i, key in enumerate(x._keys()))
-    parts = Array._get(merge(dsk, x.dask), list(dsk.keys()))
-    return np.unique(np.concatenate(parts))
+def unique(x, return_inverse=False, return_counts=False, split_every=None):
+    # Blocks are made unique on their own and then merged ``split_every`` at
+    # a time, so no task holds more than that many sets of unique values.
+    # The results are one-dimensional arrays of unknown length.
+    token = tokenize(x, return_inverse, return_counts, split_every)
+    name = 'unique-' + token
+    dsk = {}
+    final = _unique_tree(dsk, name, core.flatten(x._keys()), x.dtype,
+                         return_counts, split_every)
+    dsk[(name, 0)] = (getitem, final, 0)
+    u = Array(merge(dsk, x.dask), name, ((np.nan,),), x.dtype)
+    result = [u]
+
+    if return_inverse:
+        if x.ndim > 1:
+            x = x.rechunk(dict((i, x.shape[i]) for i in range(1, x.ndim)))
+        x = x.ravel()
+        inv = 'unique-inverse-' + token
+        dsk = dict(((inv, i), (np.searchsorted, (name, 0), key))
+                   for i, key in enumerate(x._keys()))
+        dtype = np.searchsorted(np.array([], dtype=x.dtype), []).dtype
+        result.append(Array(merge(dsk, u.dask, x.dask), inv, x.chunks, dtype))
+
+    if return_counts:
+        counts = 'unique-counts-' + token
+        dsk = {(counts, 0): (getitem, final, 1)}
+        result.append(Array(merge(dsk, u.dask), counts, ((np.nan,),),
+                            np.dtype(np.intp)))
+
+    return result[0] if len(result) == 1 else tuple(result)
+
+
+def _value_counts(pair):
+    values, counts = pair
+    order = np.argsort(-counts, kind='mergesort')
+    return values[order], counts[order]
+
+
+def value_counts(x, split_every=None):
+    """ Unique values of an array and their counts, most frequent first
+
+    Counts are merged in a tree as in ``unique``.  Ties keep the order of
+    the values.
+
+    >>> x = from_array(np.array([1, 2, 4, 4, 4, 2]), chunks=3)
+    >>> values, counts = value_counts(x)
+    >>> values.compute()
+    array([4, 2, 1])
+    >>> counts.compute()
+    array([3, 2, 1])
+
+    See Also
+    --------
+    unique
+    """
+    token = tokenize(x, split_every)
+    name = 'value-counts-' + token
+    dsk = {}
+    final = _unique_tree(dsk, name, core.flatten(x._keys()), x.dtype,
+                         True, split_every)
+    dsk[(name + '-sorted', 0)] = (_value_counts, final)
+    dsk[(name, 0)] = (getitem, (name + '-sorted', 0), 0)
+    dsk[(name + '-counts', 0)] = (getitem, (name + '-sorted', 0), 1)
+    dsk = merge(dsk, x.dask)
+    return (Array(dsk, name, ((np.nan,),), x.dtype),
+            Array(dsk, name + '-counts', ((np.nan,),), np.dtype(np.intp)))
+
+
+def _hash_buckets(x, dtype, k):
+    """ Bucket in ``range(k)`` of every element of an array
+
+    Values are cast to ``dtype`` first so that equal values of different
+    dtypes land in the same bucket.
+    """
+    x = np.asarray(x).astype(dtype)
+    kind = x.dtype.kind
+    if kind in 'biuMm':
+        bits = x.astype('i8').view('u8')
+    elif kind == 'f':
+        x = x.astype('f8')
+        # 0.0 and -0.0 compare equal and must hash the same
+        x[x == 0] = 0
+        bits = x.view('u8')
+    else:
+        from ..bag.sketch import hash64
+        bits = np.fromiter((hash64(v) for v in x.flat), dtype='u8',
+                           count=x.size).reshape(x.shape)
+    with np.errstate(over='ignore'):
+        bits = bits * np.uint64(0x9E3779B97F4A7C15)
+        bits = bits ^ (bits >> np.uint64(29))
+    return (bits % np.uint64(k)).astype('i8')
+
+
+def _isin(element, test_elements, invert=False):
+    element = np.asarray(element)
+    return np.in1d(element.ravel(), test_elements,
+                   invert=invert).reshape(element.shape)
+
+
+def _split_by_hash(pair, dtype, k):
+    values = pair[0]
+    buckets = _hash_buckets(values, dtype, k)
+    return [values[buckets == j] for j in range(k)]
+
+
+def _isin_bucket(element, test_elements, dtype, k, j):
+    """ Membership of those elements that hash to bucket ``j`` """
+    element = np.asarray(element)
+    mask = _hash_buckets(element, dtype, k) == j
+    out = np.zeros(element.shape, dtype=bool)
+    out[mask] = np.in1d(element[mask], test_elements[0])
+    return out
+
+
+def _isin_reduce(masks, invert=False):
+    out = np.logical_or.reduce(masks)
+    return ~out if invert else out
+
+
+def isin(element, test_elements, invert=False, split_out=1,
+         split_every=None):
+    """ Whether each element of an array is in ``test_elements``
+
+    Parameters
+    ----------
+    element : dask.array.Array
+    test_elements : array_like or dask.array.Array
+        A NumPy array is sent to every block of ``element``.  The unique
+        values of a dask array are found by a tree reduction first.
+    invert : bool, optional
+        Return whether elements are *not* in ``test_elements``.
+    split_out : int, optional
+        Hash-partition the unique values of a dask ``test_elements`` into
+        this many buckets.  Each block of ``element`` is then tested against
+        one bucket per task, so no task holds the whole set.
+    split_every : int, optional
+        Number of partial results merged per task.
+
+    Examples
+    --------
+    >>> x = from_array(np.array([1, 2, 3, 4]), chunks=2)
+    >>> isin(x, [2, 4]).compute()
+    array([False,  True, False,  True], dtype=bool)
+
+    See Also
+    --------
+    numpy.in1d
+    """
+    token = tokenize(element, test_elements, invert, split_out, split_every)
+    name = 'isin-' + token
+    if not isinstance(test_elements, Array):
+        test_elements = np.unique(np.asarray(test_elements))
+        dsk = dict(((name,) + key[1:], (_isin, key, test_elements, invert))
+                   for key in core.flatten(element._keys()))
+        return Array(merge(dsk, element.dask), name, element.chunks, bool)
+
+    dsk = {}
+    keys = list(core.flatten(test_elements._keys()))
+    if split_out == 1:
+        final = _unique_tree(dsk, name + '-test', keys,
+                             test_elements.dtype, False, split_every)
+        dsk.update(((name,) + key[1:], (_isin, key, (getitem, final, 0),
+                                        invert))
+                   for key in core.flatten(element._keys()))
+        return Array(merge(dsk, element.dask, test_elements.dask), name,
+                     element.chunks, bool)
+
+    dtype = np.promote_types(element.dtype, test_elements.dtype)
+    split = name + '-split'
+    for i, key in enumerate(keys):
+        dsk[(split, i)] = (_split_by_hash, (_unique_chunk, key), dtype,
+                           split_out)
+    buckets = [_unique_tree(dsk, '%s-bucket-%d' % (name, j),
+                            [(getitem, (split, i), j)
+                             for i in range(len(keys))],
+                            test_elements.dtype, False, split_every)
+               for j in range(split_out)]
+    part = name + '-part'
+    for key in core.flatten(element._keys()):
+        idx = key[1:]
+        for j, bucket in enumerate(buckets):
+            dsk[(part,) + idx + (j,)] = (_isin_bucket, key, bucket, dtype,
+                                         split_out, j)
+        dsk[(name,) + idx] = (_isin_reduce,
+                              [(part,) + idx + (j,) for j in range(split_out)],
+                              invert)
+    return Array(merge(dsk, element.dask, test_elements.dask), name,
+                 element.chunks, bool)
+
+
+def _bincount_chunk(x, weights=None, minlength=0):
+    """ Bin counts of a block, dense or sparse
+
+    Blocks with fewer than a quarter as many values as there are bins are
+    counted as a sparse ``(bins, counts)`` pair of the non-empty bins rather
+    than an array of length ``minlength``.
+    """
+    x = np.asarray(x)
+    if len(x) * 4 < minlength:
+        bins, inverse = np.unique(x, return_inverse=True)
+        if len(bins) and bins[0] < 0:
+            # Like np.bincount, rather than wrapping around in np.add.at
+            raise ValueError("'list' argument must have no negative "
+                             "elements")
+        # np.unique keeps the input dtype; boolean bins would act as a mask
+        bins = bins.astype(np.intp)
+        if weights is None:
+            return bins, np.bincount(inverse, minlength=len(bins))
+        return bins, np.bincount(inverse, weights, len(bins))
+    return np.bincount(x, weights, minlength)
+
+
+def _bincount_combine(parts, minlength=0, sparse=True):
+    """ Sum dense and sparse bin counts from ``_bincount_chunk``
+
+    The sum stays sparse while all parts are and it remains below a quarter
+    of ``minlength`` bins.
+    """
+    dense = [p for p in parts if not isinstance(p, tuple)]
+    sparse_parts = [p for p in parts if isinstance(p, tuple)]
+    if (sparse and not dense and
+            sum(len(p[0]) for p in sparse_parts) * 4 < minlength):
+        return _unique_combine(sparse_parts, return_counts=True)
+    size = max([minlength] + [len(p) for p in dense] +
+               [p[0][-1] + 1 for p in sparse_parts if len(p[0])])
+    counts = dense + [p[1] for p in sparse_parts]
+    dtype = np.result_type(*counts) if counts else np.intp
+    out = np.zeros(size, dtype=dtype)
+    for p in dense:
+        out[:len(p)] += p
+    for bins, counts in sparse_parts:
+        np.add.at(out, bins, counts)
+    return out
 
 
 @wraps(np.bincount)
-def bincount(x, weights=None, minlength=None):
+def bincount(x, weights=None, minlength=None, split_every=None):
     if minlength is None:
         raise TypeError("Must specify minlength argument in da.bincount")
     assert x.ndim == 1
@@ -2895,21 +3363,25 @@ def bincount(x, weights=None, minlength=None):
         assert weights.chunks == x.chunks
 
     # Call np.bincount on each block, possibly with weights
-    token = tokenize(x, weights, minlength)
+    token = tokenize(x, weights, minlength, split_every)
     name = 'bincount-' + token
     if weights is not None:
         dsk = dict(((name, i),
-                   (np.bincount, (x.name, i), (weights.name, i), minlength))
+                   (_bincount_chunk, (x.name, i), (weights.name, i),
+                    minlength))
                    for i, _ in enumerate(x._keys()))
         dtype = np.bincount([1], weights=[1]).dtype
     else:
-        dsk = dict(((name, i), (np.bincount, (x.name, i), None, minlength))
+        dsk = dict(((name, i), (_bincount_chunk, (x.name, i), None,
+                                minlength))
                    for i, _ in enumerate(x._keys()))
         dtype = np.bincount([]).dtype
 
-    # Sum up all of the intermediate bincounts per block
+    # Sum up the intermediate bincounts in a tree
+    keys = _tree_graph(dsk, name, [(name, i) for i in range(len(dsk))],
+                       _bincount_combine, split_every, minlength)
     name = 'bincount-sum-' + token
-    dsk[(name, 0)] = (np.sum, list(dsk), 0)
+    dsk[(name, 0)] = (_bincount_combine, keys, minlength, False)
 
     chunks = ((minlength,),)
 
@@ -3026,6 +3498,122 @@ def histogram(a, bins=None, range=None, normed=False, weights=None, density=None
             return n, bins
 
 
+def _histogramdd_chunk(sample, edges, weights=None):
+    """ Counts of a block of samples in the flattened bins of ``edges`` """
+    sample = np.asarray(sample)
+    nbins = [len(e) - 1 for e in edges]
+    index = np.zeros(len(sample), dtype=np.intp)
+    valid = np.ones(len(sample), dtype=bool)
+    for d, e in enumerate(edges):
+        column = sample[:, d]
+        # As numpy.histogramdd, the last bin includes its right edge
+        j = np.searchsorted(e, column, side='right') - 1
+        j[column == e[-1]] = nbins[d] - 1
+        valid &= (j >= 0) & (j < nbins[d])
+        index = index * nbins[d] + j
+    if weights is not None:
+        weights = np.asarray(weights)[valid]
+    return _bincount_chunk(index[valid], weights, int(np.prod(nbins)))
+
+
+def _histogramdd_agg(parts, edges, density=False):
+    nbins = tuple(len(e) - 1 for e in edges)
+    hist = _bincount_combine(parts, int(np.prod(nbins)), False)
+    hist = hist.astype(float).reshape(nbins)
+    if density:
+        total = hist.sum()
+        for d, e in enumerate(edges):
+            shape = [1] * len(edges)
+            shape[d] = nbins[d]
+            hist = hist / np.diff(e).reshape(shape)
+        hist /= total
+    return hist
+
+
+def histogramdd(sample, bins=10, range=None, normed=False, weights=None,
+                density=None, split_every=None):
+    """
+    Blocked variant of numpy.histogramdd.
+
+    Follows the signature of numpy.histogramdd with the following
+    exceptions:
+
+    - ``sample`` is a dask array of shape ``(N, D)`` or a sequence of ``D``
+      one-dimensional dask arrays.
+
+    - Numbers of bins need a ``range`` for every dimension, as in
+      ``histogram``.
+
+    - ``weights`` must be a one-dimensional dask array of length ``N``.
+
+    Each block is counted on its own, as a sparse list of non-empty bins if
+    it has few samples compared to the number of bins, and the counts are
+    summed ``split_every`` at a time.
+
+    Examples
+    --------
+    >>> import dask.array as da
+    >>> x = da.from_array(np.array([[0, 0], [1, 1], [1, 0.5]]), chunks=2)
+    >>> h, edges = da.histogramdd(x, bins=2, range=[(0, 1), (0, 1)])
+    >>> h.compute()
+    array([[ 1.,  0.],
+           [ 0.,  2.]])
+    """
+    if isinstance(sample, (list, tuple)):
+        sample = stack(sample, axis=1)
+    if sample.ndim != 2:
+        raise ValueError('sample must be two-dimensional')
+    if len(sample.chunks[1]) > 1:
+        sample = sample.rechunk({1: sample.shape[1]})
+    D = sample.shape[1]
+
+    if not np.iterable(bins):
+        bins = [bins] * D
+    if range is None:
+        range = [None] * D
+    if len(bins) != D or len(range) != D:
+        raise ValueError('bins and range must have one entry per dimension')
+    edges = []
+    for b, r in zip(bins, range):
+        if np.iterable(b):
+            edges.append(np.asarray(b))
+            continue
+        if r is None:
+            raise ValueError('dask.array.histogramdd requires either bins '
+                             'or bins and range to be defined.')
+        mn, mx = r
+        if mn == mx:
+            mn -= 0.5
+            mx += 0.5
+        edges.append(np.linspace(mn, mx, b + 1, endpoint=True))
+
+    if weights is not None and weights.chunks[0] != sample.chunks[0]:
+        weights = weights.rechunk((sample.chunks[0],))
+
+    token = tokenize(sample, [tokenize(e) for e in edges], normed, weights,
+                     density, split_every)
+    name = 'histogramdd-' + token
+    s_keys = list(core.flatten(sample._keys()))
+    if weights is None:
+        dsk = dict(((name + '-chunk', i), (_histogramdd_chunk, k, edges))
+                   for i, k in enumerate(s_keys))
+    else:
+        w_keys = list(core.flatten(weights._keys()))
+        dsk = dict(((name + '-chunk', i), (_histogramdd_chunk, k, edges, w))
+                   for i, (k, w) in enumerate(zip(s_keys, w_keys)))
+        dsk.update(weights.dask)
+    keys = _tree_graph(dsk, name, [(name + '-chunk', i)
+                                   for i, _ in enumerate(s_keys)],
+                       _bincount_combine, split_every,
+                       int(np.prod([len(e) - 1 for e in edges])))
+    dsk[(name,) + (0,) * D] = (_histogramdd_agg, keys, edges,
+                               bool(density or normed))
+    dsk.update(sample.dask)
+
+    chunks = tuple((len(e) - 1,) for e in edges)
+    return Array(dsk, name, chunks, float), edges
+
+
 def eye(N, chunks, M=None, k=0, dtype=float):
     """
     Return a 2-D Array with ones on the diagonal and zeros elsewhere.
@@ -3684,6 +4272,144 @@ def from_npy_stack(dirname, mmap_mode='r'):
     return Array(dsk, name, chunks, dtype)
 
 
+def _block_filename(idx):
+    return '.'.join(map(str, idx)) or '0'
+
+
+def _dtype_to_json(dtype):
+    return np.lib.format.dtype_to_descr(dtype)
+
+
+def _json_to_dtype(descr):
+    def totuple(x):
+        return tuple(map(totuple, x)) if isinstance(x, list) else x
+    if isinstance(descr, list):
+        return np.dtype([tuple(totuple(f)) for f in descr])
+    return np.dtype(str(descr))
+
+
+def _save_block(fn, x, compression):
+    if compression is None:
+        np.save(fn, x)
+    else:
+        from ..bytes.compression import compress
+        f = io.BytesIO()
+        np.save(f, x)
+        with open(fn, 'wb') as f2:
+            f2.write(compress[compression](f.getvalue()))
+    return None
+
+
+def _load_block(fn, compression):
+    from ..bytes.compression import decompress
+    with open(fn, 'rb') as f:
+        return np.load(io.BytesIO(decompress[compression](f.read())))
+
+
+def to_npy_blocks(dirname, x, compression=None, compute=True, **kwargs):
+    """ Write dask array to a directory of .npy files, one per block
+
+    Every block is written by its own task to its own file, so blocks are
+    written in parallel without locks and the array is not rechunked.  A
+    ``info.json`` file stores the shape, chunks and dtype of the array.
+
+    Examples
+    --------
+
+    >>> x = da.ones((5, 10), chunks=(2, 5))  # doctest: +SKIP
+    >>> da.to_npy_blocks('data/', x)  # doctest: +SKIP
+
+        $ tree data/
+        data/
+        |-- 0.0.npy
+        |-- 0.1.npy
+        |-- 1.0.npy
+        ...
+        |-- info.json
+
+    Load the array back, with blocks memory mapped, with
+    ``da.from_npy_blocks``
+
+    >>> y = da.from_npy_blocks('data/')  # doctest: +SKIP
+
+    Parameters
+    ----------
+    dirname: string
+        Directory to write, created if needed
+    x: dask array
+    compression: string or None
+        Compress every file, like ``'gzip'`` or ``'zlib'``.  Compressed
+        blocks can not be memory mapped when read.
+    compute: boolean, optional
+        If true compute immediately, return ``dask.delayed.Delayed`` otherwise
+
+    See Also
+    --------
+    from_npy_blocks
+    to_npy_stack
+    """
+    from ..bytes.compression import compress
+    if compression not in compress:
+        raise ValueError("Compression type %s not supported" % compression)
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+
+    meta = {'shape': x.shape, 'chunks': x.chunks,
+            'dtype': _dtype_to_json(x.dtype), 'compression': compression}
+    with open(os.path.join(dirname, 'info.json'), 'w') as f:
+        json.dump(meta, f)
+
+    name = 'to-npy-blocks-' + tokenize(x, dirname, compression)
+    dsk = dict(((name,) + key[1:],
+                (_save_block, os.path.join(dirname,
+                                           _block_filename(key[1:]) + '.npy'),
+                 key, compression))
+               for key in core.flatten(x._keys()))
+    if compute:
+        Array._get(merge(dsk, x.dask), list(dsk), **kwargs)
+    else:
+        from ..delayed import Delayed
+        dsk2 = merge(dsk, x.dask)
+        dsk2[name] = list(dsk)
+        return Delayed(name, [dsk2])
+
+
+def from_npy_blocks(dirname, mmap_mode='r'):
+    """ Load dask array from a directory written by ``to_npy_blocks``
+
+    Every dask block is one file.  Uncompressed blocks are memory mapped.
+
+    Parameters
+    ----------
+    dirname: string
+        Directory of .npy files
+    mmap_mode: (None or 'r')
+        Read uncompressed data in memory map mode
+
+    See Also
+    --------
+    to_npy_blocks
+    """
+    fn = os.path.join(dirname, 'info.json')
+    with open(fn) as f:
+        info = json.load(f)
+
+    chunks = tuple(map(tuple, info['chunks']))
+    dtype = _json_to_dtype(info['dtype'])
+    compression = info['compression']
+
+    name = 'from-npy-blocks-' + tokenize(dirname, info, os.path.getmtime(fn))
+    dsk = dict()
+    for idx in product(*[range(len(c)) for c in chunks]):
+        path = os.path.join(dirname, _block_filename(idx) + '.npy')
+        if compression is None:
+            dsk[(name,) + idx] = (np.load, path, mmap_mode)
+        else:
+            dsk[(name,) + idx] = (_load_block, path, compression)
+
+    return Array(dsk, name, chunks, dtype)
+
+
 def _astype(x, dtype, **kwargs):
     return x.astype(dtype, **kwargs)
 
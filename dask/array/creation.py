@@ -41,14 +41,14 @@ def linspace(start, stop, num=50, chunks=None, dtype=None):
     if chunks is None:
         raise ValueError("Must supply a chunks= keyword argument")
 
-    chunks = normalize_chunks(chunks, (num,))
+    dtype = dtype or np.linspace(0, 1, 1).dtype
+
+    chunks = normalize_chunks(chunks, (num,), dtype=dtype)
 
     range_ = stop - start
 
     space = float(range_) / (num - 1)
 
-    dtype = dtype or np.linspace(0, 1, 1).dtype
-
     name = 'linspace-' + tokenize((start, stop, num, chunks, dtype))
 
     dsk = {}
@@ -123,7 +123,7 @@ def arange(*args, **kwargs):
     if (range_ % step) != 0:
         num += 1
 
-    chunks = normalize_chunks(chunks, (num,))
+    chunks = normalize_chunks(chunks, (num,), dtype=dtype)
 
     name = 'arange-' + tokenize((start, stop, step, chunks, num))
     dsk = {}
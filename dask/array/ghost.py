@@ -1,15 +1,20 @@
 from __future__ import absolute_import, division, print_function
 
+from collections import OrderedDict
 from operator import getitem
 from itertools import product
+import threading
 
+import numpy as np
 from toolz import merge, pipe, concat, partition, partial
 from toolz.curried import map
 
 from ..base import tokenize
+from ..compatibility import getargspec
 from ..core import flatten
-from ..utils import concrete
-from .core import Array, map_blocks, concatenate, concatenate3
+from ..utils import concrete, funcname
+from .core import (Array, map_blocks, concatenate, concatenate3,
+                   slices_from_chunks)
 from . import chunk, wrap
 
 
@@ -391,10 +396,215 @@ def add_dummy_padding(x, depth, boundary):
     return x
 
 
-def map_overlap(x, func, depth, boundary=None, trim=True, **kwargs):
+def _halo_pieces(b, chunks, depth, kind):
+    """ Pieces along one axis of block ``b`` extended by its halo
+
+    Returns ``(source, index, size)`` triples for the left halo, the block
+    itself and the right halo.  ``source`` is the block the piece is sliced
+    from with ``index``, or None when ``index`` is a constant fill value.
+
+    >>> _halo_pieces(1, (4, 4, 4), 2, 'none')  # doctest: +NORMALIZE_WHITESPACE
+    [(0, slice(-2, None, None), 2),
+     (1, slice(None, None, None), 4),
+     (2, slice(0, 2, None), 2)]
+    >>> _halo_pieces(0, (4, 4), 1, 'periodic')  # doctest: +NORMALIZE_WHITESPACE
+    [(1, slice(-1, None, None), 1),
+     (0, slice(None, None, None), 4),
+     (1, slice(0, 1, None), 1)]
+    """
+    n = len(chunks)
+    center = (b, slice(None, None, None), chunks[b])
+    if not depth:
+        return [center]
+
+    if b > 0:
+        left = [(b - 1, slice(-depth, None), depth)]
+    elif kind == 'none':
+        left = []
+    elif kind == 'periodic':
+        left = [(n - 1, slice(-depth, None), depth)]
+    elif kind == 'reflect':
+        left = [(0, slice(depth - 1, None, -1), depth)]
+    elif kind == 'nearest':
+        left = [(0, slice(0, 1), depth)]
+    else:
+        left = [(None, kind, depth)]
+
+    if b < n - 1:
+        right = [(b + 1, slice(0, depth), depth)]
+    elif kind == 'none':
+        right = []
+    elif kind == 'periodic':
+        right = [(0, slice(0, depth), depth)]
+    elif kind == 'reflect':
+        right = [(n - 1, slice(-1, -depth - 1, -1), depth)]
+    elif kind == 'nearest':
+        right = [(n - 1, slice(-1, None), depth)]
+    else:
+        right = [(None, kind, depth)]
+
+    return left + [center] + right
+
+
+# Free buffers of running ``map_overlap(reuse_buffer=True)`` graphs, by
+# graph name.  A graph's buffers are released once all of its blocks have
+# run in this process.  Graphs whose blocks run partly elsewhere, or that
+# fail, are evicted once more than ``_max_buffered_graphs`` are around.
+_buffers = OrderedDict()
+_buffers_lock = threading.Lock()
+_max_buffered_graphs = 4
+
+
+def _apply_padded(func, parts, chunks, trim, name, ntasks):
+    """ Call ``func`` on the parts of a block with its halo
+
+    The parts are copied into a buffer left free by an earlier block of the
+    same shape and dtype of graph ``name``, if there is one.  The trimmed
+    result is copied out of the buffer if it is a view on it.
+    """
+    shape = tuple(map(sum, chunks))
+    dtype = parts[len(parts) // 2].dtype
+    key = (shape, dtype.str)
+    with _buffers_lock:
+        if name not in _buffers:
+            while len(_buffers) >= _max_buffered_graphs:
+                _buffers.popitem(last=False)
+            _buffers[name] = [0, {}]  # blocks done, free buffers by key
+        free = _buffers[name][1].get(key)
+        buf = free.pop() if free else None
+    if buf is None:
+        buf = np.empty(shape, dtype=dtype)
+    try:
+        for index, part in zip(slices_from_chunks(chunks), parts):
+            buf[index] = part
+        result = func(buf)
+        if trim:
+            result = result[trim]
+        if isinstance(result, np.ndarray) and np.may_share_memory(result,
+                                                                  buf):
+            result = result.copy()
+    finally:
+        with _buffers_lock:
+            entry = _buffers.get(name)
+            if entry is not None:
+                entry[0] += 1
+                if entry[0] >= ntasks:
+                    del _buffers[name]
+                else:
+                    entry[1].setdefault(key, []).append(buf)
+    return result
+
+
+def _map_overlap_buffered(x, func, depth, boundary, trim, **kwargs):
+    """ ``map_overlap`` without intermediate padded blocks
+
+    Each task gathers slices of the neighbouring blocks directly, fills
+    the boundaries itself and calls ``func`` on a reused buffer.
+    """
+    for kw in ['drop_axis', 'new_axis', 'token']:
+        if kw in kwargs:
+            raise NotImplementedError("map_overlap(reuse_buffer=True) does "
+                                      "not support %s=" % kw)
+    dtype = kwargs.pop('dtype', None)
+    out_chunks = kwargs.pop('chunks', None)
+    name = kwargs.pop('name', None)
+    name = name or '%s-%s' % (funcname(func),
+                              tokenize(x, func, depth, boundary, trim,
+                                       out_chunks, **kwargs))
+    try:
+        block_id = 'block_id' in getargspec(func).args
+    except Exception:
+        block_id = False
+
+    for i, c in enumerate(x.chunks):
+        if depth.get(i, 0) > min(c):
+            raise ValueError("The overlapping depth %d is larger than your\n"
+                             "smallest chunk size %d. Rechunk your array\n"
+                             "with a larger chunk size or a chunk size that\n"
+                             "more evenly divides the shape of your array." %
+                             (depth[i], min(c)))
+
+    # Sizes trimmed from the start and end of every block along every axis
+    trims = [[(depth.get(i, 0) if b > 0 or boundary.get(i, 'none') != 'none'
+               else 0,
+               depth.get(i, 0) if b < len(c) - 1 or
+               boundary.get(i, 'none') != 'none' else 0)
+              for b in range(len(c))]
+             for i, c in enumerate(x.chunks)]
+
+    if out_chunks is None:
+        chunks = tuple(tuple(c[b] + sum(t[b]) for b in range(len(c)))
+                       for c, t in zip(x.chunks, trims))
+    else:
+        if len(out_chunks) != x.ndim:
+            raise ValueError("Provided chunks have {0} dims, expected {1} "
+                             "dims.".format(len(out_chunks), x.ndim))
+        chunks = tuple(c if isinstance(c, tuple) else (c,) * len(xc)
+                       for c, xc in zip(out_chunks, x.chunks))
+        if any(len(c) != len(xc) for c, xc in zip(chunks, x.chunks)):
+            raise ValueError("Provided chunks do not match the number of "
+                             "blocks of the array")
+    if trim:
+        chunks = tuple(tuple(c[b] - sum(t[b]) for b in range(len(c)))
+                       for c, t in zip(chunks, trims))
+
+    ntasks = int(np.prod(x.numblocks))
+    dsk = {}
+    for idx in product(*[range(len(c)) for c in x.chunks]):
+        pieces = [_halo_pieces(b, c, depth.get(i, 0),
+                               boundary.get(i, 'none'))
+                  for i, (b, c) in enumerate(zip(idx, x.chunks))]
+        parts = []
+        for combo in product(*pieces):
+            constants = [index for source, index, _ in combo
+                         if source is None]
+            if constants:
+                # As in ``boundaries``, later axes fill the corners
+                parts.append((np.full, tuple(size for _, _, size in combo),
+                              constants[-1], x._dtype))
+                continue
+            key = (x.name,) + tuple(source for source, _, _ in combo)
+            index = tuple(index for _, index, _ in combo)
+            if all(ind == slice(None, None, None) for ind in index):
+                parts.append(key)
+            else:
+                parts.append((getitem, key, index))
+        block_chunks = tuple(tuple(size for _, _, size in p) for p in pieces)
+        if trim:
+            trim_index = tuple(slice(t[b][0], -t[b][1] or None)
+                               for t, b in zip(trims, idx))
+        else:
+            trim_index = None
+        f = func
+        if block_id:
+            f = partial(f, block_id=idx)
+        if kwargs:
+            f = partial(f, **kwargs)
+        dsk[(name,) + idx] = (_apply_padded, f, parts, block_chunks,
+                              trim_index, name, ntasks)
+
+    return Array(merge(dsk, x.dask), name, chunks, dtype)
+
+
+def map_overlap(x, func, depth, boundary=None, trim=True, reuse_buffer=False,
+                **kwargs):
+    """ Map a function over blocks of the array with some overlap
+
+    See ``Array.map_overlap``.  With ``reuse_buffer=True`` each task copies
+    the block and slices of its neighbours into a buffer that is reused for
+    the next block of the same shape, rather than building a new padded
+    block that is then trimmed.  ``func`` must then not keep references to
+    its input after returning.  The buffers of a graph are freed once all
+    of its blocks have run; ``drop_axis=`` and ``new_axis=`` are not
+    supported.
+    """
     depth2 = coerce_depth(x.ndim, depth)
     boundary2 = coerce_boundary(x.ndim, boundary)
 
+    if reuse_buffer:
+        return _map_overlap_buffered(x, func, depth2, boundary2, trim,
+                                     **kwargs)
+
     g = ghost(x, depth=depth2, boundary=boundary2)
     g2 = g.map_blocks(func, **kwargs)
     if trim:
@@ -33,15 +33,37 @@ def _percentile(a, q, interpolation='linear'):
 names = ('percentile-%d' % i for i in count(1))
 
 
-def percentile(a, q, interpolation='linear'):
+def percentile(a, q, interpolation='linear', method='default',
+               compression=100):
     """ Approximate percentile of 1-D array
 
     See numpy.percentile for more information
+
+    Parameters
+    ----------
+    a : Array
+    q : array_like of float
+        Percentiles to compute, ranging from 0 to 100
+    interpolation : {'linear', 'lower', 'higher', 'midpoint', 'nearest'}
+        Only used by the default method
+    method : {'default', 'sketch'}
+        The default method computes exact percentiles of every chunk and
+        merges them.  ``'sketch'`` summarizes every chunk with a t-digest of
+        at most about ``compression`` centroids, which keeps intermediates
+        small and is most accurate for tail percentiles like 99.9.  The
+        sketch ignores NaN values.
+    compression : int
+        Size of the t-digest, only used with ``method='sketch'``
     """
     if not a.ndim == 1:
         raise NotImplementedError(
             "Percentiles only implemented for 1-d arrays")
+    if method not in ('default', 'sketch'):
+        raise ValueError("method must be 'default' or 'sketch', got %r"
+                         % method)
     q = np.array(q)
+    if method == 'sketch':
+        return _percentile_sketch(a, q, compression)
     token = tokenize(a, list(q), interpolation)
     name = 'percentile_chunk-' + token
     dsk = dict(((name, i), (_percentile, (key), q, interpolation))
@@ -59,6 +81,101 @@ def percentile(a, q, interpolation='linear'):
                  dtype=dtype)
 
 
+def _percentile_sketch(a, q, compression):
+    if not np.issubdtype(a.dtype, np.number):
+        raise NotImplementedError("method='sketch' is only implemented "
+                                  "for numeric arrays")
+    token = tokenize(a, list(q), compression)
+    name = 'percentile_tdigest-' + token
+    dsk = dict(((name, i), (tdigest_chunk, key, compression))
+               for i, key in enumerate(a._keys()))
+
+    name2 = 'percentile-' + token
+    dsk2 = {(name2, 0): (tdigest_percentile,
+                         (tdigest_merge, sorted(dsk), compression), q)}
+    return Array(merge(a.dask, dsk, dsk2), name2, chunks=((len(q),),),
+                 dtype='f8')
+
+
+def _tdigest_compress(means, weights, compression):
+    """ Merge neighbouring sorted centroids
+
+    Centroids are grouped while they agree on the integer parts of two
+    scale functions of the quantile ``q`` at their left edge::
+
+        compression / (2 * pi) * asin(2 * q - 1)
+        compression / (4 * log(n / compression) + 24) * log(q / (1 - q))
+
+    The first bounds the rank error near the median, the second keeps
+    centroids small in proportion to their distance from the tails.  At most
+    about ``compression`` centroids remain.
+    """
+    total = weights.sum()
+    q = (np.cumsum(weights) - weights) / total
+    scale2 = compression / (4 * np.log(max(total / compression, 1)) + 24)
+    with np.errstate(divide='ignore'):
+        k1 = np.floor(compression / (2 * np.pi) * np.arcsin(2 * q - 1))
+        k2 = np.floor(scale2 * np.log(q / (1 - q)))
+    new = np.ones(len(q), dtype=bool)
+    new[1:] = (k1[1:] != k1[:-1]) | (k2[1:] != k2[:-1])
+    ids = np.cumsum(new) - 1
+    w = np.bincount(ids, weights)
+    m = np.bincount(ids, weights * means) / w
+    return m, w
+
+
+def tdigest_chunk(a, compression=100):
+    """ t-digest of the non-NaN values of an array
+
+    The digest is a tuple ``(means, weights, min, max)`` of sorted centroids
+    and the extreme values.  It has at most about ``compression`` centroids
+    however large the input is.
+    """
+    a = np.asarray(a, dtype='f8').ravel()
+    a = np.sort(a[~np.isnan(a)])
+    if not len(a):
+        return (a, a, np.nan, np.nan)
+    means, weights = _tdigest_compress(a, np.ones(len(a)), compression)
+    return (means, weights, a[0], a[-1])
+
+
+def tdigest_merge(digests, compression=100):
+    """ Merge t-digests into one of the same compression """
+    digests = [d for d in digests if len(d[0])]
+    if not digests:
+        empty = np.array([], dtype='f8')
+        return (empty, empty, np.nan, np.nan)
+    means = np.concatenate([d[0] for d in digests])
+    weights = np.concatenate([d[1] for d in digests])
+    order = np.argsort(means, kind='mergesort')
+    means, weights = _tdigest_compress(means[order], weights[order],
+                                       compression)
+    return (means, weights, min(d[2] for d in digests),
+            max(d[3] for d in digests))
+
+
+def tdigest_percentile(digest, q):
+    """ Estimated percentiles of a t-digest, ``q`` ranging from 0 to 100
+
+    Centroids sit at the middle of the ranks they cover and values are
+    linearly interpolated between them, so while every centroid holds a
+    single value this agrees with ``np.percentile``.
+
+    >>> digest = tdigest_chunk(np.array([1, 2, 3, 4, 5]))
+    >>> tdigest_percentile(digest, [0, 25, 50, 100]).tolist()
+    [1.0, 2.0, 3.0, 5.0]
+    """
+    means, weights, lo, hi = digest
+    q = np.asarray(q, dtype='f8') / 100
+    if not len(means):
+        return np.full(q.shape, np.nan)
+    n = weights.sum()
+    ranks = np.cumsum(weights) - weights + (weights - 1) / 2
+    x = np.concatenate([[0], ranks, [n - 1]])
+    y = np.concatenate([[lo], means, [hi]])
+    return np.interp(q * (n - 1), x, y)
+
+
 def merge_percentiles(finalq, qs, vals, Ns, interpolation='lower'):
     """ Combine several percentile calculations of different data.
 
@@ -6,7 +6,8 @@ from operator import getitem
 import numpy as np
 
 from .core import (normalize_chunks, Array, slices_from_chunks,
-                   broadcast_shapes, broadcast_to)
+                   broadcast_shapes, broadcast_to, exp, expm1, log, log1p,
+                   sign, sqrt, tan)
 from ..base import tokenize
 from ..utils import ignoring, random_state_data
 
@@ -27,7 +28,7 @@ class RandomState(object):
     This object contains state to deterministically generate pseudo-random
     numbers from a variety of probability distributions.  It is identical to
     ``np.random.RandomState`` except that all functions also take a ``chunks=``
-    keyword argument.
+    keyword argument, which may be ``'auto'``.
 
     Examples
     --------
@@ -69,7 +70,8 @@ class RandomState(object):
             shapes += [size]
         # broadcast to the final size(shape)
         size = broadcast_shapes(*shapes)
-        chunks = normalize_chunks(chunks, size)
+        # Most distributions give 8 byte values, good enough for 'auto'
+        chunks = normalize_chunks(chunks, size, dtype='f8')
         slices = slices_from_chunks(chunks)
 
         def _broadcast_any(ar, shape, chunks):
@@ -356,6 +358,198 @@ def _apply_random(func, state_data, size, args, kwargs):
     return func(*args, size=size, **kwargs)
 
 
+MASK32 = 0xFFFFFFFF
+PHILOX_M0 = np.uint64(0xD2511F53)
+PHILOX_M1 = np.uint64(0xCD9E8D57)
+PHILOX_W0 = 0x9E3779B9
+PHILOX_W1 = 0xBB67AE85
+
+
+def philox(c0, c1, c2, c3, k0, k1, rounds=10):
+    """ The Philox4x32 counter-based generator of Salmon et al. (2011)
+
+    Maps a counter of four 32-bit words, held in uint64 arrays, and a key
+    of two 32-bit integers to four pseudo-random 32-bit words.
+
+    >>> c = np.zeros(1, dtype='u8')
+    >>> [hex(int(w[0])) for w in philox(c, c, c, c, 0, 0)]
+    ['0x6627e8d5', '0xe169c58d', '0xbc57ac4c', '0x9b00dbd8']
+    """
+    shift, low = np.uint64(32), np.uint64(MASK32)
+    for _ in range(rounds):
+        p0 = PHILOX_M0 * c0
+        p1 = PHILOX_M1 * c2
+        c0, c1, c2, c3 = ((p1 >> shift) ^ c1 ^ np.uint64(k0), p1 & low,
+                          (p0 >> shift) ^ c3 ^ np.uint64(k1), p0 & low)
+        k0 = (k0 + PHILOX_W0) & MASK32
+        k1 = (k1 + PHILOX_W1) & MASK32
+    return c0, c1, c2, c3
+
+
+def _counter_block(kind, seed, stream, shape, offsets, block_shape):
+    """ Standard variates for one block of an array of ``shape``
+
+    Every element is computed from its position in the whole array, so the
+    values do not depend on the chunking.
+    """
+    flat = np.zeros((1,) * len(shape), dtype='u8')
+    stride = 1
+    for i in reversed(range(len(shape))):
+        index = np.arange(offsets[i], offsets[i] + block_shape[i],
+                          dtype='u8') * np.uint64(stride)
+        flat = flat + index.reshape((-1,) + (1,) * (len(shape) - i - 1))
+        stride *= shape[i]
+    flat = flat + np.zeros(block_shape, dtype='u8')
+
+    w0, w1, w2, w3 = philox(flat & np.uint64(MASK32), flat >> np.uint64(32),
+                            np.uint64(stream & MASK32),
+                            np.uint64(stream >> 32 & MASK32),
+                            seed & MASK32, seed >> 32 & MASK32)
+    # 53-bit uniforms on [0, 1) from pairs of words, as numpy does
+    u1 = ((w0 >> np.uint64(5)).astype('f8') * 67108864.0 +
+          (w1 >> np.uint64(6)).astype('f8')) / 9007199254740992.0
+    if kind == 'uniform':
+        return u1
+    if kind == 'exponential':
+        return -np.log1p(-u1)
+    u2 = ((w2 >> np.uint64(5)).astype('f8') * 67108864.0 +
+          (w3 >> np.uint64(6)).astype('f8')) / 9007199254740992.0
+    if kind == 'normal':
+        # Box-Muller
+        return np.sqrt(-2 * np.log1p(-u1)) * np.cos(2 * np.pi * u2)
+    raise ValueError("Unknown kind of variates %s" % kind)
+
+
+class CounterRandomState(object):
+    """ Random arrays from a counter-based generator
+
+    Each element is generated from the seed, a stream number that changes
+    with every call, and its index in the array, using the Philox4x32-10
+    generator.  Tasks hold no generator state, so building the graph takes
+    constant time per block, and the values are the same however the array
+    is chunked.
+
+    Supported distributions are those with a closed form in terms of
+    uniform, exponential and normal variates.  Use ``RandomState`` for
+    the others.  The streams differ from those of ``numpy.random``.
+
+    Examples
+    --------
+    >>> state = CounterRandomState(42)
+    >>> x = state.normal(10, 0.1, size=(4, 4), chunks=2)
+    >>> y = CounterRandomState(42).normal(10, 0.1, size=(4, 4), chunks=3)
+    >>> bool((x.compute() == y.compute()).all())
+    True
+    """
+    def __init__(self, seed=None):
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        if seed is None:
+            seed = int(np.random.randint(0, 2**31)) << 32 | int(
+                np.random.randint(0, 2**31))
+        self._seed = int(seed) & 0xFFFFFFFFFFFFFFFF
+        self._stream = 0
+
+    def _standard(self, kind, size, chunks, *params):
+        """ Array of standard variates, broadcast with any parameters """
+        if size is None:
+            size = broadcast_shapes(*[np.shape(p) for p in params]) or ()
+        elif not isinstance(size, (tuple, list)):
+            size = (size,)
+        size = tuple(size)
+        chunks = normalize_chunks(chunks, size, dtype='f8')
+        stream = self._stream
+        self._stream += 1
+
+        token = tokenize(self._seed, stream, kind, size, chunks)
+        name = 'da.random.counter-%s-%s' % (kind, token)
+        offsets = [np.cumsum((0,) + bds[:-1]) for bds in chunks]
+        dsk = dict(((name,) + idx,
+                    (_counter_block, kind, self._seed, stream, size,
+                     tuple(int(o[i]) for o, i in zip(offsets, idx)),
+                     tuple(bds[i] for bds, i in zip(chunks, idx))))
+                   for idx in product(*[range(len(bds)) for bds in chunks]))
+        return Array(dsk, name, chunks, dtype='f8')
+
+    @doc_wraps(np.random.RandomState.random_sample)
+    def random_sample(self, size=None, chunks=None):
+        return self._standard('uniform', size, chunks)
+
+    random = random_sample
+
+    @doc_wraps(np.random.RandomState.uniform)
+    def uniform(self, low=0.0, high=1.0, size=None, chunks=None):
+        u = self._standard('uniform', size, chunks, low, high)
+        return low + (high - low) * u
+
+    @doc_wraps(np.random.RandomState.randint)
+    def randint(self, low, high=None, size=None, chunks=None):
+        if high is None:
+            low, high = 0, low
+        u = self._standard('uniform', size, chunks, low, high)
+        return (u * (high - low)).astype('i8') + low
+
+    @doc_wraps(np.random.RandomState.standard_normal)
+    def standard_normal(self, size=None, chunks=None):
+        return self._standard('normal', size, chunks)
+
+    @doc_wraps(np.random.RandomState.normal)
+    def normal(self, loc=0.0, scale=1.0, size=None, chunks=None):
+        return loc + scale * self._standard('normal', size, chunks, loc,
+                                            scale)
+
+    @doc_wraps(np.random.RandomState.lognormal)
+    def lognormal(self, mean=0.0, sigma=1.0, size=None, chunks=None):
+        return exp(self.normal(mean, sigma, size=size, chunks=chunks))
+
+    @doc_wraps(np.random.RandomState.standard_exponential)
+    def standard_exponential(self, size=None, chunks=None):
+        return self._standard('exponential', size, chunks)
+
+    @doc_wraps(np.random.RandomState.exponential)
+    def exponential(self, scale=1.0, size=None, chunks=None):
+        return scale * self._standard('exponential', size, chunks, scale)
+
+    @doc_wraps(np.random.RandomState.standard_cauchy)
+    def standard_cauchy(self, size=None, chunks=None):
+        u = self._standard('uniform', size, chunks)
+        return tan(np.pi * (u - 0.5))
+
+    @doc_wraps(np.random.RandomState.logistic)
+    def logistic(self, loc=0.0, scale=1.0, size=None, chunks=None):
+        u = self._standard('uniform', size, chunks, loc, scale)
+        return loc + scale * log(u / (1 - u))
+
+    @doc_wraps(np.random.RandomState.gumbel)
+    def gumbel(self, loc=0.0, scale=1.0, size=None, chunks=None):
+        e = self._standard('exponential', size, chunks, loc, scale)
+        return loc - scale * log(e)
+
+    @doc_wraps(np.random.RandomState.laplace)
+    def laplace(self, loc=0.0, scale=1.0, size=None, chunks=None):
+        v = self._standard('uniform', size, chunks, loc, scale) - 0.5
+        return loc - scale * sign(v) * log1p(-2 * abs(v))
+
+    @doc_wraps(np.random.RandomState.rayleigh)
+    def rayleigh(self, scale=1.0, size=None, chunks=None):
+        e = self._standard('exponential', size, chunks, scale)
+        return scale * sqrt(2 * e)
+
+    @doc_wraps(np.random.RandomState.weibull)
+    def weibull(self, a, size=None, chunks=None):
+        return self._standard('exponential', size, chunks, a) ** (1.0 / a)
+
+    @doc_wraps(np.random.RandomState.pareto)
+    def pareto(self, a, size=None, chunks=None):
+        return expm1(self._standard('exponential', size, chunks, a) / a)
+
+    @doc_wraps(np.random.RandomState.power)
+    def power(self, a, size=None, chunks=None):
+        e = self._standard('exponential', size, chunks, a)
+        return (-expm1(-e)) ** (1.0 / a)
+
+
 _state = RandomState()
 
 
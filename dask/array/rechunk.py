@@ -4,16 +4,21 @@ The rechunk module defines:
         converting chunks to new dimensions
     rechunk: a function to convert the blocks
         of an existing dask array to new chunks or blockshape
+    plan_rechunk: a function to choose intermediate chunks
+        for rechunks that would otherwise produce many tiny tasks
 """
 from __future__ import absolute_import, division, print_function
 
+from functools import reduce
+import heapq
 from itertools import product, chain
-from operator import getitem, add
+from operator import getitem, add, mul
 
 import numpy as np
 from toolz import merge, accumulate
 
 from ..base import tokenize
+from ..context import _globals
 from .core import concatenate3, Array, normalize_chunks
 
 
@@ -160,13 +165,16 @@ def blockshape_dict_to_tuple(old_chunks, d):
     shape = tuple(map(sum, old_chunks))
     new_chunks = list(old_chunks)
     for k, v in d.items():
+        if v == 'auto':
+            new_chunks[k] = v
+            continue
         div = shape[k] // v
         mod = shape[k] % v
         new_chunks[k] = (v,) * div + ((mod,) if mod else ())
     return tuple(new_chunks)
 
 
-def rechunk(x, chunks):
+def rechunk(x, chunks, threshold=None, block_size_limit=None):
     """
     Convert blocks in dask array x for new chunks.
 
@@ -184,11 +192,29 @@ def rechunk(x, chunks):
 
     >>> y = rechunk(x, chunks={1: 2})  # rechunk axis 1 with blockshape 2
 
+    ``'auto'`` picks block sizes, for all axes or those given as ``'auto'``,
+    that are multiples of the current ones and under the ``auto_chunk_size``
+    option in bytes
+
+    >>> y = rechunk(x, chunks={0: 'auto'})
+
+    Rechunks that cut every old block into many pieces, like going from
+    row blocks to column blocks, go through intermediate chunks chosen by
+    ``plan_rechunk``.
+
     Parameters
     ----------
 
     x:   dask array
     chunks:  the new block dimensions to create
+    threshold: int
+        The graph growth factor under which we don't bother
+        introducing an intermediate step.  Defaults to the
+        ``rechunk_threshold`` option or 4
+    block_size_limit: int
+        The maximum block size (in bytes) we want to produce during an
+        intermediate step.  Defaults to the ``rechunk_block_size_limit``
+        option or 1e8
     """
     if isinstance(chunks, dict):
         if not chunks or isinstance(next(iter(chunks.values())), int):
@@ -198,13 +224,226 @@ def rechunk(x, chunks):
     if isinstance(chunks, (tuple, list)):
         chunks = tuple(lc if lc is not None else rc
                        for lc, rc in zip(chunks, x.chunks))
-    chunks = normalize_chunks(chunks, x.shape)
+    chunks = normalize_chunks(chunks, x.shape, dtype=x.dtype,
+                              previous_chunks=x.chunks)
     if chunks == x.chunks:
         return x
     ndim = x.ndim
     if not len(chunks) == ndim or tuple(map(sum, chunks)) != x.shape:
         raise ValueError("Provided chunks are not consistent with shape")
 
+    steps = plan_rechunk(x.chunks, chunks, x.dtype.itemsize,
+                         threshold, block_size_limit)
+    for c in steps:
+        x = _compute_rechunk(x, c)
+    return x
+
+
+def _number_of_blocks(chunks):
+    return reduce(mul, map(len, chunks), 1)
+
+
+def _largest_block_size(chunks):
+    return reduce(mul, map(max, chunks), 1)
+
+
+def estimate_graph_size(old_chunks, new_chunks):
+    """ Estimate the number of tasks of a single stage rechunk
+
+    Along every axis there are at most ``len(old) + len(new) - 1`` pieces,
+    so this bounds the number of split tasks without intersecting chunks.
+
+    >>> estimate_graph_size(((5, 5), (10,)), ((10,), (5, 5)))
+    4
+    """
+    return reduce(mul, [len(oc) + len(nc) - 1
+                        for oc, nc in zip(old_chunks, new_chunks)], 1)
+
+
+def divide_to_width(desired_chunks, max_width):
+    """ Minimally divide chunks so that none is wider than ``max_width``
+
+    >>> divide_to_width((10, 4), 4)
+    (3, 3, 4, 4)
+    """
+    chunks = []
+    for c in desired_chunks:
+        n = int(np.ceil(c / max_width))
+        for i in range(n):
+            w = c // (n - i)
+            chunks.append(w)
+            c -= w
+    return tuple(chunks)
+
+
+def merge_to_number(desired_chunks, max_number):
+    """ Minimally merge adjacent chunks to have at most ``max_number``
+
+    The narrowest pairs of neighbours are merged first.
+
+    >>> merge_to_number((2, 2, 2, 2, 2, 2), 3)
+    (4, 4, 4)
+    >>> merge_to_number((1, 5, 1, 1, 5), 3)
+    (6, 2, 5)
+    """
+    if len(desired_chunks) <= max_number:
+        return tuple(desired_chunks)
+    chunks = list(desired_chunks)
+    heap = [(chunks[i] + chunks[i + 1], i, i + 1)
+            for i in range(len(chunks) - 1)]
+    heapq.heapify(heap)
+    nmerges = len(chunks) - max_number
+    while nmerges > 0:
+        width, i, j = heapq.heappop(heap)
+        if chunks[i] == 0:
+            # i was merged into a later chunk, this pair is gone
+            continue
+        if chunks[j] == 0:
+            # j was merged away, pair i with its next remaining neighbour
+            while chunks[j] == 0:
+                j += 1
+            heapq.heappush(heap, (chunks[i] + chunks[j], i, j))
+            continue
+        if chunks[i] + chunks[j] != width:
+            heapq.heappush(heap, (chunks[i] + chunks[j], i, j))
+            continue
+        chunks[i] = 0
+        chunks[j] = width
+        nmerges -= 1
+    return tuple(c for c in chunks if c)
+
+
+def find_merge_rechunk(old_chunks, new_chunks, block_size_limit):
+    """ Intermediate chunks merging old blocks towards ``new_chunks``
+
+    Axes along which the target has fewer blocks are merged, those that
+    reduce the graph size the most per growth of the largest block first.
+    When the block size limit forbids the full target chunks along an axis,
+    they are divided to fit.
+
+    Returns the chunks and whether the block size limit was hit.
+    """
+    ndim = len(old_chunks)
+    old_widths = [max(c) for c in old_chunks]
+    new_widths = [max(c) for c in new_chunks]
+
+    def value(dim):
+        graph_effect = len(new_chunks[dim]) / len(old_chunks[dim])
+        block_effect = new_widths[dim] / old_widths[dim]
+        if block_effect == 1:
+            block_effect = 1 + 1e-9
+        return np.log(graph_effect) / np.log(block_effect)
+
+    candidates = [dim for dim in range(ndim)
+                  if len(new_chunks[dim]) <= len(old_chunks[dim])]
+
+    chunks = list(old_chunks)
+    block_size = _largest_block_size(chunks)
+    limit_hit = False
+    for dim in sorted(candidates, key=value):
+        width = max(chunks[dim])
+        new_block_size = block_size // width * new_widths[dim]
+        if new_block_size <= block_size_limit:
+            chunks[dim] = new_chunks[dim]
+            block_size = new_block_size
+        else:
+            max_width = int(block_size_limit // (block_size // width))
+            if max_width >= 1:
+                c = divide_to_width(new_chunks[dim], max_width)
+                if len(c) <= len(old_chunks[dim]):
+                    chunks[dim] = c
+                    block_size = block_size // width * max(c)
+            limit_hit = True
+    return tuple(chunks), limit_hit
+
+
+def find_split_rechunk(old_chunks, new_chunks, graph_size_limit):
+    """ Intermediate chunks splitting old blocks towards ``new_chunks``
+
+    Axes along which the target has more blocks are split into merged
+    target chunks, as finely as the graph size limit allows.
+    """
+    chunks = list(old_chunks)
+    for dim in range(len(old_chunks)):
+        graph_size = estimate_graph_size(chunks, new_chunks)
+        if graph_size > graph_size_limit:
+            break
+        if len(old_chunks[dim]) > len(new_chunks[dim]):
+            continue
+        max_number = int(len(old_chunks[dim]) * graph_size_limit / graph_size)
+        c = merge_to_number(new_chunks[dim], max_number)
+        if len(c) >= len(old_chunks[dim]) and max(c) <= max(old_chunks[dim]):
+            chunks[dim] = c
+    return tuple(chunks)
+
+
+def plan_rechunk(old_chunks, new_chunks, itemsize, threshold=None,
+                 block_size_limit=None):
+    """ Plan a rechunk from ``old_chunks`` to ``new_chunks`` in stages
+
+    A single stage rechunk creates a task for every intersection of an old
+    and a new block.  From row blocks to column blocks that is the product
+    of the number of old and new blocks, most of them tiny.  When the
+    estimated number of tasks is more than ``threshold`` times the number of
+    old and new blocks, intermediate chunks first merge old blocks towards
+    the target along the axes where it has fewer blocks, keeping every
+    block below ``block_size_limit`` bytes.  If that limit gets in the way
+    the next stage first splits blocks along the other axes.
+
+    Returns the list of chunks to rechunk to successively, ending with
+    ``new_chunks``.
+
+    >>> old = ((10,) * 10, (100,))
+    >>> new = ((100,), (10,) * 10)
+    >>> plan_rechunk(old, new, 8, block_size_limit=1e8)[-1] == new
+    True
+    >>> len(plan_rechunk(old, new, 8, block_size_limit=1e8))
+    2
+    """
+    if threshold is None:
+        threshold = _globals.get('rechunk_threshold', 4)
+    if block_size_limit is None:
+        block_size_limit = _globals.get('rechunk_block_size_limit', 1e8)
+
+    ndim = len(new_chunks)
+    if ndim <= 1 or not all(new_chunks) or not all(map(sum, new_chunks)):
+        return [new_chunks]
+
+    # The limit in number of elements, never below the blocks we have anyway
+    block_size_limit = max(block_size_limit / max(itemsize, 1),
+                           _largest_block_size(old_chunks),
+                           _largest_block_size(new_chunks))
+    graph_size_threshold = threshold * (_number_of_blocks(old_chunks) +
+                                        _number_of_blocks(new_chunks))
+
+    steps = []
+    current = old_chunks
+    first_pass = True
+    while estimate_graph_size(current, new_chunks) >= graph_size_threshold:
+        if first_pass:
+            chunks = current
+        else:
+            # The block size limit stopped the last merge; split blocks
+            # along other axes to make room for merging further
+            graph_size_limit = (estimate_graph_size(current, new_chunks) *
+                                threshold)
+            chunks = find_split_rechunk(current, new_chunks, graph_size_limit)
+        chunks, limit_hit = find_merge_rechunk(chunks, new_chunks,
+                                               block_size_limit)
+        if chunks == new_chunks or (chunks == current and not first_pass):
+            break
+        if chunks != current:
+            steps.append(chunks)
+            current = chunks
+        if not limit_hit:
+            break
+        first_pass = False
+    return steps + [new_chunks]
+
+
+def _compute_rechunk(x, chunks):
+    """ Rechunk ``x`` to ``chunks`` in a single stage """
+    ndim = x.ndim
     crossed = intersect_chunks(x.chunks, chunks)
     x2 = dict()
     intermediates = dict()
@@ -214,6 +453,12 @@ def rechunk(x, chunks):
     for flat_idx, cross1 in enumerate(crossed):
         new_idx = new_index[flat_idx]
         key = (temp_name,) + new_idx
+        if len(cross1) == 1:
+            # The new block is part of a single old block
+            ind_slics = cross1[0]
+            x2[key] = (getitem, (x.name,) + tuple(s[0] for s in ind_slics),
+                       tuple(s[1] for s in ind_slics))
+            continue
         cr2 = iter(cross1)
         old_blocks = [[ind for ind, _ in cr] for cr in cross1]
         subdims = [len(set([ss[i] for ss in old_blocks])) for i in range(ndim)]
@@ -14,14 +14,21 @@ from .numpy_compat import divide
 from ..compatibility import getargspec, builtins
 from ..base import tokenize
 from ..context import _globals
-from ..utils import ignoring, funcname
+from ..utils import ignoring, funcname, insert, prefix_scan, deepmap
 
 
 def reduction(x, chunk, aggregate, axis=None, keepdims=None, dtype=None,
-              split_every=None, combine=None, name=None):
+              split_every=None, combine=None, name=None, fuse_chunk=None):
     """ General version of reductions
 
     >>> reduction(my_array, np.sum, np.sum, axis=0, keepdims=False)  # doctest: +SKIP
+
+    With ``fuse_chunk=True``, or ``dask.set_options(fuse_reductions=True)``,
+    ``chunk`` is applied within the tasks combining the first groups of
+    ``split_every`` blocks instead of in a task per block.  This halves the
+    number of tasks of reductions over many small blocks and, as loaders
+    like ``getarray`` are inlined, reads and reduces every group of blocks
+    in one task.
     """
     if axis is None:
         axis = tuple(range(x.ndim))
@@ -34,6 +41,12 @@ def reduction(x, chunk, aggregate, axis=None, keepdims=None, dtype=None,
     if dtype is not None and 'dtype' in getargspec(aggregate).args:
         aggregate = partial(aggregate, dtype=dtype)
 
+    if fuse_chunk is None:
+        fuse_chunk = _globals.get('fuse_reductions', False)
+    if fuse_chunk:
+        return _tree_reduce(x, aggregate, axis, keepdims, dtype, split_every,
+                            combine, name=name, chunk=chunk)
+
     # Map chunk across all blocks
     inds = tuple(range(x.ndim))
     tmp = atop(chunk, inds, x, inds, axis=axis, keepdims=True)
@@ -45,10 +58,12 @@ def reduction(x, chunk, aggregate, axis=None, keepdims=None, dtype=None,
 
 
 def _tree_reduce(x, aggregate, axis, keepdims, dtype, split_every=None,
-                 combine=None, name=None):
+                 combine=None, name=None, chunk=None):
     """Perform the tree reduction step of a reduction.
 
     Lower level, users should use ``reduction`` or ``arg_reduction`` directly.
+    If given, ``chunk`` is applied to every block of ``x`` within the first
+    level of the tree.
     """
     # Normalize split_every
     split_every = split_every or _globals.get('split_every', 4)
@@ -65,13 +80,18 @@ def _tree_reduce(x, aggregate, axis, keepdims, dtype, split_every=None,
     for i, n in enumerate(x.numblocks):
         if i in split_every and split_every[i] != 1:
             depth = int(builtins.max(depth, ceil(log(n, split_every[i]))))
+    if chunk is not None:
+        chunk = partial(deepmap, partial(chunk, axis=axis, keepdims=True))
     func = compose(partial(combine or aggregate, axis=axis, keepdims=True),
                    partial(_concatenate2, axes=axis))
     for i in range(depth - 1):
-        x = partial_reduce(func, x, split_every, True, None,
+        x = partial_reduce(compose(func, chunk) if i == 0 and chunk else func,
+                           x, split_every, True, None,
                            name=(name or funcname(combine or aggregate)) + '-partial')
     func = compose(partial(aggregate, axis=axis, keepdims=keepdims),
                    partial(_concatenate2, axes=axis))
+    if depth == 1 and chunk is not None:
+        func = compose(func, chunk)
     return partial_reduce(func, x, split_every, keepdims=keepdims,
                           dtype=dtype,
                           name=(name or funcname(aggregate)) + '-aggregate')
@@ -271,70 +291,80 @@ with ignoring(AttributeError):
 
 
 def moment_chunk(A, order=2, sum=chunk.sum, numel=numel, dtype='f8', **kwargs):
-    total = sum(A, dtype=dtype, **kwargs)
-    n = numel(A, **kwargs)
-    u = total / n
+    """ Count, mean and central moment sums of a block
+
+    Sums are taken around the mean of the block, in at least double
+    precision, so that they stay accurate for data far from zero.
+    """
+    dtype = np.promote_types(dtype, 'f8')
+    n = numel(A, dtype='i8', **kwargs)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u = divide(sum(A, dtype=dtype, **kwargs), n, dtype=dtype)
+    u = np.where(n > 0, u, 0)
     M = np.empty(shape=n.shape + (order - 1,), dtype=dtype)
     for i in range(2, order + 1):
         M[..., i - 2] = sum((A - u)**i, dtype=dtype, **kwargs)
-    result = np.empty(shape=n.shape, dtype=[('total', total.dtype),
-                                            ('n', n.dtype),
+    result = np.empty(shape=n.shape, dtype=[('n', n.dtype),
+                                            ('mean', u.dtype),
                                             ('M', M.dtype, (order - 1,))])
-    result['total'] = total
     result['n'] = n
+    result['mean'] = u
     result['M'] = M
     return result
 
 
-def _moment_helper(Ms, ns, inner_term, order, sum, kwargs):
-    M = Ms[..., order - 2].sum(**kwargs) + sum(ns * inner_term ** order, **kwargs)
+def _moment_helper(Ms, ns, delta, order, sum, kwargs):
+    """ Central moment sum of order ``order`` of merged parts
+
+    Chan's update generalized to many parts and higher orders: every part
+    contributes its own sum and lower order sums shifted by ``delta``, the
+    difference of its mean and the merged mean.
+    """
+    M = Ms[..., order - 2].sum(**kwargs) + sum(ns * delta ** order, **kwargs)
     for k in range(1, order - 1):
         coeff = factorial(order) / (factorial(k) * factorial(order - k))
-        M += coeff * sum(Ms[..., order - k - 2] * inner_term**k, **kwargs)
+        M += coeff * sum(Ms[..., order - k - 2] * delta**k, **kwargs)
     return M
 
 
+def _moment_merge(data, sum, kwargs):
+    """ Merged count, mean and differences of part means to it """
+    ns = data['n']
+    means = data['mean']
+    n = ns.sum(axis=kwargs.get('axis'), keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mu = divide(sum(ns * means, **kwargs), n, dtype=means.dtype)
+    mu = np.where(n > 0, mu, 0)
+    delta = np.where(ns > 0, means - mu, 0)
+    return n, mu, delta
+
+
 def moment_combine(data, order=2, ddof=0, dtype='f8', sum=np.sum, **kwargs):
-    kwargs['dtype'] = dtype
+    kwargs['dtype'] = data['mean'].dtype
     kwargs['keepdims'] = True
 
-    totals = data['total']
-    ns = data['n']
+    n, mu, delta = _moment_merge(data, sum, kwargs)
     Ms = data['M']
-    total = totals.sum(**kwargs)
-    n = sum(ns, **kwargs)
-    mu = divide(total, n, dtype=dtype)
-    inner_term = divide(totals, ns, dtype=dtype) - mu
-    M = np.empty(shape=n.shape + (order - 1,), dtype=dtype)
-
+    M = np.empty(shape=n.shape + (order - 1,), dtype=Ms.dtype)
     for o in range(2, order + 1):
-        M[..., o - 2] = _moment_helper(Ms, ns, inner_term, o, sum, kwargs)
+        M[..., o - 2] = _moment_helper(Ms, data['n'], delta, o, sum, kwargs)
 
-    result = np.zeros(shape=n.shape, dtype=[('total', total.dtype),
-                                            ('n', n.dtype),
-                                            ('M', Ms.dtype, (order - 1,))])
-    result['total'] = total
+    result = np.empty(shape=n.shape, dtype=data.dtype)
     result['n'] = n
+    result['mean'] = mu
     result['M'] = M
     return result
 
 
 def moment_agg(data, order=2, ddof=0, dtype='f8', sum=np.sum, **kwargs):
-    totals = data['total']
-    ns = data['n']
-    Ms = data['M']
-
-    kwargs['dtype'] = dtype
+    kwargs['dtype'] = data['mean'].dtype
     # To properly handle ndarrays, the original dimensions need to be kept for
     # part of the calculation.
     keepdim_kw = kwargs.copy()
     keepdim_kw['keepdims'] = True
 
-    n = sum(ns, **keepdim_kw)
-    mu = divide(totals.sum(**keepdim_kw), n, dtype=dtype)
-    inner_term = divide(totals, ns, dtype=dtype) - mu
-
-    M = _moment_helper(Ms, ns, inner_term, order, sum, kwargs)
+    n, mu, delta = _moment_merge(data, sum, keepdim_kw)
+    M = _moment_helper(data['M'], data['n'], delta, order, sum, kwargs)
     return divide(M, sum(n, **kwargs) - ddof, dtype=dtype)
 
 
@@ -613,24 +643,29 @@ def cumreduction(func, binop, ident, x, axis, dtype=None):
     full = slice(None, None, None)
     slc = (full,) * axis + (slice(-1, None),) + (full,) * (x.ndim - axis - 1)
 
-    indices = list(product(*[range(nb) if i != axis else [0]
-                             for i, nb in enumerate(x.numblocks)]))
+    # The last slices of the blocks along ``axis`` are combined with a
+    # log-depth prefix scan, then added onto the following blocks.  Blocks
+    # that are empty along ``axis`` contribute the identity.
     dsk = dict()
-    for ind in indices:
-        shape = tuple(x.chunks[i][ii] if i != axis else 1
-                      for i, ii in enumerate(ind))
-        dsk[(name, 'extra') + ind] = (np.full, shape, ident, m.dtype)
+    for ind in product(*[range(nb) if i != axis else [0]
+                         for i, nb in enumerate(x.numblocks)]):
         dsk[(name,) + ind] = (m.name,) + ind
-
-    for i in range(1, n):
-        last_indices = indices
-        indices = list(product(*[range(nb) if ii != axis else [i]
-                                 for ii, nb in enumerate(x.numblocks)]))
-        for old, ind in zip(last_indices, indices):
-            this_slice = (name, 'extra') + ind
-            dsk[this_slice] = (binop, (name, 'extra') + old,
-                                      (operator.getitem, (m.name,) + old, slc))
-            dsk[(name,) + ind] = (binop, this_slice, (m.name,) + ind)
+        lasts = []
+        for i in range(n - 1):
+            ind2 = insert(ind, axis, i)
+            last = (name, 'last') + ind2
+            if x.chunks[axis][i]:
+                dsk[last] = (operator.getitem, (m.name,) + ind2, slc)
+            else:
+                shape = tuple(1 if d == axis else c[j] for d, (c, j)
+                              in enumerate(zip(x.chunks, ind2)))
+                dsk[last] = (np.full, shape, ident, m.dtype)
+            lasts.append(last)
+        scan_name = '%s-carry-%s' % (name, '-'.join(map(str, ind)))
+        carries = prefix_scan(dsk, binop, scan_name, lasts)
+        for i in range(1, n):
+            ind2 = insert(ind, axis, i)
+            dsk[(name,) + ind2] = (binop, carries[i - 1], (m.name,) + ind2)
 
     return Array(merge(dsk, m.dask), name, x.chunks, m.dtype)
 
@@ -18,7 +18,7 @@ import dask.array as da
 from dask.base import tokenize
 from dask.delayed import delayed
 from dask.async import get_sync
-from dask.utils import ignoring, tmpfile, tmpdir
+from dask.utils import ignoring, tmpfile, tmpdir, dependency_depth
 from dask.utils_test import inc
 
 from dask.array import chunk
@@ -31,7 +31,8 @@ from dask.array.core import (getem, getarray, getarray_nofancy, top, dotmany,
                              blockdims_from_blockshape, store, optimize,
                              from_func, normalize_chunks, broadcast_chunks,
                              atop, from_delayed, concatenate_axes,
-                             common_blockdim)
+                             common_blockdim, _isin_bucket,
+                             _bincount_chunk, _bincount_combine)
 from dask.array.utils import assert_eq
 
 # temporary until numpy functions migrated
@@ -975,13 +976,64 @@ def test_store_locks():
             assert False
 
 
-@pytest.mark.xfail(reason="can't lock with multiprocessing")
+class ChunkedStore(ThreadSafeStore):
+    def __init__(self, chunks):
+        ThreadSafeStore.__init__(self)
+        self.chunks = chunks
+        self.regions = []
+
+    def __setitem__(self, key, value):
+        self.regions.append(key)
+        ThreadSafeStore.__setitem__(self, key, value)
+
+
+def test_store_region_locks():
+    _Lock = type(Lock())
+    d = da.ones((8, 8), chunks=(2, 4))
+
+    def locks(v):
+        return [vv for v in v.dask.values() if isinstance(v, tuple)
+                for vv in v if isinstance(vv, _Lock)]
+
+    # NumPy targets and aligned chunked targets need no locks
+    assert not locks(store(d, np.zeros((8, 8)), compute=False))
+    assert not locks(store(d, ChunkedStore((2, 2)), compute=False))
+
+    # Blocks sharing a chunk of the target share a lock
+    v = store(d, ChunkedStore((4, 4)), compute=False)
+    assert len(locks(v)) == 8
+    assert len(set(locks(v))) == 4
+
+    at = ChunkedStore((2, 2))
+    for i in range(10):
+        d.store(at, get=dask.threaded.get, num_workers=10)
+        if at.max_concurrent_uses > 1:
+            break
+        if i == 9:
+            assert False
+
+
+def test_store_coalesce():
+    x = np.arange(64).reshape((8, 8))
+    d = da.from_array(x, chunks=(2, 2))
+    at = ChunkedStore((2, 2))
+    d.store(at, coalesce=16 * x.itemsize)
+    assert sorted(at.regions) == [(slice(i, i + 2), slice(0, 8))
+                                  for i in range(0, 8, 2)]
+
+    out = np.zeros((8, 8), dtype=x.dtype)
+    d.store(out, coalesce=32 * x.itemsize)
+    assert (out == x).all()
+
+
 def test_store_multiprocessing_lock():
     d = da.ones((10, 10), chunks=(2, 2))
     a = d + 1
 
+    # Writes would land in copies of ``at`` in the worker processes
     at = np.zeros(shape=(10, 10))
-    a.store(at, get=dask.multiprocessing.get, num_workers=10)
+    with pytest.raises(ValueError):
+        a.store(at, get=dask.multiprocessing.get, num_workers=10)
 
 
 def test_to_hdf5():
@@ -1043,6 +1095,56 @@ def test_unique():
     x = np.array([1, 2, 4, 4, 5, 2])
     d = da.from_array(x, chunks=(3,))
     assert_eq(da.unique(d), np.unique(x))
+    assert isinstance(da.unique(d), Array)
+
+
+@pytest.mark.parametrize('split_every', [None, 2])
+def test_unique_counts_inverse(split_every):
+    x = np.random.RandomState(0).randint(0, 50, size=(20, 30))
+    d = da.from_array(x, chunks=(6, 7))
+    u, inv, c = da.unique(d, return_inverse=True, return_counts=True,
+                          split_every=split_every)
+    eu, einv, ec = np.unique(x, return_inverse=True, return_counts=True)
+    assert_eq(u, eu)
+    assert_eq(inv, einv.ravel())
+    assert_eq(c, ec)
+
+    e = da.from_array(np.array([], dtype='i8'), chunks=2)
+    u, c = da.unique(e, return_counts=True)
+    assert_eq(u, np.array([], dtype='i8'))
+    assert_eq(c, np.array([], dtype=np.intp))
+
+
+def test_value_counts():
+    x = np.array([1, 2, 4, 4, 4, 2, 5, 7, 7])
+    d = da.from_array(x, chunks=2)
+    values, counts = da.value_counts(d)
+    assert_eq(values, np.array([4, 2, 7, 1, 5]))
+    assert_eq(counts, np.array([3, 2, 2, 1, 1]))
+
+
+@pytest.mark.parametrize('split_out', [1, 3])
+def test_isin(split_out):
+    x = np.random.RandomState(0).randint(0, 20, size=(10, 12))
+    d = da.from_array(x, chunks=(4, 5))
+    test = np.array([3, 7, 11.0, -0.0])
+    expected = np.in1d(x, test).reshape(x.shape)
+
+    assert_eq(da.isin(d, test), expected)
+    assert_eq(da.isin(d, test, invert=True), ~expected)
+
+    t = da.from_array(test, chunks=3)
+    result = da.isin(d, t, split_out=split_out)
+    assert_eq(result, expected)
+    assert_eq(da.isin(d, t, invert=True, split_out=split_out), ~expected)
+    tasks = [v for v in result.dask.values()
+             if isinstance(v, tuple) and v[0] is _isin_bucket]
+    assert len(tasks) == (d.npartitions * split_out if split_out > 1 else 0)
+
+    s = da.from_array(np.array(['a', 'b', 'c', 'a']), chunks=3)
+    t = da.from_array(np.array(['a', 'z']), chunks=1)
+    assert_eq(da.isin(s, t, split_out=split_out),
+              np.array([True, False, False, True]))
 
 
 def test_dtype_complex():
@@ -1427,6 +1529,32 @@ def test_bincount_with_weights():
     assert same_keys(da.bincount(d, weights=dweights, minlength=6), e)
 
 
+@pytest.mark.parametrize('weighted', [False, True])
+def test_bincount_sparse_tree(weighted):
+    rs = np.random.RandomState(0)
+    x = rs.randint(0, 100000, size=2000)
+    w = rs.random_sample(2000) if weighted else None
+    d = da.from_array(x, chunks=50)
+    dw = da.from_array(w, chunks=50) if weighted else None
+    e = da.bincount(d, weights=dw, minlength=100000, split_every=4)
+    assert_eq(e, np.bincount(x, weights=w, minlength=100000))
+
+    # No task sums more than split_every partial counts
+    assert all(len(v[1]) <= 4 for v in e.dask.values()
+               if isinstance(v, tuple) and v[0] is _bincount_combine)
+    # Blocks with few values relative to minlength give sparse counts
+    assert isinstance(_bincount_chunk(x[:50], None, 100000), tuple)
+
+    # Negative values are rejected like in numpy, not wrapped into the last bins
+    d = da.from_array(np.array([-1, 2, 3, 5]), chunks=2)
+    with pytest.raises(ValueError):
+        da.bincount(d, minlength=100).compute()
+
+    for x in [np.array([True, False, True]), np.array([1, 7, 1], dtype='u1')]:
+        d = da.from_array(x, chunks=1)
+        assert_eq(da.bincount(d, minlength=20), np.bincount(x, minlength=20))
+
+
 def test_bincount_raises_informative_error_on_missing_minlength_kwarg():
     x = np.array([2, 1, 5, 2, 1])
     d = da.from_array(x, chunks=2)
@@ -1482,6 +1610,38 @@ def test_histogram_alternative_bins_range():
     assert_eq(b1, b2)
 
 
+def test_histogramdd():
+    rs = np.random.RandomState(0)
+    x = rs.randn(1000, 3)
+    w = rs.random_sample(1000)
+    d = da.from_array(x, chunks=(70, 2))
+    dw = da.from_array(w, chunks=100)
+    edges = [np.linspace(-2, 2, 5), np.array([-3, 0, 0.5, 3]),
+             np.linspace(-1, 1, 3)]
+
+    h, e = da.histogramdd(d, bins=edges)
+    assert_eq(h, np.histogramdd(x, bins=edges)[0])
+    assert same_keys(da.histogramdd(d, bins=edges)[0], h)
+
+    kwargs = dict(bins=[4, 3, 2], range=[(-2, 2), (-1, 1), (-3, 3)])
+    h, e = da.histogramdd(d, split_every=2, **kwargs)
+    eh, ee = np.histogramdd(x, **kwargs)
+    assert_eq(h, eh)
+    for a, b in zip(e, ee):
+        assert_eq(a, b)
+
+    kwargs = dict(bins=5, range=[(-2, 2)] * 3)
+    assert_eq(da.histogramdd(d, weights=dw, **kwargs)[0],
+              np.histogramdd(x, weights=w, **kwargs)[0])
+    assert_eq(da.histogramdd(d, density=True, **kwargs)[0],
+              np.histogramdd(x, density=True, **kwargs)[0])
+    assert_eq(da.histogramdd([d[:, 0], d[:, 1], d[:, 2]], **kwargs)[0],
+              np.histogramdd(x, **kwargs)[0])
+
+    with pytest.raises(ValueError):
+        da.histogramdd(d, bins=5)
+
+
 def test_histogram_return_type():
     v = da.random.random(100, chunks=10)
     bins = np.arange(0, 1.01, 0.01)
@@ -1607,6 +1767,52 @@ def test_take_dask_from_numpy():
 
 def test_normalize_chunks():
     assert normalize_chunks(3, (4, 6)) == ((3, 1), (3, 3))
+    assert normalize_chunks((-1, None), (4, 6)) == ((4,), (6,))
+
+
+def test_normalize_chunks_auto():
+    assert (normalize_chunks('auto', (1000, 1000), limit=8e4, dtype='f8') ==
+            ((100,) * 10, (100,) * 10))
+    assert (normalize_chunks(('auto', 10), (1000, 1000), limit=8e4,
+                             dtype='i8') == ((1000,), (10,) * 100))
+    # Even blocks rather than a small remainder
+    assert (normalize_chunks('auto', (1000,), limit=4800, dtype='f8') ==
+            ((500, 500),))
+    # Multiples of the source chunks
+    chunks = normalize_chunks('auto', (1000, 1000), limit=8e4, dtype='f8',
+                              previous_chunks=(30, 30))
+    assert chunks[0][:-1] == (90,) * 11
+    # Short axes are kept whole
+    assert (normalize_chunks('auto', (10, 10**6), limit=8e4, dtype='f8') ==
+            ((10,), (1000,) * 1000))
+
+    with pytest.raises(TypeError):
+        normalize_chunks('auto', (10, 10))
+
+    with dask.set_options(auto_chunk_size=8e4):
+        assert da.ones((1000, 1000), chunks='auto').chunks[0][0] == 100
+        x = da.random.random((1000, 1000), chunks='auto')
+        assert x.chunks[0][0] == x.chunks[1][0] == 100
+        assert da.arange(10**5, chunks='auto').chunks[0][0] == 10**4
+
+
+def test_from_array_auto_chunks():
+    class OnDisk(object):
+        """ Looks like an HDF5 dataset with chunks of (30, 30) """
+        shape = (1000, 1000)
+        dtype = np.dtype('f8')
+        chunks = (30, 30)
+
+        def __getitem__(self, key):
+            return np.ones(self.shape)[key]
+
+    with dask.set_options(auto_chunk_size=8e4):
+        d = da.from_array(OnDisk(), chunks='auto')
+        assert d.chunks[0][0] == d.chunks[1][0] == 90
+        assert_eq(d, np.ones((1000, 1000)))
+
+        d = da.from_array(np.ones((1000, 1000)), chunks=(-1, 'auto'))
+        assert d.chunks[0] == (1000,) and d.chunks[1][0] == 10
 
 
 def test_raise_on_no_chunks():
@@ -1810,6 +2016,42 @@ def test_to_npy_stack():
         assert_eq(d, e)
 
 
+@pytest.mark.parametrize('compression', [None, 'zlib'])
+def test_to_npy_blocks(compression):
+    x = np.arange(5 * 10 * 10).reshape((5, 10, 10))
+    d = da.from_array(x, chunks=(2, 4, 4))
+
+    with tmpdir() as dirname:
+        da.to_npy_blocks(dirname, d, compression=compression)
+        assert os.path.exists(os.path.join(dirname, 'info.json'))
+        assert len(os.listdir(dirname)) == 3 * 3 * 3 + 1
+
+        e = da.from_npy_blocks(dirname)
+        assert e.chunks == d.chunks
+        assert_eq(d, e)
+        if compression is None:
+            assert e.dask[(e.name, 1, 2, 0)][2] == 'r'
+            assert (np.load(os.path.join(dirname, '1.2.0.npy')) ==
+                    x[2:4, 8:10, 0:4]).all()
+
+
+def test_to_npy_blocks_delayed():
+    x = np.zeros(5, dtype=[('a', 'i4'), ('b', 'f8', (2,))])
+    x['a'] = np.arange(5)
+    d = da.from_array(x, chunks=2)
+    with tmpdir() as dirname:
+        out = da.to_npy_blocks(os.path.join(dirname, 'sub'), d, compute=False)
+        assert not os.path.exists(os.path.join(dirname, 'sub', '0.npy'))
+        out.compute()
+        e = da.from_npy_blocks(os.path.join(dirname, 'sub'))
+        assert e.dtype == x.dtype
+        assert_eq(e, x)
+
+        y = da.ones((), chunks=())
+        da.to_npy_blocks(dirname, y)
+        assert_eq(da.from_npy_blocks(dirname), np.ones(()))
+
+
 def test_view():
     x = np.arange(56).reshape((7, 8))
     d = da.from_array(x, chunks=(2, 3))
@@ -1998,6 +2240,15 @@ def test_cumulative():
     assert_eq(da.nancumprod(x, axis=0), nancumprod(a, axis=0))
     assert_eq(da.nancumprod(x, axis=1), nancumprod(a, axis=1))
 
+    x = da.arange(1000, chunks=10)
+    assert_eq(x.cumsum(axis=0), np.arange(1000).cumsum())
+    assert dependency_depth(x.cumsum(axis=0).dask) < 30
+
+    a = np.arange(1, 13).reshape((2, 6))
+    x = da.from_array(a, chunks=((2,), (2, 0, 0, 4)))
+    assert_eq(x.cumsum(axis=1), a.cumsum(axis=1))
+    assert_eq(x.cumprod(axis=1), a.cumprod(axis=1))
+
     a = np.random.random((20, 24, 13))
     x = da.from_array(a, chunks=(6, 5, 4))
     for axis in [0, 1, 2]:
@@ -9,6 +9,7 @@ from dask.array.ghost import (fractional_slice, getitem, trim_internal,
                               ghost_internal, nearest, constant, boundaries,
                               reflect, periodic, ghost)
 from dask.core import get
+from dask.threaded import get as threaded_get
 from dask.array.utils import assert_eq
 
 
@@ -204,6 +205,71 @@ def test_map_overlap():
     assert_eq(exp2, x + 12)
 
 
+@pytest.mark.parametrize('boundary', ['reflect', 'periodic', 'nearest',
+                                      'none', 0,
+                                      {0: 5, 1: 'reflect', 2: 'none'}])
+@pytest.mark.parametrize('trim', [True, False])
+def test_map_overlap_reuse_buffer(boundary, trim):
+    x = np.random.RandomState(0).random_sample((10, 11, 7))
+    d = da.from_array(x, chunks=(4, 3, 7))
+
+    def func(a):
+        return a - np.roll(a, 1, axis=0) + a.sum()
+
+    for depth in [1, {0: 2, 1: 1, 2: 2}]:
+        for f in [func, lambda a: a]:
+            a = d.map_overlap(f, depth, boundary, trim, dtype=d.dtype)
+            b = d.map_overlap(f, depth, boundary, trim, reuse_buffer=True,
+                              dtype=d.dtype)
+            assert a.chunks == b.chunks
+            assert_eq(a, b)
+            assert len(b.dask) < len(a.dask)
+
+
+def test_map_overlap_reuse_buffer_block_id():
+    d = da.ones((8, 8), chunks=4)
+
+    def func(a, block_id=None):
+        return np.full(a.shape, block_id[0] * 2 + block_id[1])
+
+    y = d.map_overlap(func, 1, reuse_buffer=True, dtype='i8')
+    assert_eq(y, np.repeat(np.repeat([[0, 1], [2, 3]], 4, axis=0), 4,
+                           axis=1))
+
+    with pytest.raises(ValueError):
+        d.map_overlap(func, 5, reuse_buffer=True)
+
+
+@pytest.mark.parametrize('trim', [True, False])
+def test_map_overlap_reuse_buffer_chunks(trim):
+    x = np.arange(60).reshape((6, 10))
+    d = da.from_array(x, chunks=(3, 5))
+
+    def func(a):
+        return a[::2]
+
+    chunks = ((2, 2), 6)
+    a = d.map_overlap(func, 1, boundary='none', trim=trim, chunks=chunks,
+                      dtype=d.dtype)
+    b = d.map_overlap(func, 1, boundary='none', trim=trim, chunks=chunks,
+                      dtype=d.dtype, reuse_buffer=True)
+    assert a.chunks == b.chunks
+    assert_eq(a, b)
+
+    with pytest.raises(NotImplementedError):
+        d.map_overlap(lambda a: a.sum(axis=0), 1, drop_axis=0,
+                      reuse_buffer=True)
+
+
+def test_map_overlap_reuse_buffer_releases_buffers():
+    from dask.array.ghost import _buffers
+    d = da.ones((8, 8), chunks=4)
+    for g in [get, threaded_get]:
+        y = d.map_overlap(lambda a: a + 1, 1, reuse_buffer=True, dtype='f8')
+        y.compute(get=g)
+        assert y.name not in _buffers
+
+
 def test_nearest_ghost():
     a = np.arange(144).reshape(12, 12).astype(float)
 
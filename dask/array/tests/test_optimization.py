@@ -119,7 +119,7 @@ def test_hard_fuse_slice_cases():
 
 def test_dont_fuse_different_slices():
     x = da.random.random(size=(10, 10), chunks=(10, 1))
-    y = x.rechunk((1, 10))
+    y = x.rechunk((1, 10), threshold=1e12)  # single stage
     dsk = optimize(y.dask, y._keys())
     assert len(dsk) > 100
 
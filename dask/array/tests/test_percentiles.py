@@ -60,3 +60,24 @@ def test_percentile_with_categoricals():
 def test_percentiles_with_empty_arrays():
     x = da.ones(10, chunks=((5, 0, 5),))
     assert_eq(da.percentile(x, [10, 50, 90]), np.array([1, 1, 1], dtype=x.dtype))
+
+
+def test_percentile_sketch():
+    x = np.random.RandomState(0).lognormal(size=100000)
+    d = da.from_array(x, chunks=10000)
+    q = [0.1, 1, 50, 99, 99.9]
+    result = da.percentile(d, q, method='sketch')
+    assert result.dtype == 'f8'
+    assert result.chunks == ((5,),)
+    assert np.allclose(result.compute(), np.percentile(x, q), rtol=0.03)
+    assert same_keys(da.percentile(d, q, method='sketch'),
+                     da.percentile(d, q, method='sketch'))
+    assert (da.percentile(d, q, method='sketch').name !=
+            da.percentile(d, q).name)
+
+    small = da.from_array(np.array([1, 2, 3, 4, 5, np.nan]), chunks=2)
+    assert_eq(da.percentile(small, [0, 25, 50, 100], method='sketch'),
+              np.array([1, 2, 3, 5], dtype='f8'))
+
+    with pytest.raises(ValueError):
+        da.percentile(d, q, method='foo')
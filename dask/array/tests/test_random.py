@@ -216,3 +216,57 @@ def test_multinomial():
         y = np.random.multinomial(20, [1 / 6.] * 6, size=size)
 
         assert x.shape == y.shape == x.compute().shape
+
+
+def test_counter_random_state():
+    x = da.random.CounterRandomState(42).normal(10, 2, size=(100, 100),
+                                                chunks=(30, 40))
+    y = da.random.CounterRandomState(42).normal(10, 2, size=(100, 100),
+                                                chunks=(100, 7))
+    assert_eq(x, y)
+    assert x.name == da.random.CounterRandomState(42).normal(
+        10, 2, size=(100, 100), chunks=(30, 40)).name
+    assert (x.compute(get=mpget) == y.compute()).all()
+    assert abs(x.mean().compute() - 10) < 0.1
+
+    # Successive calls draw different values
+    state = da.random.CounterRandomState(42)
+    a = state.random_sample(100, chunks=10).compute()
+    b = state.random_sample(100, chunks=10).compute()
+    assert not (a == b).any()
+    assert ((0 <= a) & (a < 1)).all()
+
+    # Tasks only hold small tuples, no generator state
+    x = state.random_sample((1000, 1000), chunks=10)
+    assert all(len(v) == 7 for v in x.dask.values())
+
+    loc = da.from_array(np.array([0., 100.]), chunks=1)
+    z = state.normal(loc, 1, chunks=1).compute()
+    assert abs(z[1] - z[0] - 100) < 10
+
+
+def test_counter_random_state_distributions():
+    state = da.random.CounterRandomState(1)
+    for name, args, mean, var in [('uniform', (2, 4), 3, 1 / 3.),
+                                  ('exponential', (3,), 3, 9),
+                                  ('laplace', (1, 2), 1, 8),
+                                  ('standard_normal', (), 0, 1),
+                                  ('lognormal', (0, 0.5), np.exp(0.125),
+                                   (np.exp(0.25) - 1) * np.exp(0.25)),
+                                  ('gumbel', (0, 1), 0.5772, np.pi ** 2 / 6),
+                                  ('logistic', (0, 1), 0, np.pi ** 2 / 3),
+                                  ('weibull', (2,), 0.8862, 1 - np.pi / 4),
+                                  ('power', (3,), 0.75, 3 / 80.)]:
+        x = getattr(state, name)(*args, size=10 ** 5, chunks=10 ** 4)
+        x = x.compute()
+        assert abs(x.mean() - mean) < 0.05 * max(1, abs(mean)), name
+        assert abs(x.var() - var) < 0.05 * var, name
+
+    for name, args in [('random', ()), ('standard_exponential', ()),
+                       ('standard_cauchy', ()), ('rayleigh', ()),
+                       ('pareto', (5,))]:
+        getattr(state, name)(*args, size=5, chunks=3).compute()
+
+    r = state.randint(-3, 4, size=10 ** 4, chunks=10 ** 3).compute()
+    assert r.dtype.kind == 'i'
+    assert set(np.unique(r)) == set(range(-3, 4))
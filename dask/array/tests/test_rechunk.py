@@ -5,6 +5,9 @@ from itertools import product
 import numpy as np
 from dask.array.rechunk import intersect_chunks, rechunk, normalize_chunks
 from dask.array.rechunk import cumdims_label, _breakpoints, _intersect_1d
+from dask.array.rechunk import plan_rechunk
+from dask.array.utils import assert_eq
+import dask
 import dask.array as da
 
 
@@ -188,3 +191,46 @@ def test_rechunk_intermediates():
     x = da.random.normal(10, 0.1, (10, 10), chunks=(10, 1))
     y = x.rechunk((1, 10))
     assert len(y.dask) > 30
+
+
+def test_plan_rechunk():
+    old = ((10,) * 100, (1000,))
+    new = ((1000,), (10,) * 100)
+    assert plan_rechunk(old, new, 8) == [((1000,), (1000,)), new]
+
+    steps = plan_rechunk(old, new, 8, block_size_limit=8 * 20000)
+    assert len(steps) > 2
+    assert steps[-1] == new
+    for chunks in steps:
+        assert max(chunks[0]) * max(chunks[1]) <= 20000
+
+    # Nothing to gain from intermediates
+    assert plan_rechunk(((5, 5), (10,)), ((10,), (5, 5)), 8) == \
+        [((10,), (5, 5))]
+    assert plan_rechunk(((10,) * 10,), ((100,),), 8) == [((100,),)]
+
+
+def test_rechunk_multistage():
+    a = np.random.uniform(0, 1, 200 * 300).reshape((200, 300))
+    x = da.from_array(a, chunks=(1, 300))
+    single = x.rechunk((200, 1), threshold=1e12)
+    for limit in [1e8, 8 * 2000]:
+        y = x.rechunk((200, 1), block_size_limit=limit)
+        assert y.chunks == single.chunks
+        assert len(y.dask) < len(single.dask) / 10
+        assert_eq(y, a)
+
+    with dask.set_options(rechunk_threshold=1e12):
+        assert len(x.rechunk((200, 1)).dask) == len(single.dask)
+
+
+def test_rechunk_auto():
+    x = da.ones((1000, 1000), chunks=(10, 30))
+    with dask.set_options(auto_chunk_size=8e4):
+        y = x.rechunk('auto')
+        assert (y.chunks[0][0], y.chunks[1][0]) == (50, 150)
+        assert x.rechunk({1: 'auto'}).chunks == (x.chunks[0], (1000,))
+        y = x.rechunk({0: 500, 1: 'auto'})
+        assert y.chunks[0] == (500, 500)
+        assert y.chunks[1][0] == 30
+    assert_eq(x.rechunk('auto'), np.ones((1000, 1000)))
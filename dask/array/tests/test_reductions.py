@@ -239,6 +239,15 @@ def test_moment():
     assert_eq(a.moment(4, axis=1), moment(x, 4, axis=1))
     assert_eq(a.moment(4, axis=(1, 0)), moment(x, 4, axis=(1, 0)))
 
+    # Single precision data far from zero
+    x = np.random.random(10000).astype('f4') + 1e3
+    a = da.from_array(x, chunks=100)
+    assert abs(a.var().compute() / x.astype('f8').var() - 1) < 1e-5
+    assert a.var().dtype == np.var(x).dtype
+
+    x = np.arange(1, 122).reshape((11, 11)).astype('f8')
+    a = da.from_array(x, chunks=(4, 4))
+
     # Tree reduction
     assert_eq(a.moment(order=4, split_every=4), moment(x, 4))
     assert_eq(a.moment(order=4, axis=0, split_every=4), moment(x, 4, axis=0))
@@ -345,3 +354,25 @@ def test_reduction_names():
     assert x.all().name.startswith('all')
     assert any(k[0].startswith('nansum') for k in da.nansum(x).dask)
     assert x.mean().name.startswith('mean')
+
+
+@pytest.mark.parametrize('func', ['sum', 'mean', 'var', 'std', 'nanmax'])
+@pytest.mark.parametrize('axis', [None, 0, 1, (0, 1)])
+def test_fuse_reductions(func, axis):
+    x = np.random.random((11, 22))
+    d = da.from_array(x, chunks=(3, 4))
+    with set_options(fuse_reductions=True):
+        a = getattr(da, func)(d, axis=axis)
+        b = getattr(da, func)(d, axis=axis, keepdims=True)
+    assert_eq(a, getattr(np, func)(x, axis=axis))
+    assert_eq(b, getattr(np, func)(x, axis=axis, keepdims=True))
+    assert len(a.dask) < len(getattr(da, func)(d, axis=axis).dask)
+
+    # Loaders are inlined into the tasks reducing groups of blocks
+    dsk = a._optimize(a.dask, a._keys())
+    assert len(dsk) < d.npartitions
+
+    with set_options(fuse_reductions=True):
+        assert_eq(da.moment(d, 3, axis=axis),
+                  ((x - x.mean(axis, keepdims=True)) ** 3).mean(axis))
+        assert_eq(d.sum(axis=axis, split_every=100), x.sum(axis=axis))
@@ -36,12 +36,12 @@ def wrap_func_shape_as_first_arg(func, *args, **kwargs):
         shape = (shape,)
 
     chunks = kwargs.pop('chunks', None)
-    chunks = normalize_chunks(chunks, shape)
     name = kwargs.pop('name', None)
 
     dtype = kwargs.pop('dtype', None)
     if dtype is None:
         dtype = func(shape, *args, **kwargs).dtype
+    chunks = normalize_chunks(chunks, shape, dtype=dtype)
 
     name = name or 'wrapped-' + tokenize(func, shape, chunks, dtype, args, kwargs)
 
@@ -61,7 +61,7 @@ def wrap(wrap_func, func, **kwargs):
     Blocked variant of %(name)s
 
     Follows the signature of %(name)s exactly except that it also requires a
-    keyword argument chunks=(...)
+    keyword argument chunks=(...), which may be 'auto'
 
     Original signature follows below.
     """
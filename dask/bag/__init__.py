@@ -3,6 +3,6 @@ from __future__ import absolute_import, division, print_function
 from .core import (Bag, Item, from_sequence, from_url, to_textfiles, concat,
                    from_castra, from_delayed, bag_range as range,
                    bag_zip as zip)
-from .text import read_text
+from .text import read_text, read_json
 from ..context import set_options
 from ..base import compute
@@ -0,0 +1,127 @@
+""" Columnar partitions for bags of records
+
+A bag of dicts or tuples that share a common schema may store each partition
+as a ``pandas.DataFrame`` rather than as a list of Python objects.  These
+partitions still behave like sequences of records, so every ``Bag`` method
+works on them unchanged, but a few operations (``pluck``, ``filter``,
+``frequencies``, ``foldby`` and ``to_dataframe``) detect them and operate on
+whole columns at once.
+
+Pandas is only imported when a columnar partition is actually built.
+"""
+from __future__ import absolute_import, division, print_function
+
+from toolz.compatibility import zip
+
+
+class Columns(object):
+    """ A partition of records stored column-wise in a ``pandas.DataFrame``
+
+    Iterating yields the records again, either as dicts or as tuples
+    depending on ``records``.
+
+    >>> part = Columns.from_records([{'a': 1, 'b': 'x'},
+    ...                              {'a': 2, 'b': 'y'}])  # doctest: +SKIP
+    >>> list(part)  # doctest: +SKIP
+    [{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'y'}]
+    >>> part.frame  # doctest: +SKIP
+       a  b
+    0  1  x
+    1  2  y
+    """
+    def __init__(self, frame, records='dict'):
+        if records not in ('dict', 'tuple'):
+            raise ValueError("records must be 'dict' or 'tuple', got %r"
+                             % records)
+        self.frame = frame
+        self.records = records
+
+    @classmethod
+    def from_records(cls, seq, columns=None):
+        """ Build columnar partition from a sequence of dicts or tuples """
+        import pandas as pd
+        seq = list(seq)
+        records = 'tuple' if seq and isinstance(seq[0], tuple) else 'dict'
+        frame = pd.DataFrame.from_records(seq, columns=columns)
+        if columns is not None and records == 'dict':
+            frame = frame[list(columns)]
+        return cls(frame, records)
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __iter__(self):
+        columns = [self.frame[c].tolist() for c in self.frame.columns]
+        if not columns:
+            return iter([{} if self.records == 'dict' else ()] * len(self))
+        rows = zip(*columns)
+        if self.records == 'tuple':
+            return iter(rows)
+        names = list(self.frame.columns)
+        return (dict(zip(names, row)) for row in rows)
+
+    def __getitem__(self, i):
+        return next(iter(Columns(self.frame.iloc[[i]], self.records)))
+
+    def __eq__(self, other):
+        return (isinstance(other, Columns) and self.records == other.records and
+                self.frame.equals(other.frame))
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'Columns<%s records, columns=%s>' % (len(self),
+                                                    list(self.frame.columns))
+
+    def column(self, key):
+        """ Select a single field as a ``Column`` """
+        return Column(self.frame[key])
+
+    def select(self, keys):
+        """ Select several fields, producing tuple records """
+        return Columns(self.frame[list(keys)], records='tuple')
+
+    def take_mask(self, mask):
+        """ Rows for which ``mask`` is true """
+        return Columns(self.frame[mask].reset_index(drop=True), self.records)
+
+
+class Column(object):
+    """ A partition of scalars stored in a ``pandas.Series``
+
+    Produced by ``pluck`` on a columnar partition.
+    """
+    def __init__(self, series):
+        self.series = series
+
+    def __len__(self):
+        return len(self.series)
+
+    def __iter__(self):
+        return iter(self.series.tolist())
+
+    def __getitem__(self, i):
+        return self.series.iloc[[i]].tolist()[0]
+
+    def __eq__(self, other):
+        return isinstance(other, Column) and self.series.equals(other.series)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'Column<%s values, dtype=%s>' % (len(self), self.series.dtype)
+
+    def take_mask(self, mask):
+        """ Values for which ``mask`` is true """
+        return Column(self.series[mask].reset_index(drop=True))
+
+    def frequencies(self):
+        """ Count occurrences of each distinct value """
+        counts = self.series.value_counts(dropna=False, sort=False)
+        return dict(zip(counts.index.tolist(), counts.values.tolist()))
+
+
+def is_columnar(seq):
+    return isinstance(seq, (Columns, Column))
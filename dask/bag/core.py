@@ -2,9 +2,15 @@ from __future__ import absolute_import, division, print_function
 
 from collections import Iterable, Iterator, defaultdict
 from functools import wraps, partial
+import bisect
+import hashlib
 import itertools
 import math
+import operator
 import os
+import pickle
+import shutil
+import sys
 import types
 import uuid
 from random import Random
@@ -14,7 +20,8 @@ from distutils.version import LooseVersion
 from ..utils import ignoring, eq_strict
 
 from toolz import (merge, take, reduce, valmap, map, partition_all, filter,
-                   remove, compose, curry, first, second, accumulate)
+                   remove, compose, curry, first, second, accumulate,
+                   merge_sorted)
 from toolz.compatibility import iteritems, zip
 import toolz
 _implement_accumulate = LooseVersion(toolz.__version__) > '0.7.4'
@@ -36,8 +43,10 @@ from ..core import quote, istask, get_dependencies, reverse_dict
 from ..multiprocessing import get as mpget
 from ..optimize import fuse, cull, inline
 from ..utils import (open, system_encoding, takes_multiple_arguments, funcname,
-                     digit, insert)
+                     digit, insert, prefix_scan)
 from ..bytes.core import write_bytes
+from .columnar import Columns, Column, is_columnar
+from . import sketch
 
 
 no_default = '__no__default__'
@@ -103,12 +112,61 @@ def inline_singleton_lists(dsk, dependencies=None):
     return dsk
 
 
+def stream_task(task):
+    """
+    Given a task, hand reductions an iterator rather than a full partition
+
+    Examples
+    --------
+
+    >>> task = (empty_safe_apply, sum, (map, inc, [1, 2, 3]))  # doctest: +SKIP
+    >>> stream_task(task)  # doctest: +SKIP
+    (lazy_safe_apply, sum, (map, inc, [1, 2, 3]))
+    """
+    if not istask(task):
+        return task
+    head, tail = task[0], task[1:]
+    if head is empty_safe_apply and iterator_safe(tail[0]):
+        head = lazy_safe_apply
+    return (head,) + tuple([stream_task(arg) for arg in tail])
+
+
+def iterator_safe(func):
+    """ Whether ``func`` is known to consume its input in a single pass
+
+    Only the built-in per-partition reductions qualify; arbitrary user
+    functions (``len``, indexing, iterating twice) keep getting lists.
+
+    >>> iterator_safe(sum)
+    True
+    >>> iterator_safe(len)
+    False
+    """
+    while isinstance(func, (partial, toolz.curry)):
+        func = func.func
+    try:
+        return func in _iterator_safe_funcs
+    except TypeError:
+        return False
+
+
 def optimize(dsk, keys, fuse_keys=None, **kwargs):
-    """ Optimize a dask from a dask.bag """
+    """ Optimize a dask from a dask.bag
+
+    With ``set_options(lazy_partitions=True)`` partitions also stay lazy
+    going into the built-in reductions (``sum``, ``max``, ``count``,
+    ``frequencies``, ``fold``, ...) whenever they fuse into a single
+    consumer, as ``read_text`` lines and ``map``/``filter`` chains do, so
+    no list is built per partition.  Other functions given to
+    ``Bag.reduction`` still receive lists.  Partitions produced by
+    ``from_delayed``, ``groupby`` and ``take`` are materialized as before.
+    """
     dsk2, dependencies = cull(dsk, keys)
     dsk3, dependencies = fuse(dsk2, keys + (fuse_keys or []), dependencies)
     dsk4 = inline_singleton_lists(dsk3, dependencies)
     dsk5 = lazify(dsk4)
+    if _globals.get('lazy_partitions'):
+        dsk5 = valmap(stream_task, dsk5)
     return dsk5
 
 
@@ -167,8 +225,13 @@ def to_textfiles(b, path, name_function=None, compression='infer',
 
     >>> b_dict.map(json.dumps).to_textfiles("/path/to/data/*.json")  # doctest: +SKIP
     """
+    from dask.delayed import Delayed
     out = write_bytes(b.to_delayed(), path, name_function, compression,
                       encoding=encoding)
+    # Fuse each partition into its write task so that lines stream to disk
+    keys = [d.key for d in out]
+    dsk = optimize(merge(*[d.dask for d in out]), keys)
+    out = [Delayed(key, [dsk]) for key in keys]
     if compute:
         from dask import compute
         compute(*out)
@@ -444,7 +507,8 @@ class Bag(Base):
         """
         name = 'filter-{0}-{1}'.format(funcname(predicate),
                                        tokenize(self, predicate))
-        dsk = dict(((name, i), (reify, (filter, predicate, (self.name, i))))
+        dsk = dict(((name, i), (reify, (filter_partition, predicate,
+                                        (self.name, i))))
                    for i in range(self.npartitions))
         return type(self)(merge(self.dask, dsk), name, self.npartitions)
 
@@ -557,10 +621,12 @@ class Bag(Base):
         name = 'pluck-' + tokenize(self, key, default)
         key = quote(key)
         if default == no_default:
-            dsk = dict(((name, i), (list, (pluck, key, (self.name, i))))
+            dsk = dict(((name, i), (reify, (pluck_partition, key,
+                                            (self.name, i))))
                        for i in range(self.npartitions))
         else:
-            dsk = dict(((name, i), (list, (pluck, key, (self.name, i), default)))
+            dsk = dict(((name, i), (reify, (pluck_partition, key,
+                                            (self.name, i), default)))
                        for i in range(self.npartitions))
         return type(self)(merge(self.dask, dsk), name, self.npartitions)
 
@@ -651,7 +717,7 @@ class Bag(Base):
         >>> dict(b.frequencies())  # doctest: +SKIP
         {'Alice': 2, 'Bob', 1}
         """
-        return self.reduction(frequencies, merge_frequencies,
+        return self.reduction(frequencies_partition, merge_frequencies,
                               out_type=Bag, split_every=split_every,
                               name='frequencies').map_partitions(dictitems)
 
@@ -688,6 +754,78 @@ class Bag(Base):
         return self.reduction(set, curry(apply, set.union), out_type=Bag,
                               name='distinct')
 
+    def count_distinct_approx(self, precision=12, split_every=None):
+        """ Approximate number of distinct elements
+
+        Uses HyperLogLog, so every partial result is a fixed ``2**precision``
+        bytes regardless of the number of distinct elements.  The relative
+        standard error is about ``1.04 / sqrt(2**precision)``, 1.6% with the
+        default precision.
+
+        >>> b = from_sequence(range(1000), npartitions=4)
+        >>> b.count_distinct_approx().compute()  # doctest: +SKIP
+        1002
+
+        See Also
+        --------
+        Bag.distinct
+        """
+        chunk = partial(sketch.hll_chunk, precision=precision)
+        return self.reduction(chunk, sketch.hll_merge, split_every=split_every,
+                              name='count-distinct-approx').apply(hll_count)
+
+    def frequencies_approx(self, k=100, split_every=None):
+        """ Approximate counts of the most frequent elements
+
+        Uses mergeable Misra-Gries summaries holding at most ``k`` elements,
+        so partial results stay small however many distinct elements there
+        are.  Every element occurring more than ``n / (k + 1)`` times in a
+        bag of ``n`` elements is returned.  Counts are lower bounds, short by
+        at most ``n / (k + 1)``.
+
+        >>> b = from_sequence(['Alice', 'Bob', 'Alice', 'Alice'])
+        >>> list(b.frequencies_approx(k=1))  # doctest: +SKIP
+        [('Alice', 2)]
+
+        See Also
+        --------
+        Bag.frequencies
+        """
+        return self.reduction(partial(sketch.misra_gries_chunk, k=k),
+                              partial(sketch.misra_gries_merge, k=k),
+                              out_type=Bag, split_every=split_every,
+                              name='frequencies-approx').map_partitions(
+                                  misra_gries_items)
+
+    def quantile_approx(self, q=0.5, compression=100, split_every=None):
+        """ Approximate quantiles of a bag of numbers
+
+        Every partition is summarized by a t-digest of at most about
+        ``compression`` centroids, so partial results stay small however
+        many elements there are.  Centroids are smallest in the tails, making
+        extreme quantiles like 0.999 the most accurate.
+
+        Parameters
+        ----------
+        q : float or list of floats, default 0.5
+            Quantiles to compute, ranging from 0 to 1.  A list gives a list
+            of results.
+        compression : int
+            Size of the digests; larger is more accurate
+
+        >>> b = from_sequence(range(101), npartitions=4)
+        >>> b.quantile_approx([0.5, 0.99]).compute()  # doctest: +SKIP
+        [50.0, 99.0]
+        """
+        from ..array.percentile import tdigest_chunk, tdigest_merge
+        if isinstance(q, (list, tuple)):
+            q = list(q)
+        return self.reduction(partial(tdigest_chunk, compression=compression),
+                              partial(tdigest_merge, compression=compression),
+                              split_every=split_every,
+                              name='quantile-approx').apply(
+                                  partial(tdigest_quantile, q=q))
+
     def reduction(self, perpartition, aggregate, split_every=None,
                   out_type=Item, name=None):
         """ Reduce collection with reduction operators
@@ -801,24 +939,77 @@ class Bag(Base):
         """ Standard deviation """
         return self.var(ddof=ddof).apply(math.sqrt)
 
-    def join(self, other, on_self, on_other=None):
+    def join(self, other, on_self, on_other=None, how='inner', method=None,
+             npartitions=None, broadcast=None):
         """ Join collection with another collection
 
-        Other collection must be an Iterable, and not a Bag.
+        Yields ``(other_element, self_element)`` pairs with equal keys.
+
+        If ``other`` is an Iterable it is copied into every partition.  If it
+        is a Bag, both bags are shuffled by key with ``groupby`` and joined
+        partition by partition, unless ``broadcast`` is set, in which case
+        ``other`` is gathered into one task and copied into every partition.
+
+        Parameters
+        ----------
+        other: Iterable or Bag
+        on_self: function
+            Key function for elements of this bag
+        on_other: function, optional
+            Key function for elements of ``other``, defaults to ``on_self``
+        how: {'inner', 'left', 'right', 'outer'}
+            'left' keeps elements of this bag without a match, 'right'
+            elements of ``other`` without a match and 'outer' both, paired
+            with ``None``.  Broadcast joins only support 'inner' and 'left'.
+        method: str, optional
+            Shuffle method for joins between bags, see ``Bag.groupby``
+        npartitions: int, optional
+            Number of output partitions of a shuffled join
+        broadcast: bool, optional
+            Broadcast a bag ``other`` rather than shuffling.  Defaults to
+            True if ``other`` has a single partition and ``how`` is 'inner'
+            or 'left'.
 
         >>> people = from_sequence(['Alice', 'Bob', 'Charlie'])
         >>> fruit = ['Apple', 'Apricot', 'Banana']
         >>> list(people.join(fruit, lambda x: x[0]))  # doctest: +SKIP
         [('Apple', 'Alice'), ('Apricot', 'Alice'), ('Banana', 'Bob')]
         """
-        assert isinstance(other, Iterable)
-        assert not isinstance(other, Bag)
         if on_other is None:
             on_other = on_self
-        name = 'join-' + tokenize(self, other, on_self, on_other)
-        dsk = dict(((name, i), (list, (join, on_other, other,
-                                       on_self, (self.name, i))))
-                   for i in range(self.npartitions))
+        if how not in ('inner', 'left', 'right', 'outer'):
+            raise ValueError("how must be one of 'inner', 'left', 'right' "
+                             "or 'outer', got %r" % how)
+        if isinstance(other, Bag):
+            if broadcast is None:
+                broadcast = (other.npartitions == 1 and
+                             how in ('inner', 'left'))
+            if not broadcast:
+                return join_shuffle(self, other, on_self, on_other, how,
+                                    method, npartitions)
+        else:
+            assert isinstance(other, Iterable)
+        if how not in ('inner', 'left'):
+            raise NotImplementedError("Broadcast joins only support "
+                                      "how='inner' or how='left'")
+        default = None if how == 'left' else no_default
+        token = tokenize(self, other, on_self, on_other, how)
+        name = 'join-' + token
+        dsk = {}
+        if isinstance(other, Bag):
+            other_key = 'join-broadcast-' + token
+            dsk[other_key] = (list, (toolz.concat, other._keys()))
+            dsk = merge(other.dask, dsk)
+        else:
+            other_key = other
+        if default is no_default:
+            dsk.update(((name, i), (list, (join, on_other, other_key,
+                                           on_self, (self.name, i))))
+                       for i in range(self.npartitions))
+        else:
+            dsk.update(((name, i), (list, (join, on_other, other_key,
+                                           on_self, (self.name, i), default)))
+                       for i in range(self.npartitions))
         return type(self)(merge(self.dask, dsk), name, self.npartitions)
 
     def product(self, other):
@@ -833,7 +1024,7 @@ class Bag(Base):
         return type(self)(merge(self.dask, other.dask, dsk), name, n * m)
 
     def foldby(self, key, binop, initial=no_default, combine=None,
-               combine_initial=no_default):
+               combine_initial=no_default, split_out=1):
         """ Combined reduction and groupby
 
         Foldby provides a combined groupby and reduce for efficient parallel
@@ -898,36 +1089,61 @@ class Bag(Base):
 
         >>> b.foldby('name', binop, 0, combine, 0)  # doctest: +SKIP
 
+        **High cardinality keys**
+
+        By default all per-partition results are merged in a single task,
+        which must hold every key at once.  When there are very many keys pass
+        ``split_out=`` to hash-partition the keys across that many output
+        partitions, each combined independently.
+
+        >>> b.foldby('name', binop, 0, combine, 0, split_out=10)  # doctest: +SKIP
+
         See Also
         --------
 
         toolz.reduceby
         pyspark.combineByKey
         """
-        token = tokenize(self, key, binop, initial, combine, combine_initial)
+        token = tokenize(self, key, binop, initial, combine, combine_initial,
+                         split_out)
         a = 'foldby-a-' + token
         b = 'foldby-b-' + token
         if combine is None:
             combine = binop
+        # Field names may be grouped column-wise on columnar partitions
+        func = reduceby if callable(key) else reduceby_partition
         if initial is not no_default:
-            dsk = dict(((a, i), (reduceby, key, binop, (self.name, i), initial))
+            dsk = dict(((a, i), (func, key, binop, (self.name, i), initial))
                        for i in range(self.npartitions))
         else:
-            dsk = dict(((a, i), (reduceby, key, binop, (self.name, i)))
+            dsk = dict(((a, i), (func, key, binop, (self.name, i)))
                        for i in range(self.npartitions))
 
         def combine2(acc, x):
             return combine(acc, x[1])
 
+        if split_out > 1:
+            c = 'foldby-split-' + token
+            dsk.update(((c, i), (split_dict_by_hash, (a, i), split_out))
+                       for i in range(self.npartitions))
+            parts = [[(operator.getitem, (c, i), j)
+                      for i in range(self.npartitions)]
+                     for j in range(split_out)]
+        else:
+            parts = [[(a, i) for i in range(self.npartitions)]]
+
         if combine_initial is not no_default:
-            dsk2 = {(b, 0): (dictitems, (reduceby, 0, combine2,
-                                         (toolz.concat, (map, dictitems,
-                                                         list(dsk.keys()))),
-                                         combine_initial))}
+            dsk2 = dict(((b, j), (dictitems, (reduceby, 0, combine2,
+                                              (toolz.concat, (map, dictitems,
+                                                              part)),
+                                              combine_initial)))
+                        for j, part in enumerate(parts))
         else:
-            dsk2 = {(b, 0): (dictitems, (merge_with, (partial, reduce, combine),
-                                         list(dsk.keys())))}
-        return type(self)(merge(self.dask, dsk, dsk2), b, 1)
+            dsk2 = dict(((b, j), (dictitems, (merge_with,
+                                              (partial, reduce, combine),
+                                              part)))
+                        for j, part in enumerate(parts))
+        return type(self)(merge(self.dask, dsk, dsk2), b, len(parts))
 
     def take(self, k, npartitions=1, compute=True):
         """ Take the first k elements
@@ -1010,11 +1226,14 @@ class Bag(Base):
         grouper: function
             Function on which to group elements
         method: str
-            Either 'disk' for an on-disk shuffle or 'tasks' to use the task
-            scheduling framework.  Use 'disk' if you are on a single machine
-            and 'tasks' if you are on a distributed cluster.
+            Either 'disk' for an on-disk shuffle, 'memory' for a single pass
+            in-memory shuffle or 'tasks' to use the task scheduling framework.
+            Use 'disk' if you are on a single machine, 'memory' if you are on
+            a single machine using the threaded scheduler and your data fits
+            in memory, and 'tasks' if you are on a distributed cluster.
         npartitions: int
-            If using the disk-based shuffle, the number of output partitions
+            If using the disk-based or in-memory shuffle, the number of output
+            partitions
         blocksize: int
             If using the disk-based shuffle, the size of shuffle blocks
         max_branch: int
@@ -1043,12 +1262,59 @@ class Bag(Base):
         if method == 'disk':
             return groupby_disk(self, grouper, npartitions=npartitions,
                                 blocksize=blocksize)
+        elif method == 'memory':
+            return groupby_memory(self, grouper, npartitions=npartitions)
         elif method == 'tasks':
             return groupby_tasks(self, grouper, max_branch=max_branch)
         else:
-            msg = "Shuffle method must be 'disk' or 'tasks'"
+            msg = "Shuffle method must be 'disk', 'memory' or 'tasks'"
             raise NotImplementedError(msg)
 
+    def sort(self, key=None, npartitions=None, reverse=False, method=None):
+        """ Globally sort the bag
+
+        Every partition is sorted, sampled and split into runs along
+        boundaries chosen from the weighted samples, so that output
+        partition ``i`` holds only elements sorting before those of
+        partition ``i + 1``.  Each output partition then k-way merges its
+        runs.
+
+        Parameters
+        ----------
+        key: function, optional
+            Sort by ``key(element)`` rather than the elements themselves
+        npartitions: int, optional
+            Number of output partitions, defaults to the current number
+        reverse: bool
+            Sort in descending order
+        method: str, optional
+            Either 'disk' to spill sorted runs to disk until they are merged,
+            or 'tasks' to pass them between tasks in memory.  Chosen like the
+            ``groupby`` shuffle method by default.
+
+        Examples
+        --------
+        >>> b = from_sequence([5, 3, 8, 1, 9, 2], npartitions=2)
+        >>> b.sort().compute()  # doctest: +SKIP
+        [1, 2, 3, 5, 8, 9]
+
+        See Also
+        --------
+        Bag.topk
+        """
+        if npartitions is None:
+            npartitions = self.npartitions
+        if method is None:
+            get = _globals.get('get')
+            if (isinstance(get, types.MethodType) and
+               'distributed' in get.__func__.__module__):
+                method = 'tasks'
+            else:
+                method = 'disk'
+        if method not in ('disk', 'tasks'):
+            raise NotImplementedError("Sort method must be 'disk' or 'tasks'")
+        return sort_bag(self, key, npartitions, reverse, method)
+
     def to_dataframe(self, columns=None):
         """ Convert Bag to dask.dataframe
 
@@ -1093,14 +1359,47 @@ class Bag(Base):
             meta = pd.DataFrame([head], columns=columns)
         columns = list(meta.columns)
         name = 'to_dataframe-' + tokenize(self, columns)
-        DataFrame = partial(pd.DataFrame, columns=columns)
-        dsk = dict(((name, i), (DataFrame, (list2, (self.name, i))))
+        dsk = dict(((name, i), (to_dataframe_partition, (self.name, i),
+                                columns))
                    for i in range(self.npartitions))
 
         divisions = [None] * (self.npartitions + 1)
         return dd.DataFrame(merge(optimize(self.dask, self._keys()), dsk),
                             name, meta, divisions)
 
+    def to_columnar(self, columns=None):
+        """ Store each partition column-wise in a ``pandas.DataFrame``
+
+        Bag should contain dict records or tuples that share a common schema.
+        The resulting bag holds the same elements, but ``pluck``, ``filter``,
+        ``frequencies``, ``foldby`` and ``to_dataframe`` operate on whole
+        columns at once rather than element by element.  Dicts with missing
+        keys come back with ``NaN`` in those fields.
+
+        Parameters
+        ----------
+        columns : list, optional
+            Field names to keep, in order.  Defaults to all fields.
+
+        Examples
+        --------
+        >>> import dask.bag as db
+        >>> b = db.from_sequence([{'name': 'Alice',   'balance': 100},
+        ...                       {'name': 'Bob',     'balance': 200},
+        ...                       {'name': 'Alice',   'balance': 300}],
+        ...                      npartitions=2).to_columnar()
+        >>> dict(b.pluck('name').frequencies())  # doctest: +SKIP
+        {'Alice': 2, 'Bob': 1}
+
+        See Also
+        --------
+        dask.bag.columnar.Columns
+        """
+        name = 'to-columnar-' + tokenize(self, columns)
+        dsk = dict(((name, i), (Columns.from_records, (self.name, i), columns))
+                   for i in range(self.npartitions))
+        return type(self)(merge(self.dask, dsk), name, self.npartitions)
+
     def to_delayed(self):
         """ Convert bag to list of dask Delayed
 
@@ -1109,17 +1408,33 @@ class Bag(Base):
         from dask.delayed import Delayed
         return [Delayed(k, [self.dask]) for k in self._keys()]
 
-    def repartition(self, npartitions):
-        """ Coalesce bag into fewer partitions
+    def repartition(self, npartitions, balance=None):
+        """ Change the number of partitions of the bag
+
+        Without ``balance`` old partitions are concatenated in contiguous
+        runs to get fewer partitions, or each is split into equal runs of
+        elements to get more.  Neither looks at partition sizes.
+
+        Parameters
+        ----------
+        npartitions : int
+            Number of new partitions
+        balance : {None, 'count', 'bytes'}, optional
+            Measure every partition first and cut new partitions holding
+            about equal numbers of elements or bytes.  Byte sizes are shallow
+            ``sys.getsizeof`` totals and elements are assumed to be equally
+            sized within a partition.  Measuring computes the bag, so persist
+            expensive bags before balancing them.
 
         Examples
         --------
         >>> b.repartition(5)  # set to have 5 partitions  # doctest: +SKIP
+        >>> b.repartition(16, balance='bytes')  # doctest: +SKIP
         """
+        if balance is not None:
+            return self._repartition_balanced(npartitions, balance)
         if npartitions > self.npartitions:
-            msg = ("Repartition only supports going to fewer partitions\n"
-                   " old: %d  new: %d")
-            raise NotImplementedError(msg % (self.npartitions, npartitions))
+            return self._repartition_split(npartitions)
         npartitions_ratio = self.npartitions / npartitions
         new_partitions_boundaries = [int(old_partition_index * npartitions_ratio)
                                      for old_partition_index in range(npartitions + 1)]
@@ -1135,12 +1450,64 @@ class Bag(Base):
             dsk[new_name, new_partition_index] = value
         return Bag(dsk=merge(self.dask, dsk), name=new_name, npartitions=npartitions)
 
-    def accumulate(self, binop, initial=no_default):
+    def _repartition_split(self, npartitions):
+        """ Split every partition into about ``npartitions / n`` pieces """
+        token = tokenize(self, npartitions)
+        split_name = 'repartition-split-%d-%s' % (npartitions, token)
+        new_name = 'repartition-%d-%s' % (npartitions, token)
+        ratio = npartitions / self.npartitions
+        boundaries = [int(round(i * ratio))
+                      for i in range(self.npartitions + 1)]
+
+        dsk = {}
+        j = 0
+        for i in range(self.npartitions):
+            nsplits = boundaries[i + 1] - boundaries[i]
+            dsk[(split_name, i)] = (split_partition, (self.name, i), nsplits)
+            for k in range(nsplits):
+                dsk[(new_name, j)] = (operator.getitem, (split_name, i), k)
+                j += 1
+        return Bag(merge(self.dask, dsk), new_name, npartitions)
+
+    def _repartition_balanced(self, npartitions, balance):
+        if balance == 'count':
+            weigh = len
+        elif balance == 'bytes':
+            weigh = partition_nbytes
+        else:
+            raise ValueError("balance must be one of None, 'count' or "
+                             "'bytes', got %r" % balance)
+        from ..base import compute
+        counts = self.map_partitions(len)
+        if balance == 'count':
+            counts = weights = counts.compute()
+        else:
+            counts, weights = compute(counts, self.map_partitions(weigh))
+        counts, weights = list(counts), list(weights)
+        plan = balanced_slices(counts, weights, npartitions)
+
+        new_name = 'repartition-%s-%d-%s' % (balance, npartitions,
+                                             tokenize(self, plan))
+        dsk = {}
+        for j, slices in enumerate(plan):
+            parts = [(self.name, i) if (start, stop) == (0, counts[i])
+                     else (itertools.islice, (self.name, i), start, stop)
+                     for i, start, stop in slices]
+            dsk[(new_name, j)] = (list, (toolz.concat, parts))
+        return Bag(merge(self.dask, dsk), new_name, npartitions)
+
+    def accumulate(self, binop, initial=no_default, associative=False):
         """ Repeatedly apply binary function to a sequence, accumulating results.
 
         This assumes that the bag is ordered.  While this is typically the case
         not all Dask.bag functions preserve this property.
 
+        By default each partition waits for the last result of the previous
+        one.  If ``binop`` is associative pass ``associative=True``: every
+        partition is then accumulated in parallel, the last results are
+        combined in a tree of depth ``log(npartitions)`` and each partition
+        is offset by the combined results before it.
+
         Examples
         --------
         >>> from operator import add
@@ -1157,11 +1524,13 @@ class Bag(Base):
         if not _implement_accumulate:
             raise NotImplementedError("accumulate requires `toolz` > 0.7.4"
                                       " or `cytoolz` > 0.7.3.")
-        token = tokenize(self, binop, initial)
+        token = tokenize(self, binop, initial, associative)
         binop_name = funcname(binop)
         a = '%s-part-%s' % (binop_name, token)
         b = '%s-first-%s' % (binop_name, token)
         c = '%s-second-%s' % (binop_name, token)
+        if associative:
+            return self._accumulate_scan(binop, initial, a, b, c)
         dsk = {(a, 0): (accumulate_part, binop, (self.name, 0), initial, True),
                (b, 0): (first, (a, 0)),
                (c, 0): (second, (a, 0))}
@@ -1171,6 +1540,22 @@ class Bag(Base):
             dsk[(c, i)] = (second, (a, i))
         return Bag(merge(self.dask, dsk), b, self.npartitions)
 
+    def _accumulate_scan(self, binop, initial, a, b, c):
+        """ Parallel prefix scan version of ``accumulate`` """
+        dsk = {}
+        for i in range(self.npartitions):
+            dsk[(a, i)] = (accumulate_local, binop, (self.name, i),
+                           initial if i == 0 else no_default)
+            dsk[(c, i)] = (second, (a, i))
+        carries = prefix_scan(dsk, partial(carry_binop, binop), c + '-scan',
+                              [(c, i) for i in range(self.npartitions - 1)])
+        out = b + '-offset'
+        dsk[(out, 0)] = (first, (a, 0))
+        for i in range(1, self.npartitions):
+            dsk[(out, i)] = (accumulate_offset, binop, carries[i - 1],
+                             (first, (a, i)))
+        return Bag(merge(self.dask, dsk), out, self.npartitions)
+
 
 def accumulate_part(binop, seq, initial, is_first=False):
     if initial == no_default:
@@ -1182,6 +1567,31 @@ def accumulate_part(binop, seq, initial, is_first=False):
     return res[1:], res[-1]
 
 
+def accumulate_local(binop, seq, initial):
+    """ Accumulate a partition on its own, returning results and the last """
+    if initial == no_default:
+        res = list(accumulate(binop, seq))
+    else:
+        res = list(accumulate(binop, seq, initial=initial))
+    return res, res[-1] if res else no_result
+
+
+def carry_binop(binop, a, b):
+    """ ``binop`` that skips the last results of empty partitions """
+    if eq_strict(a, no_result):
+        return b
+    if eq_strict(b, no_result):
+        return a
+    return binop(a, b)
+
+
+def accumulate_offset(binop, carry, res):
+    """ Combine the carry from earlier partitions into local results """
+    if eq_strict(carry, no_result):
+        return res
+    return [binop(carry, x) for x in res]
+
+
 normalize_token.register(Item, lambda a: a.key)
 normalize_token.register(Bag, lambda a: a.name)
 
@@ -1235,7 +1645,8 @@ def write(data, filename, compression, encoding):
         f.close()
 
 
-def from_sequence(seq, partition_size=None, npartitions=None):
+def from_sequence(seq, partition_size=None, npartitions=None,
+                  reference=False):
     """ Create dask from Python sequence
 
     This sequence should be relatively small in memory.  Dask Bag works
@@ -1250,6 +1661,15 @@ def from_sequence(seq, partition_size=None, npartitions=None):
         The length of each partition
     npartitions: int (optional)
         The number of desired partitions
+    reference: bool (optional)
+        Wrap each partition's elements in an opaque holder instead of
+        putting them into the task directly.  Culling, ordering and other
+        graph traversals then cost O(npartitions) rather than O(elements),
+        which helps for millions of filenames or records.  Each task still
+        carries only its own partition, so schedulers that ship tasks to
+        other processes send every element once.  Naming still reads every
+        element, hashing the pickled sequence in O(elements) rather than
+        tokenizing each element.
 
     It is best to provide either ``partition_size`` or ``npartitions``
     (though not both.)
@@ -1271,12 +1691,56 @@ def from_sequence(seq, partition_size=None, npartitions=None):
         else:
             partition_size = int(len(seq) / 100)
 
+    if reference:
+        partition_size = max(partition_size, 1)
+        token = tokenize(sequence_hash(seq), partition_size)
+        name = 'from_sequence-' + token
+        d = {}
+        # An empty sequence still gets one (empty) partition
+        for i, start in enumerate(range(0, max(len(seq), 1),
+                                        partition_size)):
+            part = SequenceData(seq[start:start + partition_size])
+            d[(name, i)] = (sequence_data, part)
+        return Bag(d, name, len(d))
+
     parts = list(partition_all(partition_size, seq))
     name = 'from_sequence-' + tokenize(seq, partition_size)
     d = dict(((name, i), list(part)) for i, part in enumerate(parts))
     return Bag(d, name, len(d))
 
 
+class SequenceData(object):
+    """ Opaque holder, so that the graph does not walk the sequence """
+    __slots__ = ('seq',)
+
+    def __init__(self, seq):
+        self.seq = seq
+
+    def __getstate__(self):
+        return self.seq
+
+    def __setstate__(self, seq):
+        self.seq = seq
+
+
+def sequence_data(data):
+    return list(data.seq)
+
+
+def sequence_hash(seq):
+    """ Fingerprint of a list
+
+    The md5 hash of the pickled list, which is exact and much faster than
+    ``tokenize`` for lists of records.  Lists that cannot be pickled are
+    tokenized instead.
+    """
+    try:
+        data = pickle.dumps(seq, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return tokenize(seq)
+    return hashlib.md5(data).hexdigest()
+
+
 def from_castra(x, columns=None, index=False):
     """Load a dask Bag from a Castra.
 
@@ -1384,6 +1848,8 @@ def concat(bags):
 
 
 def reify(seq):
+    if is_columnar(seq):
+        return seq
     if isinstance(seq, Iterator):
         seq = list(seq)
     if seq and isinstance(seq[0], Iterator):
@@ -1514,6 +1980,80 @@ def bag_zip(*bags):
     return Bag(merge(bags_dsk, dsk), name, npartitions)
 
 
+def pluck_partition(key, seq, default=no_default):
+    """ Pluck from every element, selecting whole columns when possible """
+    if isinstance(seq, Columns):
+        fields = key if isinstance(key, list) else [key]
+        if all(k in seq.frame.columns for k in fields):
+            return seq.select(key) if isinstance(key, list) else seq.column(key)
+    if default == no_default:
+        return pluck(key, seq)
+    return pluck(key, seq, default)
+
+
+def filter_partition(predicate, seq):
+    """ Filter a partition, keeping columnar partitions columnar """
+    if is_columnar(seq):
+        return seq.take_mask([bool(predicate(x)) for x in seq])
+    return filter(predicate, seq)
+
+
+def frequencies_partition(seq):
+    if isinstance(seq, Column):
+        return seq.frequencies()
+    return frequencies(seq)
+
+
+def hll_count(registers):
+    """ Estimated distinct count, zero if every partition was empty """
+    if eq_strict(registers, no_result):
+        return 0
+    return sketch.hll_estimate(registers)
+
+
+def misra_gries_items(summary):
+    if eq_strict(summary, no_result):
+        return []
+    return sketch.misra_gries_items(summary)
+
+
+def tdigest_quantile(digest, q):
+    """ Quantile or list of quantiles ``q``, from 0 to 1, of a t-digest """
+    from ..array.percentile import tdigest_percentile
+    qs = q if isinstance(q, list) else [q]
+    if eq_strict(digest, no_result):
+        result = [float('nan')] * len(qs)
+    else:
+        result = tdigest_percentile(digest, [100 * x for x in qs]).tolist()
+    return result if isinstance(q, list) else result[0]
+
+
+def reduceby_partition(key, binop, seq, initial=no_default):
+    """ ``reduceby`` that groups columnar partitions by a field directly """
+    if (isinstance(seq, Columns) and not isinstance(key, list) and
+            key in seq.frame.columns):
+        import pandas as pd
+        codes, uniques = pd.factorize(seq.frame[key])
+        if not (codes == -1).any():
+            uniques = uniques.tolist()
+            result = {}
+            for code, inds in iteritems(seq.frame.groupby(codes).indices):
+                group = Columns(seq.frame.take(inds), seq.records)
+                result[uniques[code]] = _reduce(binop, group, initial)
+            return result
+    if initial is not no_default:
+        return reduceby(key, binop, seq, initial)
+    return reduceby(key, binop, seq)
+
+
+def to_dataframe_partition(seq, columns):
+    import pandas as pd
+    if (isinstance(seq, Columns) and seq.records == 'dict' and
+            all(c in seq.frame.columns for c in columns)):
+        return seq.frame[columns]
+    return pd.DataFrame(list2(seq), columns=columns)
+
+
 def _reduce(binop, sequence, initial=no_default):
     if initial is not no_default:
         return reduce(binop, sequence, initial)
@@ -1588,10 +2128,17 @@ def groupby_disk(b, grouper, npartitions=None, blocksize=2**20):
 
     import partd
     p = ('partd-' + token,)
+    if _globals.get('bag_serializer') == 'typed':
+        from .serialize import (encode_partition, decode_partition,
+                                concat_partitions)
+        encode = partial(partd.Encode, encode_partition, decode_partition,
+                         concat_partitions)
+    else:
+        encode = partd.Python
     try:
-        dsk1 = {p: (partd.Python, (partd.Snappy, partd.File()))}
+        dsk1 = {p: (encode, (partd.Snappy, partd.File()))}
     except AttributeError:
-        dsk1 = {p: (partd.Python, partd.File())}
+        dsk1 = {p: (encode, partd.File())}
 
     # Partition data on disk
     name = 'groupby-part-{0}-{1}'.format(funcname(grouper), token)
@@ -1616,14 +2163,340 @@ def groupby_disk(b, grouper, npartitions=None, blocksize=2**20):
     return type(b)(merge(b.dask, dsk1, dsk2, dsk3, dsk4), name, npartitions)
 
 
+def join_shuffle(left, right, on_left, on_right, how, method=None,
+                 npartitions=None):
+    """ Join two bags by shuffling their tagged elements together by key """
+    tagged = concat([left.map_partitions(partial(tag_partition, on_left, 0)),
+                     right.map_partitions(partial(tag_partition, on_right, 1))])
+    groups = tagged.groupby(first, method=method, npartitions=npartitions)
+    return groups.map_partitions(partial(join_groups, how=how))
+
+
+def tag_partition(key, side, seq):
+    """ Wrap elements as ``(key(element), side, element)`` """
+    return [(key(x), side, x) for x in seq]
+
+
+def join_groups(groups, how='inner'):
+    """ Join the tagged elements of every group
+
+    >>> join_groups([(1, [(1, 0, 'a'), (1, 1, 'x'), (1, 1, 'y')]),
+    ...              (2, [(2, 0, 'b')])], how='left')
+    [('x', 'a'), ('y', 'a'), (None, 'b')]
+    """
+    out = []
+    for _, group in groups:
+        lefts = [x for _, side, x in group if side == 0]
+        rights = [x for _, side, x in group if side == 1]
+        if not lefts:
+            if how in ('right', 'outer'):
+                out.extend((y, None) for y in rights)
+        elif not rights:
+            if how in ('left', 'outer'):
+                out.extend((None, x) for x in lefts)
+        else:
+            out.extend((y, x) for x in lefts for y in rights)
+    return out
+
+
+def split_by_hash(grouper, sequence, npartitions):
+    """ Group a partition and hash each group into one of ``npartitions``
+
+    >>> split_by_hash(lambda x: x % 2, [1, 2, 3], 2)
+    [[(0, [2])], [(1, [1, 3])]]
+    """
+    buckets = [[] for i in range(npartitions)]
+    for k, v in groupby(grouper, sequence).items():
+        buckets[abs(hash(k)) % npartitions].append((k, v))
+    return buckets
+
+
+def split_partition(seq, npartitions):
+    """ Split a sequence into ``npartitions`` contiguous runs of equal length
+
+    >>> split_partition(range(5), 2)
+    [[0, 1], [2, 3, 4]]
+    """
+    seq = list(seq)
+    n = len(seq)
+    return [seq[i * n // npartitions:(i + 1) * n // npartitions]
+            for i in range(npartitions)]
+
+
+def partition_nbytes(seq):
+    """ Shallow size in bytes of the elements of a partition """
+    return sum(map(sys.getsizeof, seq))
+
+
+def balanced_slices(counts, weights, npartitions):
+    """ Cut partitions into ``npartitions`` runs of about equal weight
+
+    Elements are assumed to weigh the same within each partition.  Returns
+    for every new partition a list of ``(old_partition, start, stop)``
+    slices.
+
+    >>> balanced_slices([4, 0, 2], [4, 0, 2], 2)
+    [[(0, 0, 3)], [(0, 3, 4), (2, 0, 2)]]
+    >>> balanced_slices([4, 2], [2, 6], 2)
+    [[(0, 0, 4), (1, 0, 1)], [(1, 1, 2)]]
+    """
+    if not sum(weights):
+        weights = counts
+    cum_counts = [0] + list(toolz.accumulate(operator.add, counts))
+    cum_weights = [0] + list(toolz.accumulate(operator.add, weights))
+    total = cum_weights[-1]
+
+    # Global element index of every cut between new partitions
+    cuts = [0]
+    for j in range(1, npartitions):
+        target = total * j / npartitions
+        i = min(bisect.bisect_right(cum_weights, target), len(counts)) - 1
+        offset = 0
+        if weights[i]:
+            offset = int(round((target - cum_weights[i]) / weights[i] *
+                               counts[i]))
+        cuts.append(max(cuts[-1], cum_counts[i] + offset))
+    cuts.append(cum_counts[-1])
+
+    plan = []
+    for lo, hi in zip(cuts[:-1], cuts[1:]):
+        slices = []
+        for i, n in enumerate(counts):
+            start = max(lo, cum_counts[i]) - cum_counts[i]
+            stop = min(hi, cum_counts[i + 1]) - cum_counts[i]
+            if start < stop:
+                slices.append((i, start, stop))
+        plan.append(slices)
+    return plan
+
+
+def split_dict_by_hash(d, npartitions):
+    """ Split a dict into ``npartitions`` dicts by hashing its keys
+
+    >>> split_dict_by_hash({0: 'a', 1: 'b', 2: 'c'}, 2)
+    [{0: 'a', 2: 'c'}, {1: 'b'}]
+    """
+    out = [dict() for i in range(npartitions)]
+    for k, v in iteritems(d):
+        out[abs(hash(k)) % npartitions][k] = v
+    return out
+
+
+def collect_buckets(i, splits):
+    """ Merge bucket ``i`` of every split into a list of k,v group pairs """
+    out = defaultdict(list)
+    for buckets in splits:
+        for k, v in buckets[i]:
+            out[k].extend(v)
+    return list(out.items())
+
+
+def groupby_memory(b, grouper, npartitions=None):
+    """ Group by a hash partitioning that stays in memory
+
+    Every input partition is grouped and split into ``npartitions`` buckets
+    in a single pass, then every output partition merges its bucket from all
+    splits.  Nothing is serialized, so this is fastest with the threaded
+    scheduler, but all data must fit in memory.  Use ``groupby_disk``
+    otherwise.
+    """
+    if npartitions is None:
+        npartitions = b.npartitions
+    token = tokenize(b, grouper, npartitions)
+
+    split = 'groupby-split-{0}-{1}'.format(funcname(grouper), token)
+    dsk1 = dict(((split, i), (split_by_hash, grouper, (b.name, i), npartitions))
+                for i in range(b.npartitions))
+
+    name = 'groupby-memory-' + token
+    dsk2 = dict(((name, i), (collect_buckets, i, list(dsk1)))
+                for i in range(npartitions))
+
+    return type(b)(merge(b.dask, dsk1, dsk2), name, npartitions)
+
+
+def sort_bag(b, key, npartitions, reverse, method):
+    token = tokenize(b, key, npartitions, reverse, method)
+    sorted_name = 'sort-partition-' + token
+    sample_name = 'sort-sample-' + token
+    bounds = 'sort-boundaries-' + token
+    split_name = 'sort-split-' + token
+    name = 'sort-merge-' + token
+
+    nsamples = 20 * npartitions
+    dsk = {bounds: (sort_boundaries, [(sample_name, i)
+                                      for i in range(b.npartitions)],
+                    npartitions)}
+    for i in range(b.npartitions):
+        dsk[(sorted_name, i)] = (sort_partition, (b.name, i), key, reverse)
+        dsk[(sample_name, i)] = (sample_sorted, (sorted_name, i), key,
+                                 nsamples)
+        dsk[(split_name, i)] = (split_sorted, (sorted_name, i), key, bounds,
+                                npartitions)
+
+    # Descending output partitions are the ascending ones in reverse order
+    order = range(npartitions)
+    if reverse:
+        order = reversed(order)
+
+    if method == 'tasks':
+        for j, k in enumerate(order):
+            dsk[(name, j)] = (merge_runs, [(operator.getitem, (split_name, i), k)
+                                           for i in range(b.npartitions)],
+                              key, reverse)
+    else:
+        import partd
+        p = ('partd-' + token,)
+        # Create the directory when the graph runs, not here, so that
+        # computing the bag twice does not append runs twice
+        try:
+            dsk[p] = (partd.Python, (partd.Snappy, (partd.File,)))
+        except AttributeError:
+            dsk[p] = (partd.Python, (partd.File,))
+        spill_name = 'sort-spill-' + token
+        for i in range(b.npartitions):
+            dsk[(spill_name, i)] = (spill_runs, (split_name, i), i, p)
+        barrier_token = 'sort-barrier-' + token
+        dsk[barrier_token] = (len, [(spill_name, i)
+                                    for i in range(b.npartitions)])
+        for j, k in enumerate(order):
+            dsk[(name, j)] = (merge_spilled_runs, p, k, b.npartitions, key,
+                              reverse, barrier_token)
+
+    return type(b)(merge(b.dask, dsk), name, npartitions)
+
+
+def sort_partition(seq, key=None, reverse=False):
+    """ Sort a partition in ascending order
+
+    With ``reverse=True`` equal elements come out in reverse order, so that
+    they are back in their original order once the result is reversed.
+    """
+    seq = list(seq)
+    if reverse:
+        seq.reverse()
+    seq.sort(key=key)
+    return seq
+
+
+def sample_sorted(seq, key, nsamples):
+    """ Evenly spaced keys of a sorted sequence with the count each stands for
+
+    >>> sample_sorted([1, 2, 3, 4, 5, 6], None, 3)
+    [(2, 2.0), (4, 2.0), (6, 2.0)]
+    """
+    n = len(seq)
+    nsamples = min(n, nsamples)
+    if not nsamples:
+        return []
+    weight = n / nsamples
+    return [(key(seq[i]) if key else seq[i], weight)
+            for i in [(k + 1) * n // nsamples - 1 for k in range(nsamples)]]
+
+
+def sort_boundaries(samples, npartitions):
+    """ Keys cutting weighted samples into ``npartitions`` equal parts
+
+    >>> sort_boundaries([[(2, 2.0), (4, 2.0)], [(1, 1.0), (3, 1.0)]], 2)
+    [3]
+    """
+    samples = sorted(toolz.concat(samples), key=operator.itemgetter(0))
+    if not samples:
+        return []
+    cumulative = list(toolz.accumulate(operator.add, map(second, samples)))
+    total = cumulative[-1]
+    return [samples[min(bisect.bisect_right(cumulative,
+                                            total * j / npartitions),
+                        len(samples) - 1)][0]
+            for j in range(1, npartitions)]
+
+
+def split_sorted(seq, key, boundaries, npartitions):
+    """ Cut a sorted sequence into runs falling between ``boundaries``
+
+    >>> split_sorted([1, 2, 3, 4, 5], None, [2, 4], 3)
+    [[1], [2, 3], [4, 5]]
+    """
+    keys = list(map(key, seq)) if key else seq
+    cuts = ([0] + [bisect.bisect_left(keys, k) for k in boundaries] +
+            [len(seq)] * (npartitions - len(boundaries)))
+    return [seq[cuts[j]:cuts[j + 1]] for j in range(npartitions)]
+
+
+def merge_runs(runs, key=None, reverse=False):
+    """ k-way merge of sorted runs
+
+    >>> merge_runs([[1, 4], [2, 3, 5]])
+    [1, 2, 3, 4, 5]
+    >>> merge_runs([[1, 4], [2, 3, 5]], reverse=True)
+    [5, 4, 3, 2, 1]
+
+    The merge is stable.  Descending runs are merged in ascending order from
+    the last run to the first, with equal elements already reversed by
+    ``sort_partition``, and the result reversed.
+    """
+    if not reverse:
+        return list(merge_sorted(*runs, key=key))
+    result = list(merge_sorted(*runs[::-1], key=key))
+    result.reverse()
+    return result
+
+
+def spill_runs(runs, i, p):
+    """ Store run ``j`` of partition ``i`` on disk under key ``(j, i)`` """
+    p.append(dict(((j, i), run) for j, run in enumerate(runs) if run))
+    return len(runs)
+
+
+def merge_spilled_runs(p, j, nruns, key, reverse, barrier_token):
+    """ Read the runs of range ``j`` back from disk and merge them
+
+    The runs are deleted from disk once read.  Whichever range is read last
+    finds no runs left and removes the spill directory.
+    """
+    keys = [(j, i) for i in range(nruns)]
+    runs = p.get(keys, lock=False)
+    p.delete(keys, lock=False)
+    path = partd_path(p)
+    if path and not any(f != '.lock' for _, _, files in os.walk(path)
+                        for f in files):
+        shutil.rmtree(path, ignore_errors=True)
+    return merge_runs(runs, key, reverse)
+
+
+def partd_path(p):
+    """ Directory of the ``partd.File`` under any encoding layers """
+    while not hasattr(p, 'path') and hasattr(p, 'partd'):
+        p = p.partd
+    return getattr(p, 'path', None)
+
+
 def empty_safe_apply(func, part):
-    part = list(part)
+    if not is_columnar(part):
+        part = list(part)
     if part:
         return func(part)
     else:
         return no_result
 
 
+def lazy_safe_apply(func, part):
+    """ Like ``empty_safe_apply`` but hands ``func`` an iterator """
+    if is_columnar(part):
+        return func(part) if len(part) else no_result
+    part = iter(part)
+    try:
+        head = next(part)
+    except StopIteration:
+        return no_result
+    return func(itertools.chain([head], part))
+
+
+_iterator_safe_funcs = set([sum, max, min, any, all, count, set, reduce,
+                            _reduce, frequencies_partition, sketch.hll_chunk,
+                            sketch.misra_gries_chunk])
+
+
 def empty_safe_aggregate(func, parts):
     parts2 = [p for p in parts if not eq_strict(p, no_result)]
     return empty_safe_apply(func, parts2)
@@ -0,0 +1,171 @@
+""" Mergeable sketches for approximate reductions
+
+Every sketch here has a constant-size state that can be computed per
+partition and merged pairwise, so it fits the ``chunk``/``aggregate`` shape
+of ``Bag.reduction``.
+
+*   HyperLogLog estimates the number of distinct elements
+*   Misra-Gries summaries find the most frequent elements
+
+t-digests for ``Bag.quantile_approx`` live in ``dask.array.percentile``.
+"""
+from __future__ import absolute_import, division, print_function
+
+from collections import defaultdict
+import hashlib
+import heapq
+import math
+from numbers import Number
+import pickle
+import struct
+
+from toolz.compatibility import iteritems
+
+from ..compatibility import unicode
+
+MASK64 = (1 << 64) - 1
+
+
+def _mix64(x):
+    """ SplitMix64 finalizer, spreads the bits of a 64-bit integer
+
+    Also works elementwise on NumPy ``uint64`` arrays, where the masks are
+    no-ops and overflow wraps around.
+    """
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def hash64(x):
+    """ A 64-bit hash that is stable across processes
+
+    Python randomizes ``hash`` of strings per process and ``hash`` of most
+    other objects depends on their address, which would make sketches built
+    on different workers incompatible.  Only numbers, whose ``hash`` is
+    fixed, use ``hash``.  Text and bytes are hashed with md5, tuples and
+    frozensets element-wise, and other objects through md5 of their pickle.
+    Equal objects that pickle differently, like dicts in different insertion
+    order, get different hashes.  Objects that cannot be pickled fall back
+    to ``hash``, which may differ between processes.
+
+    >>> hash64('Alice') == hash64(u'Alice')
+    True
+    >>> hash64(1) == hash64(1.0)
+    True
+    """
+    if isinstance(x, unicode):
+        x = x.encode('utf-8')
+    if isinstance(x, bytes):
+        return struct.unpack('<Q', hashlib.md5(x).digest()[:8])[0]
+    if isinstance(x, tuple):
+        h = 0x345678
+        for y in x:
+            h = _mix64(h ^ hash64(y))
+        return h
+    if x is None:
+        return _mix64(0x4E6F6E65)
+    if isinstance(x, Number):
+        if x != x:
+            # NaN hashes by address on recent Pythons
+            return _mix64(0x4E614E)
+        return _mix64(hash(x) & MASK64)
+    if isinstance(x, frozenset):
+        return _mix64(sum(map(hash64, x)) & MASK64)
+    try:
+        data = pickle.dumps(x, protocol=2)
+    except Exception:
+        return _mix64(hash(x) & MASK64)
+    return hash64(data)
+
+
+def hll_chunk(seq, precision=12):
+    """ HyperLogLog registers of a sequence
+
+    Each element is hashed; the leading ``precision`` bits choose a register
+    which records the longest run of leading zeros seen in the other bits.
+    """
+    m = 1 << precision
+    shift = 64 - precision
+    low = (1 << shift) - 1
+    registers = bytearray(m)
+    for x in seq:
+        h = hash64(x)
+        j = h >> shift
+        rho = shift - (h & low).bit_length() + 1
+        if rho > registers[j]:
+            registers[j] = rho
+    return registers
+
+
+def hll_merge(states):
+    """ Merge HyperLogLog registers by elementwise maximum """
+    states = list(states)
+    if len(states) == 1:
+        return states[0]
+    return bytearray(map(max, *states))
+
+
+def hll_estimate(registers):
+    """ Estimated number of distinct elements from HyperLogLog registers
+
+    ``registers`` is a ``bytearray`` or a NumPy array of ``uint8``.  The
+    relative standard error is about ``1.04 / sqrt(len(registers))``.
+    """
+    m = len(registers)
+    if m >= 128:
+        alpha = 0.7213 / (1 + 1.079 / m)
+    else:
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+    estimate = alpha * m * m / sum(2.0 ** -r for r in registers)
+    zeros = sum(1 for r in registers if not r)
+    if estimate <= 2.5 * m and zeros:
+        # Small range correction: linear counting
+        estimate = m * math.log(m / zeros)
+    return int(round(estimate))
+
+
+def misra_gries_prune(counts, k):
+    """ Reduce a dict of counts to at most ``k`` entries
+
+    The ``k + 1``-th largest count is subtracted from every count and
+    non-positive entries are dropped.  Counts stay lower bounds of the
+    true frequencies.  A pandas Series of counts is pruned the same way and
+    keeps its order.
+
+    >>> misra_gries_prune({'a': 5, 'b': 3, 'c': 1}, 2)
+    {'a': 4, 'b': 2}
+    """
+    if hasattr(counts, 'nlargest'):
+        if len(counts) <= k:
+            return counts
+        threshold = counts.nlargest(k + 1).iloc[-1]
+        return counts[counts > threshold] - threshold
+    if len(counts) <= k:
+        return dict(counts)
+    threshold = heapq.nlargest(k + 1, counts.values())[-1]
+    return dict((key, c - threshold) for key, c in iteritems(counts)
+                if c > threshold)
+
+
+def misra_gries_chunk(seq, k):
+    """ Misra-Gries summary of a sequence """
+    counts = defaultdict(int)
+    for x in seq:
+        counts[x] += 1
+    return misra_gries_prune(counts, k)
+
+
+def misra_gries_merge(summaries, k):
+    """ Merge Misra-Gries summaries, keeping at most ``k`` entries """
+    counts = defaultdict(int)
+    for summary in summaries:
+        for key, c in iteritems(summary):
+            counts[key] += c
+    return misra_gries_prune(counts, k)
+
+
+def misra_gries_items(summary):
+    """ Summary as ``(element, count)`` pairs, most frequent first """
+    return sorted(summary.items(), key=lambda kv: kv[1], reverse=True)
@@ -4,21 +4,26 @@ from __future__ import absolute_import, division, print_function
 import pytest
 import math
 import os
+import pickle
 import sys
+import tempfile
 from collections import Iterator
 from distutils.version import LooseVersion
 
 import partd
-from toolz import merge, join, filter, identity, valmap, groupby, pluck
+from toolz import (merge, join, filter, identity, valmap, groupby, pluck,
+                   first, second)
 
 import dask
 import dask.bag as db
 from dask.bag.core import (Bag, lazify, lazify_task, map, collect,
                            reduceby, reify, partition, inline_singleton_lists,
-                           optimize, from_delayed)
+                           optimize, from_delayed, filter_partition,
+                           lazy_safe_apply)
 from dask.async import get_sync
+from dask.core import get_dependencies
 from dask.compatibility import BZ2File, GzipFile, PY2
-from dask.utils import filetexts, tmpfile, tmpdir, open
+from dask.utils import filetexts, tmpfile, tmpdir, open, dependency_depth
 from dask.utils_test import inc, add
 
 
@@ -113,7 +118,8 @@ def test_map_with_kwargs():
 def test_filter():
     c = b.filter(iseven)
     expected = merge(dsk, dict(((c.name, i),
-                                (reify, (filter, iseven, (b.name, i))))
+                                (reify, (filter_partition, iseven,
+                                         (b.name, i))))
                                for i in range(b.npartitions)))
     assert c.dask == expected
     assert c.name == b.filter(iseven).name
@@ -307,6 +313,59 @@ def test_join():
     assert c.name == b.join([1, 2, 3], on_self=isodd, on_other=iseven).name
 
 
+def test_join_left():
+    c = b.join([1, 2, 3], on_self=lambda x: x, how='left')
+    expected = [(x if x in (1, 2, 3) else None, x) for x in L]
+    assert sorted(c, key=second) == sorted(expected, key=second)
+    with pytest.raises(NotImplementedError):
+        b.join([1, 2, 3], on_self=isodd, how='outer')
+    with pytest.raises(ValueError):
+        b.join([1, 2, 3], on_self=isodd, how='foo')
+
+
+@pytest.mark.parametrize('method', ['disk', 'tasks', 'memory'])
+@pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+def test_join_bags(how, method):
+    people = db.from_sequence([('Alice', 1), ('Bob', 2), ('Charlie', 3),
+                               ('Dennis', 4), ('Alice', 5)], npartitions=3)
+    cities = db.from_sequence([('Alice', 'NYC'), ('Bob', 'LA'),
+                               ('Edith', 'SF'), ('Alice', 'DC')],
+                              npartitions=2)
+    c = people.join(cities, on_self=first, how=how, method=method,
+                    npartitions=4)
+    assert c.name == people.join(cities, on_self=first, how=how,
+                                 method=method, npartitions=4).name
+    result = sorted(c.compute(get=dask.get), key=str)
+
+    small = db.from_sequence(cities.compute(), npartitions=1)
+    assert sorted(people.join(small, first, how=how), key=str) == result
+    if how in ('inner', 'left'):
+        assert people.join(small, first, how=how).npartitions == 3
+        assert (sorted(people.join(small, first, how=how), key=str) ==
+                result)
+        assert (sorted(people.join(cities, first, how=how, broadcast=True),
+                       key=str) == result)
+
+    inner = [(('Alice', 'NYC'), ('Alice', 1)), (('Alice', 'DC'), ('Alice', 1)),
+             (('Alice', 'NYC'), ('Alice', 5)), (('Alice', 'DC'), ('Alice', 5)),
+             (('Bob', 'LA'), ('Bob', 2))]
+    left = [(None, ('Charlie', 3)), (None, ('Dennis', 4))]
+    right = [(('Edith', 'SF'), None)]
+    expected = {'inner': inner, 'left': inner + left,
+                'right': inner + right, 'outer': inner + left + right}[how]
+    assert result == sorted(expected, key=str)
+
+
+def test_join_bags_default_scheduler():
+    people = db.from_sequence([('Alice', 1), ('Bob', 2)], npartitions=2)
+    cities = db.from_sequence([('Alice', 'NYC'), ('Edith', 'SF')],
+                              npartitions=2)
+    c = people.join(cities, on_self=first, how='outer', method='tasks')
+    assert sorted(c.compute(), key=str) == sorted(
+        [(('Alice', 'NYC'), ('Alice', 1)), (None, ('Bob', 2)),
+         (('Edith', 'SF'), None)], key=str)
+
+
 def test_foldby():
     c = b.foldby(iseven, add, 0, add, 0)
     assert (reduceby, iseven, add, (b.name, 0), 0) in list(c.dask.values())
@@ -317,6 +376,23 @@ def test_foldby():
     assert set(c) == set(reduceby(iseven, lambda acc, x: acc + x, L, 0).items())
 
 
+def test_foldby_split_out():
+    b = db.range(1000, npartitions=10)
+    key = lambda x: x % 97
+    expected = reduceby(key, add, range(1000), 0)
+
+    c = b.foldby(key, add, 0, add, 0, split_out=4)
+    assert c.npartitions == 4
+    assert c.name == b.foldby(key, add, 0, add, 0, split_out=4).name
+    assert c.name != b.foldby(key, add, 0, add, 0).name
+    parts = dask.get(c.dask, c._keys())
+    assert sum(map(len, parts)) == 97
+    assert dict(c) == expected
+
+    c = b.foldby(key, add, split_out=3)
+    assert dict(c) == expected
+
+
 def test_map_partitions():
     assert list(b.map_partitions(len)) == [5, 5, 5]
     assert b.map_partitions(len).name == b.map_partitions(len).name
@@ -583,6 +659,45 @@ def test_from_long_sequence():
     assert set(b) == set(L)
 
 
+def test_from_sequence_reference():
+    L = list(range(1001))
+    b = db.from_sequence(L, npartitions=7, reference=True)
+    assert b.npartitions == 7
+    assert len(b.dask) == 7
+    assert all(len(v) == 2 for v in b.dask.values())
+    # each task carries only its own partition, not the whole sequence
+    assert all(len(pickle.dumps(v)) < len(pickle.dumps(L)) / 5
+               for v in b.dask.values())
+    assert b.compute(get=dask.get) == L
+    assert b.map(inc).compute(get=dask.get) == [x + 1 for x in L]
+    assert b.sum().compute(get=dask.get) == sum(L)
+    assert b.map(inc).compute(get=dask.multiprocessing.get) == [x + 1 for x in L]
+
+    assert b.name == db.from_sequence(L, npartitions=7, reference=True).name
+    assert b.name != db.from_sequence(L, npartitions=6, reference=True).name
+    assert b.name != db.from_sequence(L[::-1], npartitions=7,
+                                      reference=True).name
+    assert b.name != db.from_sequence([-2] + L[1:], npartitions=7,
+                                      reference=True).name
+    assert b.name != db.from_sequence([float(x) for x in L], npartitions=7,
+                                      reference=True).name
+
+    records = [{'x': i} for i in range(10)]
+    b = db.from_sequence(records, partition_size=3, reference=True)
+    assert b.npartitions == 4
+    assert b.pluck('x').compute(get=dask.get) == list(range(10))
+    assert (b.pluck('x').compute(get=dask.multiprocessing.get) ==
+            list(range(10)))
+    # unhashable records are fingerprinted in full, not by a sample
+    records2 = records[:5] + [{'x': -1}] + records[6:]
+    assert b.name != db.from_sequence(records2, partition_size=3,
+                                      reference=True).name
+
+    b = db.from_sequence([], npartitions=3, reference=True)
+    assert b.npartitions == 1
+    assert list(b.compute(get=dask.get)) == []
+
+
 def test_product():
     b2 = b.product(b)
     assert b2.npartitions == b.npartitions**2
@@ -921,10 +1036,39 @@ def test_repartition():
         assert c.npartitions == y
         assert list(b) == c.compute(get=dask.get)
 
-    try:
-        b.repartition(100)
-    except NotImplementedError as e:
-        assert '100' in str(e)
+
+def test_repartition_more_partitions():
+    for x, y in [(2, 5), (3, 7), (1, 4), (5, 30)]:
+        b = db.from_sequence(range(20), npartitions=x)
+        c = b.repartition(y)
+        assert c.npartitions == y
+        assert list(b) == c.compute(get=dask.get)
+    assert b.repartition(30).name == b.repartition(30).name
+
+    parts = dask.get(c.dask, c._keys())
+    assert max(map(len, parts)) - min(map(len, parts)) <= 1
+
+
+def test_repartition_balance():
+    dsk = {('x', 0): list(range(100)), ('x', 1): [100],
+           ('x', 2): [], ('x', 3): list(range(101, 120))}
+    b = db.Bag(dsk, 'x', 4)
+    for npartitions in [2, 4, 6]:
+        c = b.repartition(npartitions, balance='count')
+        assert c.npartitions == npartitions
+        assert c.compute(get=dask.get) == list(range(120))
+        parts = dask.get(c.dask, c._keys())
+        assert max(map(len, parts)) - min(map(len, parts)) <= 1
+
+    b = db.from_sequence(['a'] * 30 + ['b' * 1000] * 10, npartitions=4)
+    c = b.repartition(4, balance='bytes')
+    assert c.compute(get=dask.get) == b.compute(get=dask.get)
+    parts = dask.get(c.dask, c._keys())
+    assert len(parts[0]) >= 30
+    assert len(parts[-1]) <= 4
+
+    with pytest.raises(ValueError):
+        b.repartition(2, balance='foo')
 
 
 @pytest.mark.skipif('not db.core._implement_accumulate')
@@ -939,6 +1083,28 @@ def test_accumulate():
     assert b.accumulate(add, -1).compute() == [-1, 0, 2, 5, 9, 14, 20, 27]
     assert b.accumulate(add).map(inc).compute() == [2, 4, 7, 11, 16, 22, 29]
 
+
+@pytest.mark.skipif('not db.core._implement_accumulate')
+def test_accumulate_associative():
+    parts = [[1, 2, 3], [4, 5], [], [6, 7], [8]]
+    dsk = dict((('test', i), p) for (i, p) in enumerate(parts))
+    b = db.Bag(dsk, 'test', len(parts))
+    r = b.accumulate(add, associative=True)
+    assert r.name == b.accumulate(add, associative=True).name
+    assert r.name != b.accumulate(add).name
+    assert r.compute() == b.accumulate(add).compute()
+    assert (b.accumulate(add, -1, associative=True).compute() ==
+            b.accumulate(add, -1).compute())
+
+    # order is preserved for non-commutative operators
+    b = db.from_sequence([[i] for i in range(20)], npartitions=9)
+    assert (b.accumulate(add, associative=True).compute() ==
+            b.accumulate(add).compute())
+
+    b = db.from_sequence(range(100), npartitions=50)
+    assert (dependency_depth(b.accumulate(add, associative=True).dask) <
+            dependency_depth(b.accumulate(add).dask) / 2)
+
     b = db.from_sequence([1, 2, 3], npartitions=1)
     assert b.accumulate(add).compute() == [1, 3, 6]
 
@@ -1002,6 +1168,87 @@ def test_groupby_tasks_3():
     # assert b.npartitions == 5
 
 
+def test_groupby_memory():
+    func = lambda x: x % 10
+    b = db.range(1000, npartitions=20)
+    out = b.groupby(func, method='memory')
+    assert out.npartitions == 20
+    assert len(out.dask) == len(b.dask) + 40
+    assert out.name == b.groupby(func, method='memory').name
+    assert out.name != b.groupby(func, method='memory', npartitions=5).name
+
+    partitions = dask.get(out.dask, out._keys())
+    for a in partitions:
+        for b2 in partitions:
+            if a is not b2:
+                assert not set(pluck(0, a)) & set(pluck(0, b2))
+
+    result = b.groupby(func, method='memory', npartitions=3).compute(get=dask.get)
+    assert valmap(sorted, dict(result)) == groupby(func, range(1000))
+
+
+@pytest.mark.parametrize('method', ['disk', 'tasks'])
+def test_sort(method):
+    L = [(i * 7919) % 1000 for i in range(1000)]
+    b = db.from_sequence(L, npartitions=7)
+    out = b.sort(method=method)
+    assert out.npartitions == 7
+    assert out.name == b.sort(method=method).name
+    assert out.name != b.sort(method=method, reverse=True).name
+    assert out.compute(get=dask.get) == sorted(L)
+
+    partitions = dask.get(out.dask, out._keys())
+    assert all(partitions)
+    assert max(map(len, partitions)) < 2 * 1000 / 7
+
+    out = b.sort(key=lambda x: -x, npartitions=3, method=method)
+    assert out.npartitions == 3
+    assert out.compute(get=dask.get) == sorted(L, reverse=True)
+
+    out = b.map(lambda x: {'x': x}).sort(key=lambda d: d['x'], reverse=True,
+                                         method=method)
+    assert out.pluck('x').compute(get=dask.get) == sorted(L, reverse=True)
+
+    assert list(db.from_sequence([], npartitions=1).sort(method=method)) == []
+
+    # reverse=True is stable, like sorted
+    L = [(i % 5, i) for i in range(100)]
+    b = db.from_sequence(L, npartitions=6)
+    out = b.sort(key=lambda x: x[0], reverse=True, npartitions=3,
+                 method=method)
+    assert (out.compute(get=dask.get) ==
+            sorted(L, key=lambda x: x[0], reverse=True))
+
+
+@pytest.mark.parametrize('get', [dask.get, dask.multiprocessing.get])
+def test_sort_disk_removes_spill_directory(get):
+    b = db.from_sequence(range(100), npartitions=5).map(lambda x: -x)
+    out = b.sort(method='disk')
+    # Output partitions do not wait on each other or on a cleanup task
+    for k in out._keys():
+        deps = get_dependencies(out.dask, k)
+        assert not set(deps) & set(out._keys())
+        assert len(deps) == 2
+    with tmpdir() as d:
+        old, tempfile.tempdir = tempfile.tempdir, d
+        try:
+            assert out.compute(get=get) == sorted(range(-99, 1))
+        finally:
+            tempfile.tempdir = old
+        assert not os.listdir(d)
+
+
+def test_to_textfiles_streams_partitions():
+    b = db.from_sequence(range(10), npartitions=2).map(str)
+    with tmpdir() as d:
+        out = b.to_textfiles(os.path.join(d, '*.txt'), compute=False)
+        assert not any(v[0] in (list, reify) for v in out[0].dask.values()
+                       if isinstance(v, tuple))
+        dask.compute(*out)
+        with open(os.path.join(d, '1.txt'), 'rb') as f:
+            assert f.read().split() == [b'5', b'6', b'7', b'8', b'9']
+
+
 def test_to_textfiles_empty_partitions():
     with tmpdir() as d:
         b = db.range(5, npartitions=5).filter(lambda x: x == 1).map(str)
@@ -1009,12 +1256,43 @@ def test_to_textfiles_empty_partitions():
         assert len(os.listdir(d)) == 5
 
 
+@pytest.mark.parametrize('ext', ['txt', 'gz'])
+def test_to_textfiles_many_lines(ext):
+    n = 2**14 * 2 + 5
+    b = db.range(n, npartitions=2).map(str)
+    with tmpdir() as d:
+        b.to_textfiles(os.path.join(d, '*.' + ext))
+        lines = db.read_text(os.path.join(d, '*.' + ext)).map(str.strip)
+        assert list(lines) == [str(i) for i in range(n)]
+
+
 def test_reduction_empty():
     b = db.from_sequence(range(10), npartitions=100)
     assert b.filter(lambda x: x % 2 == 0).max().compute(get=dask.get) == 8
     assert b.filter(lambda x: x % 2 == 0).min().compute(get=dask.get) == 0
 
 
+def test_lazy_partitions_reductions():
+    def total(seq):
+        assert isinstance(seq, Iterator)
+        return sum(seq)
+
+    b = db.from_sequence(range(10), npartitions=3).map(inc)
+    with dask.set_options(lazy_partitions=True):
+        assert b.filter(iseven).max().compute(get=dask.get) == 10
+        assert dict(b.map(iseven).frequencies()) == {True: 5, False: 5}
+        assert b.fold(add).compute(get=dask.get) == 55
+        # user functions are not assumed to be single pass
+        assert b.reduction(len, sum).compute(get=dask.get) == 10
+        with pytest.raises(AssertionError):
+            b.reduction(total, sum).compute(get=dask.get)
+
+    s = b.sum()
+    with dask.set_options(lazy_partitions=True):
+        dsk = optimize(s.dask, s._keys())
+    assert any(v[0] is lazy_safe_apply for v in dsk.values())
+
+
 class StrictReal(int):
     def __eq__(self, other):
         assert isinstance(other, StrictReal)
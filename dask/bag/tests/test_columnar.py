@@ -0,0 +1,88 @@
+from __future__ import absolute_import, division, print_function
+
+import pytest
+pd = pytest.importorskip('pandas')
+
+import dask.bag as db
+from dask.bag.columnar import Columns, Column
+from dask.bag.core import (pluck_partition, filter_partition,
+                           frequencies_partition, reduceby_partition)
+
+
+records = [{'name': 'Alice', 'amount': 100},
+           {'name': 'Bob', 'amount': 200},
+           {'name': 'Alice', 'amount': 300},
+           {'name': 'Charlie', 'amount': 400},
+           {'name': 'Bob', 'amount': 500}]
+
+
+def test_Columns_roundtrip():
+    part = Columns.from_records(records, columns=['name', 'amount'])
+    assert len(part) == 5
+    assert list(part) == records
+    assert part[1] == records[1]
+    assert part[-1] == records[-1]
+
+    tuples = [(1, 'a'), (2, 'b')]
+    part = Columns.from_records(tuples)
+    assert part.records == 'tuple'
+    assert list(part) == tuples
+
+    part = Columns.from_records([])
+    assert len(part) == 0
+    assert list(part) == []
+
+
+def test_partition_functions():
+    part = Columns.from_records(records)
+    names = pluck_partition('name', part)
+    assert isinstance(names, Column)
+    assert list(names) == ['Alice', 'Bob', 'Alice', 'Charlie', 'Bob']
+    assert frequencies_partition(names) == {'Alice': 2, 'Bob': 2, 'Charlie': 1}
+
+    pairs = pluck_partition(['amount', 'name'], part)
+    assert isinstance(pairs, Columns)
+    assert list(pairs)[0] == (100, 'Alice')
+
+    big = filter_partition(lambda r: r['amount'] > 250, part)
+    assert isinstance(big, Columns)
+    assert list(big) == records[2:]
+
+    totals = reduceby_partition('name', lambda t, r: t + r['amount'], part, 0)
+    assert totals == {'Alice': 400, 'Bob': 700, 'Charlie': 400}
+
+    assert list(pluck_partition('missing', part, None)) == [None] * 5
+
+
+def test_to_columnar():
+    b = db.from_sequence(records, npartitions=2)
+    c = b.to_columnar()
+    assert c.name == b.to_columnar().name
+    assert c.name != b.to_columnar(columns=['name']).name
+    assert list(c) == records
+
+    assert list(c.pluck('name')) == list(b.pluck('name'))
+    assert (dict(c.pluck('name').frequencies()) ==
+            dict(b.pluck('name').frequencies()))
+    assert list(c.pluck(['name', 'amount'])) == list(b.pluck(['name', 'amount']))
+    assert c.pluck('amount').sum().compute() == 1500
+    assert c.count().compute() == 5
+
+    pred = lambda r: r['name'] != 'Bob'
+    assert list(c.filter(pred)) == list(b.filter(pred))
+    assert list(c.filter(pred).map(lambda r: r['amount'])) == [100, 300, 400]
+
+    binop = lambda total, r: total + r['amount']
+    assert (dict(c.foldby('name', binop, 0, lambda x, y: x + y)) ==
+            dict(b.foldby('name', binop, 0, lambda x, y: x + y)))
+
+
+def test_to_columnar_to_dataframe():
+    pytest.importorskip('dask.dataframe')
+    b = db.from_sequence(records, npartitions=2)
+    c = b.to_columnar(columns=['name', 'amount'])
+    df = c.to_dataframe()
+    assert list(df.columns) == ['name', 'amount']
+    result = df.compute()
+    assert result.amount.tolist() == [100, 200, 300, 400, 500]
+    assert result.name.tolist() == list(b.pluck('name'))
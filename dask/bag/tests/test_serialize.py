@@ -0,0 +1,60 @@
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+import dask
+import dask.bag as db
+from dask.bag.serialize import (element_kind, encode_partition,
+                                decode_partition, dumps, loads, Packed,
+                                _pack_message)
+
+
+@pytest.mark.parametrize('seq', [
+    [(1, 'a', 1.5, True), (2, 'b', -0.0, False)],
+    [{'x': 1, 'y': [1, 2]}, {'y': [], 'x': 2}],
+    [(2**70, 1), (1, 2)],
+    [(1, 2), (1.0, 2)],
+    [(1, 2), (True, 2)],
+    [1, 'a', None],
+    [(1, 2), (1, 2, 3)],
+    [],
+])
+def test_roundtrip(seq):
+    result = decode_partition(encode_partition(seq))
+    assert result == seq
+    assert [list(map(type, x)) if isinstance(x, tuple) else type(x)
+            for x in result] == [list(map(type, x)) if isinstance(x, tuple)
+                                 else type(x) for x in seq]
+    assert loads(dumps((seq, None, 1))) == (seq, None, 1)
+
+
+def test_element_kind():
+    assert element_kind([(1, 2), (3, 4)]) == 'tuple'
+    assert element_kind([{'a': 1}, {'a': 2}]) == 'dict'
+    assert element_kind([{'a': 1}, {'b': 2}]) is None
+    assert element_kind([(1, 2), [3, 4]]) is None
+    assert element_kind([]) is None
+
+
+def test_compact():
+    seq = [(i, float(i), 'name') for i in range(1000)]
+    records = [{'id': i, 'amount': float(i)} for i in range(1000)]
+    import pickle
+    assert len(encode_partition(seq)) < len(pickle.dumps(seq, protocol=2))
+    assert (len(encode_partition(records)) <
+            0.75 * len(pickle.dumps(records, protocol=2)))
+
+    packed = _pack_message((None, {'x': records, 'y': 1}))
+    assert isinstance(packed[1]['x'], Packed)
+
+
+def test_bag_serializer_option():
+    b = db.from_sequence([(i % 7, float(i)) for i in range(100)],
+                         npartitions=4)
+    expected = b.groupby(lambda x: x[0], method='disk').compute(get=dask.get)
+    with dask.set_options(bag_serializer='typed'):
+        result = b.groupby(lambda x: x[0], method='disk')
+        assert dict(result.compute(get=dask.get)) == dict(expected)
+        result = b.map(lambda x: {'a': x[0]})
+        assert (result.compute(get=dask.multiprocessing.get) ==
+                [{'a': i % 7} for i in range(100)])
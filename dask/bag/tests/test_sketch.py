@@ -0,0 +1,108 @@
+from __future__ import absolute_import, division, print_function
+
+from datetime import datetime
+import math
+import os
+import subprocess
+import sys
+
+import dask
+import dask.bag as db
+from dask.bag.sketch import (hash64, hll_chunk, hll_merge, hll_estimate,
+                             misra_gries_chunk, misra_gries_merge)
+
+
+def test_hash64():
+    assert hash64('abc') == hash64(u'abc') == hash64(b'abc')
+    assert hash64('abc') != hash64('abd')
+    assert hash64(('a', 1)) == hash64(('a', 1))
+    assert hash64(('a', 1)) != hash64((1, 'a'))
+    assert 0 <= hash64(-1) < 2**64
+    assert hash64(frozenset(['a', 'b'])) == hash64(frozenset(['b', 'a']))
+    assert hash64(float('nan')) == hash64(float('nan'))
+    assert hash64(datetime(2000, 1, 1)) == hash64(datetime(2000, 1, 1))
+    assert hash64(datetime(2000, 1, 1)) != hash64(datetime(2000, 1, 2))
+
+
+def test_hash64_stable_across_processes():
+    code = ("from datetime import datetime; "
+            "from dask.bag.sketch import hash64; "
+            "print([hash64(x) for x in [None, ('a', None), "
+            "datetime(2000, 1, 1), frozenset(['a', 'b']), float('nan')]])")
+    outs = set()
+    for seed in ['1', '2']:
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        outs.add(subprocess.check_output([sys.executable, '-c', code],
+                                         env=env))
+    assert len(outs) == 1
+
+
+def test_hll():
+    seq = ['item-%d' % (i % 2000) for i in range(10000)]
+    registers = hll_chunk(seq, precision=12)
+    assert len(registers) == 4096
+    assert abs(hll_estimate(registers) - 2000) < 100
+
+    parts = [hll_chunk(seq[i::3], precision=12) for i in range(3)]
+    assert hll_merge(parts) == registers
+    assert hll_estimate(hll_chunk([], precision=12)) == 0
+
+
+def test_misra_gries():
+    seq = [1] * 50 + [2] * 30 + list(range(100, 120))
+    summary = misra_gries_chunk(seq, 2)
+    assert set(summary) == set([1, 2])
+    assert summary[1] <= 50 and summary[2] <= 30
+
+    merged = misra_gries_merge([misra_gries_chunk(seq[:50], 2),
+                                misra_gries_chunk(seq[50:], 2)], 2)
+    assert set(merged) == set([1, 2])
+
+
+def test_count_distinct_approx():
+    b = db.from_sequence([str(i % 3000) for i in range(20000)], npartitions=13)
+    result = b.count_distinct_approx().compute(get=dask.get)
+    assert abs(result - 3000) < 150
+    assert (b.count_distinct_approx(split_every=2).compute(get=dask.get) ==
+            result)
+    assert (b.count_distinct_approx().key !=
+            b.count_distinct_approx(precision=10).key)
+
+    empty = b.filter(lambda x: x == 'missing')
+    assert empty.count_distinct_approx().compute(get=dask.get) == 0
+
+
+def test_frequencies_approx():
+    seq = ['a'] * 100 + ['b'] * 50 + ['c'] * 25 + [str(i) for i in range(50)]
+    b = db.from_sequence(seq, npartitions=7)
+    result = list(b.frequencies_approx(k=3))
+    assert [k for k, v in result][:2] == ['a', 'b']
+    assert all(v <= seq.count(k) for k, v in result)
+
+    result = list(b.frequencies_approx(k=1000))
+    assert dict(result) == dict(b.frequencies())
+    assert [v for k, v in result] == sorted([v for k, v in result],
+                                            reverse=True)
+
+    assert list(b.filter(lambda x: x == 'missing').frequencies_approx()) == []
+
+
+def test_quantile_approx():
+    b = db.from_sequence(range(1001), npartitions=7)
+    assert b.quantile_approx(0.5).compute(get=dask.get) == 500
+    result = b.quantile_approx([0.1, 0.999], split_every=2)
+    low, high = result.compute(get=dask.get)
+    assert abs(low - 100) < 2
+    assert abs(high - 999) < 2
+    assert (b.quantile_approx(0.5).key !=
+            b.quantile_approx(0.5, compression=50).key)
+
+    seq = [(i * 7919) % 10007 for i in range(10007)]
+    b = db.from_sequence(seq, npartitions=5)
+    result = b.quantile_approx([0, 0.001, 0.5, 0.999, 1]).compute(get=dask.get)
+    assert result[0] == 0 and result[-1] == 10006
+    for q, r in zip([0.001, 0.5, 0.999], result[1:-1]):
+        assert abs(r - q * 10006) < 20
+
+    empty = b.filter(lambda x: x < 0).quantile_approx(0.5)
+    assert math.isnan(empty.compute(get=dask.get))
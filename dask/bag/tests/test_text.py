@@ -3,10 +3,13 @@ from __future__ import print_function, division, absolute_import
 import pytest
 from toolz import partial
 
+import dask
 from dask import compute, get
+from dask.bag.core import optimize
 from dask.utils import filetexts
 from dask.bytes import compression
-from dask.bag.text import read_text
+from dask.bag.text import read_text, read_json, parse_json_lines
+from dask.bag.columnar import Columns
 
 compute = partial(compute, get=get)
 
@@ -45,3 +48,56 @@ def test_read_text(fmt, bs, encoding):
                            encoding=encoding, collection=False)
         L = compute(*blocks)
         assert ''.join(line for block in L for line in block) == expected
+
+
+@pytest.mark.parametrize('bs', [None, 10])
+def test_read_text_streams_into_reductions(bs):
+    with filetexts(files):
+        b = read_text('.test.accounts.*.json', blocksize=bs)
+        s = b.map(len).sum()
+        with dask.set_options(lazy_partitions=True):
+            dsk = optimize(s.dask, s._keys())
+            assert s.compute(get=get) == len(expected)
+        # each partition's lines are fused into its reduction unmaterialized
+        parts = [v[2][2] for k, v in dsk.items() if isinstance(k, tuple)]
+        assert parts
+        assert not any(isinstance(get({'x': t}, 'x'), list) for t in parts)
+
+        blocks = read_text('.test.accounts.*.json', blocksize=bs,
+                           collection=False)
+        assert all(isinstance(L, list) for L in compute(*blocks))
+
+
+@pytest.mark.parametrize('fmt,bs', fmt_bs)
+def test_read_json(fmt, bs):
+    compress = compression.compress[fmt]
+    files2 = dict((k, compress(v.encode())) for k, v in files.items())
+    with filetexts(files2, mode='b'):
+        b = read_json('.test.accounts.*.json', compression=fmt, blocksize=bs)
+        L, = compute(b)
+        assert [d['amount'] for d in L] == list(range(100, 900, 100))
+        assert L[0] == {'amount': 100, 'name': 'Alice'}
+
+        b = read_json('.test.accounts.*.json', compression=fmt, blocksize=bs,
+                      columnar=True, columns=['name', 'amount'])
+        assert list(b.pluck('amount')) == list(range(100, 900, 100))
+        assert b.filter(lambda d: d['name'] == 'Bob').count().compute() == 2
+
+
+def test_parse_json_lines():
+    block = b'{"a": 1, "b": "x"}\r\n\n{"a": 2, "b": "y"}\n'
+    assert parse_json_lines(block) == [{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'y'}]
+    assert parse_json_lines(b'') == []
+
+    text = u'{"a": "\u00e9"}\n'
+    assert parse_json_lines(text.encode('latin-1'), 'latin-1') == [{'a': u'\u00e9'}]
+
+    bad = b'{"a": "\xff"}\n'
+    with pytest.raises(ValueError):
+        parse_json_lines(bad)
+    assert parse_json_lines(bad, errors='replace') == [{'a': u'\ufffd'}]
+
+    part = parse_json_lines(block, columnar=True)
+    assert isinstance(part, Columns)
+    assert part.frame.a.dtype.kind == 'i'
+    assert list(part) == [{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'y'}]
@@ -1,15 +1,19 @@
 from __future__ import print_function, division, absolute_import
 
+import codecs
 import io
 import os
+import sys
 
 from toolz import concat
 
+from ..compatibility import PY3
 from ..utils import infer_compression, system_encoding
 from ..delayed import delayed
 from ..bytes.compression import files as cfiles, seekable_files
 from ..bytes import open_text_files, read_bytes
 from .core import from_delayed
+from .columnar import Columns
 
 delayed = delayed(pure=True)
 
@@ -91,7 +95,9 @@ def read_text(urlpath, blocksize=None, compression='infer',
                                    **(storage_options or {}))
             if isinstance(blocks[0], (tuple, list)):
                 blocks = list(concat(blocks))
-            blocks = [delayed(decode)(b, encoding, errors)
+            # ``list`` is dropped when a partition fuses into a single
+            # consumer, so lines stream out of the decoded block
+            blocks = [delayed(list)(delayed(decode)(b, encoding, errors))
                       for b in blocks]
 
     if not blocks:
@@ -105,5 +111,119 @@ def read_text(urlpath, blocksize=None, compression='infer',
 
 def decode(block, encoding, errors):
     text = block.decode(encoding, errors)
-    lines = io.StringIO(text)
-    return list(lines)
+    return io.StringIO(text)
+
+
+def read_json(urlpath, blocksize=None, compression='infer', encoding='utf-8',
+              errors='strict', columnar=False, columns=None, collection=True,
+              storage_options=None):
+    """ Read records from line-delimited JSON files
+
+    Each line of each file holds one JSON document.  Lines are parsed
+    directly from the raw byte blocks produced by ``read_bytes`` using
+    ``ujson`` when it is installed and the standard library ``json``
+    otherwise, avoiding the intermediate decoded text and list of lines
+    built by ``read_text(...).map(json.loads)``.
+
+    Parameters
+    ----------
+    urlpath: string or list
+        Absolute or relative filepath, URL (may include protocols like
+        ``s3://``), globstring, or a list of beforementioned strings.
+    blocksize: None or int
+        Size to cut up larger files.  Streams by default.
+    compression: string
+        Compression format like 'gzip' or 'xz'.  Defaults to 'infer'
+    encoding: string
+    errors: string
+    columnar: bool, optional
+        Store each partition column-wise, see ``Bag.to_columnar``.  Column
+        dtypes are inferred from the parsed records.
+    columns: list, optional
+        If ``columnar``, the fields to keep
+    collection: bool, optional
+        Return dask.bag if True, or list of delayed values if false
+    storage_options: dict
+        Extra options that make sense to a particular storage connection, e.g.
+        host, port, username, password, etc.
+
+    Examples
+    --------
+    >>> b = read_json('logs.*.json')  # doctest: +SKIP
+    >>> b = read_json('s3://bucket/logs.*.json.gz')  # doctest: +SKIP
+    >>> b = read_json('logs.*.json', blocksize=2**26, columnar=True)  # doctest: +SKIP
+
+    Returns
+    -------
+    dask.bag.Bag if collection is True or list of Delayed lists otherwise
+
+    See Also
+    --------
+    read_text: Read lines from text files
+    """
+    if isinstance(urlpath, (tuple, list, set)):
+        blocks = sum([read_json(fn, blocksize=blocksize,
+                                compression=compression, encoding=encoding,
+                                errors=errors, columnar=columnar,
+                                columns=columns, collection=False,
+                                storage_options=storage_options)
+                      for fn in urlpath], [])
+    else:
+        if compression == 'infer':
+            compression = infer_compression(urlpath)
+
+        if blocksize and compression not in seekable_files:
+            msg = ("Compression %s does not support breaking apart files\n"
+                   "Use ``blocksize=None`` or decompress file externally")
+            raise ValueError(msg % compression)
+        if compression not in seekable_files and compression not in cfiles:
+            raise NotImplementedError("Compression format %s not installed" %
+                                      compression)
+
+        _, blocks = read_bytes(urlpath, delimiter=b'\n', blocksize=blocksize,
+                               sample=False, compression=compression,
+                               **(storage_options or {}))
+        if blocks and isinstance(blocks[0], (tuple, list)):
+            blocks = list(concat(blocks))
+        blocks = [delayed(parse_json_lines)(b, encoding, errors, columnar,
+                                            columns)
+                  for b in blocks]
+
+    if not blocks:
+        raise ValueError("No files found", urlpath)
+
+    if not collection:
+        return blocks
+    else:
+        return from_delayed(blocks)
+
+
+def json_loads():
+    """ The fastest available function to parse a JSON document """
+    try:
+        import ujson
+        return ujson.loads
+    except ImportError:
+        import json
+        return json.loads
+
+
+def parse_json_lines(block, encoding='utf-8', errors='strict',
+                     columnar=False, columns=None):
+    """ Parse a block of bytes holding one JSON document per line
+
+    >>> parse_json_lines(b'{"x": 1}\\n{"x": 2}\\n')
+    [{'x': 1}, {'x': 2}]
+    """
+    loads = json_loads()
+    lines = block.split(b'\n')
+    # json only accepts bytes from Python 3.6 on, and only strict utf-8
+    if (codecs.lookup(encoding).name != 'utf-8' or errors != 'strict' or
+            (PY3 and sys.version_info < (3, 6))):
+        out = [loads(line.decode(encoding, errors))
+               for line in lines if line.strip()]
+    else:
+        out = [loads(line) for line in lines if line.strip()]
+    if columnar:
+        return Columns.from_records(out, columns=columns)
+    return out
@@ -3,7 +3,7 @@ from __future__ import print_function, division, absolute_import
 import io
 import os
 
-from toolz import merge
+from toolz import merge, partition_all
 from warnings import warn
 
 from .compression import seekable_files, files as compress_files
@@ -63,22 +63,37 @@ def write_block_to_file(data, f, compression, encoding):
                     f.write(out)
         else:
             # iterable, e.g., bag contents
-            start = False
-            for d in data:
-                if start:
-                    f.write(b'\n')
-                else:
-                    start = True
-                if encoding:
-                    f.write(d.encode(encoding=encoding))
-                else:
-                    f.write(d)
+            write_lines(data, f, encoding)
     finally:
         f.close()
         if original:
             f2.close()
 
 
+def write_lines(data, f, encoding=None, lines_per_block=2**14):
+    """ Write newline separated elements to ``f`` in large blocks
+
+    Elements are joined and encoded ``lines_per_block`` at a time and each
+    block is written with a single call, rather than calling ``write`` and
+    ``encode`` once per element.
+
+    >>> f = io.BytesIO()
+    >>> write_lines(['a', 'b', 'c'], f, 'utf-8', lines_per_block=2)
+    >>> f.getvalue() == b'a\\nb\\nc'
+    True
+    """
+    sep = u'\n' if encoding else b'\n'
+    first = True
+    for block in partition_all(lines_per_block, data):
+        block = sep.join(block)
+        if not first:
+            block = sep + block
+        first = False
+        if encoding:
+            block = block.encode(encoding)
+        f.write(block)
+
+
 def write_bytes(data, urlpath, name_function=None, compression=None,
                 encoding=None, **kwargs):
     """For a list of values which evaluate to byte, produce delayed values
@@ -3,8 +3,15 @@ from __future__ import absolute_import, division, print_function
 from .callbacks import Callback
 from timeit import default_timer
 from numbers import Number
+import os
+import pickle
 import sys
 
+from .base import tokenize
+from .compatibility import unicode
+from .core import istask, ishashable, get_dependencies, toposort
+from .utils import key_split
+
 overhead = sys.getsizeof(1.23) * 4 + sys.getsizeof(()) * 4
 
 
@@ -64,3 +71,137 @@ class Cache(Callback):
     def _finish(self, dsk, state, errored):
         self.starttimes.clear()
         self.durations.clear()
+
+
+def persist_partials(key):
+    """ Whether ``key`` is a per-partition step of a reduction
+
+    These are the ``-part`` tasks of ``Bag.reduction`` and the ``-chunk``
+    tasks of dataframe ``apply_concat_apply``.
+
+    >>> persist_partials(('frequencies-part-1f2e', 0))
+    True
+    >>> persist_partials(('frequencies-aggregate-1f2e', 0))
+    False
+    """
+    name = key_split(key)
+    return name.endswith('-part') or name.endswith('-chunk')
+
+
+def _load_result(path):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+class IncrementalCache(Callback):
+    """ Persist partial results on disk to recompute only what changed
+
+    Every selected task is identified by a token of its lineage: its function
+    and arguments, with dependencies replaced by their own lineage tokens and
+    paths of local files by their path, modification time and size.  When a
+    ``read_text`` or ``read_csv`` pipeline is rerun over an append-only
+    directory, partial results of unchanged files are loaded from disk and
+    only new or modified files are read, even though the names of the
+    collections changed.
+
+    Parameters
+    ----------
+    directory: str
+        Where to store results
+    persist: callable, optional
+        Which keys to store, defaults to ``persist_partials``: the
+        per-partition steps of bag and dataframe reductions.
+
+    Examples
+    --------
+    >>> cache = IncrementalCache('.dask-partials')       # doctest: +SKIP
+    >>> with cache:                                        # doctest: +SKIP
+    ...     db.read_text('logs/*.gz').frequencies().compute()
+
+    Tasks whose lineage includes objects that cannot be tokenized
+    deterministically are never loaded from the cache.
+    """
+
+    def __init__(self, directory, persist=persist_partials):
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.directory = directory
+        self.persist = persist
+        self.tokens = dict()
+
+    def _path(self, token):
+        return os.path.join(self.directory, token + '.pkl')
+
+    def _start(self, dsk):
+        self.tokens.clear()
+        lineage = lineage_tokens(dsk)
+        for key, token in lineage.items():
+            if not self.persist(key):
+                continue
+            path = self._path(token)
+            if os.path.exists(path):
+                dsk[key] = (_load_result, path)
+            else:
+                self.tokens[key] = token
+
+    def _posttask(self, key, value, dsk, state, id):
+        if key in self.tokens:
+            path = self._path(self.tokens.pop(key))
+            tmp = path + '.tmp'
+            try:
+                import cloudpickle
+                with open(tmp, 'wb') as f:
+                    cloudpickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.rename(tmp, path)
+            except Exception:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+
+    def _finish(self, dsk, state, errored):
+        self.tokens.clear()
+
+    def clear(self):
+        """ Remove all stored results """
+        for fn in os.listdir(self.directory):
+            if fn.endswith('.pkl'):
+                os.remove(os.path.join(self.directory, fn))
+
+
+def lineage_tokens(dsk):
+    """ Tokens identifying the computation of every key, but not the key
+
+    >>> from dask.utils_test import inc
+    >>> a = lineage_tokens({'x': 1, 'y': (inc, 'x')})
+    >>> b = lineage_tokens({'a': 1, 'b': (inc, 'a')})
+    >>> a['y'] == b['b']
+    True
+    """
+    dependencies = dict((k, get_dependencies(dsk, k)) for k in dsk)
+    tokens = dict()
+    for key in toposort(dsk, dependencies=dependencies):
+        tokens[key] = tokenize(_replace_keys(dsk[key], tokens))
+    return tokens
+
+
+def _replace_keys(task, tokens):
+    """ Replace keys by their lineage and local files by their signature """
+    if istask(task):
+        return (task[0],) + tuple(_replace_keys(a, tokens) for a in task[1:])
+    if type(task) is list:
+        return [_replace_keys(a, tokens) for a in task]
+    if ishashable(task) and task in tokens:
+        return ('lineage', tokens[task])
+    if isinstance(task, (str, unicode)) and os.sep in task:
+        return file_signature(task)
+    return task
+
+
+def file_signature(path):
+    """ Path, modification time and size of a local file, else ``path`` """
+    try:
+        if os.path.isfile(path):
+            st = os.stat(path)
+            return ('file', path, st.st_mtime, st.st_size)
+    except (OSError, ValueError, TypeError):
+        pass
+    return path
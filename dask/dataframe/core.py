@@ -26,7 +26,7 @@ from .. import threaded
 from ..compatibility import apply, operator_div, bind_method
 from ..utils import (repr_long_list, IndexCallable, random_state_data,
                      pseudorandom, derived_from, funcname, memory_repr,
-                     put_lines, M)
+                     put_lines, prefix_scan, M)
 from ..base import Base, compute, tokenize, normalize_token
 from ..async import get_sync
 from . import methods
@@ -356,6 +356,31 @@ class _Frame(Base):
         return aca(self, chunk=chunk, aggregate=chunk, meta=self._meta,
                    token='drop-duplicates', split_every=split_every, **kwargs)
 
+    def nunique_approx(self, split_every=None):
+        """Approximate number of unique rows.
+
+        This method uses the HyperLogLog algorithm for cardinality
+        estimation to compute the approximate number of unique rows.
+        The approximate error is 0.406%.
+
+        Parameters
+        ----------
+        split_every : int, optional
+            Group partitions into groups of this size while performing a
+            tree-reduction. If set to False, no tree-reduction will be used.
+            Default is 8.
+
+        Returns
+        -------
+        an int representing the approximate number of unique rows
+        """
+        from . import hyperloglog  # here to avoid circular import issues
+        return aca([self], chunk=hyperloglog.compute_hll_array,
+                   combine=hyperloglog.reduce_state,
+                   aggregate=hyperloglog.estimate_count,
+                   split_every=split_every, b=16, meta=int,
+                   token='nunique-approx')
+
     def __len__(self):
         return self.reduction(len, np.sum, token='len', meta=int,
                               split_every=False).compute()
@@ -1222,12 +1247,15 @@ class _Frame(Base):
                                   axis=axis, skipna=skipna, ddof=ddof)
         else:
             num = self._get_numeric_data()
-            x = 1.0 * num.sum(skipna=skipna, split_every=split_every)
-            x2 = 1.0 * (num ** 2).sum(skipna=skipna, split_every=split_every)
-            n = num.count(split_every=split_every)
             name = self._token_prefix + 'var-%s' % tokenize(self, axis, skipna, ddof)
-            return map_partitions(methods.var_aggregate, x2, x, n,
-                                  token=name, meta=meta, ddof=ddof)
+            return num.reduction(methods.var_chunk,
+                                 aggregate=methods.var_aggregate,
+                                 combine=methods.var_combine, meta=meta,
+                                 token=name, split_every=split_every,
+                                 chunk_kwargs={'skipna': skipna},
+                                 aggregate_kwargs={
+                                     'ddof': ddof,
+                                     'series': isinstance(self, Series)})
 
     @derived_from(pd.DataFrame)
     def std(self, axis=None, skipna=True, ddof=1, split_every=False):
@@ -1243,7 +1271,7 @@ class _Frame(Base):
             name = self._token_prefix + 'std-finish--%s' % token
             return map_partitions(np.sqrt, v, meta=meta, token=name)
 
-    def quantile(self, q=0.5, axis=0):
+    def quantile(self, q=0.5, axis=0, method='default'):
         """ Approximate row-wise and precise column-wise quantiles of DataFrame
 
         Parameters
@@ -1253,9 +1281,11 @@ class _Frame(Base):
             Iterable of numbers ranging from 0 to 1 for the desired quantiles
         axis : {0, 1, 'index', 'columns'} (default 0)
             0 or 'index' for row-wise, 1 or 'columns' for column-wise
+        method : {'default', 'sketch'}
+            How row-wise quantiles are computed, see ``Series.quantile``
         """
         axis = self._validate_axis(axis)
-        keyname = 'quantiles-concat--' + tokenize(self, q, axis)
+        keyname = 'quantiles-concat--' + tokenize(self, q, axis, method)
 
         if axis == 1:
             if isinstance(q, list):
@@ -1271,7 +1301,8 @@ class _Frame(Base):
         else:
             meta = self._meta.quantile(q, axis=axis)
             num = self._get_numeric_data()
-            quantiles = tuple(quantile(self[c], q) for c in num.columns)
+            quantiles = tuple(quantile(self[c], q, method)
+                              for c in num.columns)
 
             dask = {}
             dask = merge(dask, *[_q.dask for _q in quantiles])
@@ -1327,19 +1358,16 @@ class _Frame(Base):
             name = '{0}{1}'.format(self._token_prefix, token)
             cname = '{0}{1}-cum-last'.format(self._token_prefix, token)
 
-            # aggregate cumulated partisions and its previous last element
+            # aggregate cumulated partitions and the combined last elements
+            # of all previous partitions, combined in a log-depth scan
             dask = {}
             dask[(name, 0)] = (cumpart._name, 0)
-
+            carries = prefix_scan(dask, aggregate, cname,
+                                  [(cumlast._name, i)
+                                   for i in range(self.npartitions - 1)])
             for i in range(1, self.npartitions):
-                # store each cumulative step to graph to reduce computation
-                if i == 1:
-                    dask[(cname, i)] = (cumlast._name, i - 1)
-                else:
-                    # aggregate with previous cumulation results
-                    dask[(cname, i)] = (aggregate, (cname, i - 1),
-                                        (cumlast._name, i - 1))
-                dask[(name, i)] = (aggregate, (cumpart._name, i), (cname, i))
+                dask[(name, i)] = (aggregate, (cumpart._name, i),
+                                   carries[i - 1])
             return self._constructor(merge(dask, cumpart.dask, cumlast.dask),
                                      name, chunk(self._meta), self.divisions)
 
@@ -1566,13 +1594,19 @@ class Series(_Frame):
         df.divisions = tuple(pd.Index(self.divisions).to_timestamp())
         return df
 
-    def quantile(self, q=0.5):
+    def quantile(self, q=0.5, method='default'):
         """ Approximate quantiles of Series
 
         q : list/array of floats, default 0.5 (50%)
             Iterable of numbers ranging from 0 to 1 for the desired quantiles
+        method : {'default', 'sketch'}
+            The default method computes exact quantiles of every partition
+            and merges them.  ``'sketch'`` summarizes every partition with a
+            t-digest of bounded size instead, which keeps intermediates
+            small and is most accurate for tail quantiles like 0.999.  Only
+            numeric Series are supported by the sketch.
         """
-        return quantile(self, q)
+        return quantile(self, q, method)
 
     def _repartition_quantiles(self, npartitions, upsample=1.0):
         """ Approximate quantiles of Series used for repartitioning
@@ -1646,6 +1680,30 @@ class Series(_Frame):
                    meta=self._meta.value_counts(), token='value-counts',
                    split_every=split_every)
 
+    def value_counts_approx(self, k=100, split_every=None):
+        """Approximate counts of the most frequent values.
+
+        Each partition is reduced to a Misra-Gries summary of at most ``k``
+        values, so intermediate results stay small however many unique
+        values there are.  Every value occurring more than ``n / (k + 1)``
+        times in a series of length ``n`` is returned.  Counts are lower
+        bounds, short by at most ``n / (k + 1)``.
+
+        Parameters
+        ----------
+        k : int, optional
+            Maximum number of values kept.  Default is 100.
+        split_every : int, optional
+            Group partitions into groups of this size while performing a
+            tree-reduction. If set to False, no tree-reduction will be used.
+            Default is 8.
+        """
+        return aca(self, chunk=methods.value_counts_approx_chunk,
+                   aggregate=methods.value_counts_approx_aggregate,
+                   combine=methods.value_counts_approx_combine,
+                   meta=self._meta.value_counts(),
+                   token='value-counts-approx', split_every=split_every, k=k)
+
     @derived_from(pd.Series)
     def nlargest(self, n=5, split_every=None):
         return aca(self, chunk=M.nlargest, aggregate=M.nlargest,
@@ -2881,16 +2939,27 @@ def _rename_dask(df, names):
     return new_dd_object(merge(dsk, df.dask), name, metadata, df.divisions)
 
 
-def quantile(df, q):
+def quantile(df, q, method='default'):
     """Approximate quantiles of Series.
 
     Parameters
     ----------
     q : list/array of floats
         Iterable of numbers ranging from 0 to 100 for the desired quantiles
+    method : {'default', 'sketch'}
+        Merge exact per-partition percentiles, or per-partition t-digests
     """
     assert isinstance(df, Series)
-    from dask.array.percentile import _percentile, merge_percentiles
+    from dask.array.percentile import (_percentile, merge_percentiles,
+                                       tdigest_chunk, tdigest_merge,
+                                       tdigest_percentile)
+    if method not in ('default', 'sketch'):
+        raise ValueError("method must be 'default' or 'sketch', got %r"
+                         % method)
+    kind = getattr(df._meta.dtype, 'kind', 'O')
+    if method == 'sketch' and kind not in 'iuf':
+        raise NotImplementedError("method='sketch' is only implemented for "
+                                  "numeric Series")
 
     # currently, only Series has quantile method
     if isinstance(df, Index):
@@ -2911,7 +2980,7 @@ def quantile(df, q):
     # pandas uses quantile in [0, 1]
     # numpy / everyone else uses [0, 100]
     qs = np.asarray(q) * 100
-    token = tokenize(df, qs)
+    token = tokenize(df, qs, method)
 
     if len(qs) == 0:
         name = 'quantiles-' + token
@@ -2921,6 +2990,18 @@ def quantile(df, q):
     else:
         new_divisions = [np.min(q), np.max(q)]
 
+    if method == 'sketch':
+        name = 'quantiles-tdigest-' + token
+        digest_dsk = dict(((name, i), (tdigest_chunk,
+                                       (getattr, key, 'values')))
+                          for i, key in enumerate(df._keys()))
+        name3 = 'quantiles-3-' + token
+        merge_dsk = {(name3, 0): finalize_tsk((tdigest_percentile,
+                                               (tdigest_merge,
+                                                sorted(digest_dsk)), qs))}
+        dsk = merge(df.dask, digest_dsk, merge_dsk)
+        return return_type(dsk, name3, meta, new_divisions)
+
     name = 'quantiles-1-' + token
     val_dsk = dict(((name, i), (_percentile, (getattr, key, 'values'), qs))
                    for i, key in enumerate(df._keys()))
@@ -71,29 +71,31 @@ def _var_chunk(df, index):
     if isinstance(df, pd.Series):
         df = df.to_frame()
     g = df.groupby(index)
-    x = g.sum()
-    x2 = g.agg(lambda x: (x**2).sum()).rename(columns=lambda c: c + '-x2')
-    n = g.count().rename(columns=lambda c: c + '-count')
-    return pd.concat([x, x2, n], axis=1)
+    n = g.count()
+    mean = g.mean()
+    m2 = (g.var(ddof=0) * n).fillna(0)
+    return pd.concat([n, mean, m2], axis=1, keys=['n', 'mean', 'm2'])
 
 
 def _var_combine(g):
-    return g.groupby(level=0).sum()
+    """ Merge counts, means and sums of squared deviations of equal groups
 
+    See ``dask.dataframe.methods.var_combine``
+    """
+    n = g['n']
+    mean = g['mean'].where(n > 0, 0)
+    total = n.groupby(level=0).sum()
+    merged_mean = (mean * n).groupby(level=0).sum() / total
+    delta = mean - merged_mean.reindex(g.index).values
+    m2 = (g['m2'] + (n * delta ** 2).where(n > 0, 0)).groupby(level=0).sum()
+    return pd.concat([total, merged_mean, m2], axis=1,
+                     keys=['n', 'mean', 'm2'])
 
-def _var_agg(g, ddof):
-    g = g.groupby(level=0).sum()
-    nc = len(g.columns)
-    x = g[g.columns[:nc // 3]]
-    x2 = g[g.columns[nc // 3:2 * nc // 3]].rename(columns=lambda c: c[:-3])
-    n = g[g.columns[-nc // 3:]].rename(columns=lambda c: c[:-6])
 
-    # TODO: replace with _finalize_var?
-    result = x2 - x ** 2 / n
-    div = (n - ddof)
-    div[div < 0] = 0
-    result /= div
-    result[(n - ddof) == 0] = np.nan
+def _var_agg(g, ddof):
+    g = _var_combine(g)
+    n = g['n']
+    result = g['m2'] / (n - ddof).where(n - ddof > 0, np.nan)
     assert isinstance(result, pd.DataFrame)
     return result
 
@@ -0,0 +1,78 @@
+""" Vectorized HyperLogLog for pandas objects
+
+Partial results are arrays of ``2**b`` one-byte registers, so
+``Series.nunique_approx`` has constant-size intermediates however many
+distinct values there are.
+"""
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+import pandas as pd
+
+from ..bag.sketch import _mix64, hash64, hll_estimate
+
+
+def hash_values(obj):
+    """ Stable 64-bit hash of every value of a Series or Index
+
+    Numeric, boolean and datetime values are hashed from their bits without
+    leaving NumPy.  Other values go through ``dask.bag.sketch.hash64``.
+    """
+    values = getattr(obj, 'values', obj)
+    if isinstance(values, pd.Categorical):
+        values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind in 'biuMm':
+        bits = values.astype('i8').view('u8')
+    elif kind == 'f':
+        values = values.astype('f8')
+        # Make 0.0 and -0.0 hash the same, as they compare equal
+        values[values == 0] = 0
+        bits = values.view('u8')
+    else:
+        return np.fromiter((hash64(x) for x in values), dtype='u8',
+                           count=len(values))
+    with np.errstate(over='ignore'):
+        return _mix64(bits)
+
+
+def compute_hll_array(obj, b):
+    """ HyperLogLog registers of a Series, Index or DataFrame
+
+    DataFrames are counted by distinct rows.
+    """
+    if isinstance(obj, pd.DataFrame):
+        hashes = np.zeros(len(obj), dtype='u8')
+        with np.errstate(over='ignore'):
+            for col in obj.columns:
+                hashes = _mix64(hashes ^ hash_values(obj[col]))
+    else:
+        hashes = hash_values(obj)
+
+    shift = np.uint64(64 - b)
+    j = (hashes >> shift).astype('i8')
+    low = hashes & np.uint64((1 << (64 - b)) - 1)
+
+    # rho: position of the leftmost set bit among the low 64 - b bits
+    bit_length = np.zeros(len(low), dtype='i8')
+    for s in [32, 16, 8, 4, 2, 1]:
+        big = low >= np.uint64(1 << s)
+        bit_length[big] += s
+        low[big] >>= np.uint64(s)
+    bit_length += (low > 0)
+    rho = (64 - b) - bit_length + 1
+
+    registers = np.zeros(1 << b, dtype='u1')
+    np.maximum.at(registers, j, rho.astype('u1'))
+    return registers
+
+
+def reduce_state(Ms, b):
+    """ Merge concatenated register arrays by elementwise maximum """
+    m = 1 << b
+    return Ms.reshape(len(Ms) // m, m).max(axis=0)
+
+
+def estimate_count(Ms, b):
+    """ Estimated number of distinct values from concatenated registers """
+    return hll_estimate(bytearray(reduce_state(Ms, b)))
@@ -4,6 +4,8 @@ import numpy as np
 import pandas as pd
 from toolz import partition
 
+from ..bag.sketch import misra_gries_prune
+
 
 def loc(df, ind):
     return df.loc[ind]
@@ -21,14 +23,53 @@ def mean_aggregate(s, n):
         return np.nan
 
 
-def var_aggregate(x2, x, n, ddof):
-    try:
-        result = (x2 / n) - (x / n)**2
-        if ddof != 0:
-            result = result * n / (n - ddof)
-        return result
-    except ZeroDivisionError:
-        return np.nan
+def var_chunk(x, skipna=True):
+    """ Count, mean and sum of squared deviations of every column
+
+    One row per column for a DataFrame, a single row for a Series.
+    """
+    n = x.count()
+    mean = x.mean(skipna=skipna)
+    m2 = ((x - mean) ** 2).sum(skipna=skipna)
+    if skipna:
+        # pandas < 0.22 sums all-missing values to NaN rather than 0
+        if isinstance(x, pd.Series):
+            m2 = m2 if n else 0.0
+        else:
+            m2 = m2.where(n > 0, 0)
+    if isinstance(x, pd.Series):
+        return pd.DataFrame({'n': [n], 'mean': [mean], 'm2': [m2]},
+                            columns=['n', 'mean', 'm2'])
+    return pd.DataFrame({'n': n, 'mean': mean, 'm2': m2},
+                        columns=['n', 'mean', 'm2'])
+
+
+def var_combine(parts):
+    """ Merge the rows of ``var_chunk`` results with equal index
+
+    Chan's parallel update: sums of squared deviations add up once the
+    squared distance between every part mean and the merged mean, weighted
+    by the part count, is added.
+    """
+    n = parts['n']
+    mean = parts['mean'].where(n > 0, 0)
+    g = n.groupby(level=0, sort=False)
+    total = g.sum()
+    merged_mean = (mean * n).groupby(level=0, sort=False).sum() / total
+    delta = mean - merged_mean.reindex(parts.index).values
+    m2 = (parts['m2'] + (n * delta ** 2).where(n > 0, 0))
+    m2 = m2.groupby(level=0, sort=False).sum()
+    # Missing values left in by ``skipna=False`` stay missing
+    m2 = m2.where(~parts['m2'].isnull().groupby(level=0, sort=False).any())
+    return pd.DataFrame({'n': total, 'mean': merged_mean, 'm2': m2},
+                        columns=['n', 'mean', 'm2'])
+
+
+def var_aggregate(parts, ddof, series=False):
+    result = var_combine(parts)
+    n = result['n']
+    var = result['m2'] / (n - ddof).where(n - ddof > 0, np.nan)
+    return var.iloc[0] if series else var
 
 
 def describe_aggregate(values):
@@ -74,6 +115,19 @@ def value_counts_aggregate(x):
     return x.groupby(level=0).sum().sort_values(ascending=False)
 
 
+def value_counts_approx_chunk(x, k=100):
+    return misra_gries_prune(x.value_counts(), k)
+
+
+def value_counts_approx_combine(x, k=100):
+    counts = x.groupby(level=0).sum().sort_values(ascending=False)
+    return misra_gries_prune(counts, k)
+
+
+def value_counts_approx_aggregate(x, k=100):
+    return value_counts_approx_combine(x, k)
+
+
 def nbytes(x):
     return x.nbytes
 
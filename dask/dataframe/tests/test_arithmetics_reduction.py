@@ -775,6 +775,21 @@ def test_reductions_non_numeric_dtypes():
     assert_eq(dds.nunique(), pds.nunique())
 
 
+@pytest.mark.parametrize('split_every', [False, 2])
+def test_var_poorly_conditioned(split_every):
+    pdf = pd.DataFrame({'a': np.random.random(100) + 1e8,
+                        'b': np.random.random(100).astype('f4') + 1e3})
+    ddf = dd.from_pandas(pdf, npartitions=6)
+    assert_eq(ddf.var(split_every=split_every), pdf.var())
+    assert_eq(ddf.a.std(ddof=0, split_every=split_every), pdf.a.std(ddof=0))
+
+    pdf.loc[3:80, 'a'] = np.nan
+    ddf = dd.from_pandas(pdf, npartitions=6)
+    assert_eq(ddf.var(split_every=split_every), pdf.var())
+    assert_eq(ddf.var(skipna=False, split_every=split_every),
+              pdf.var(skipna=False))
+
+
 @pytest.mark.parametrize('split_every', [False, 2])
 def test_reductions_frame(split_every):
     dsk = {('x', 0): pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]},
@@ -722,6 +722,20 @@ def test_value_counts():
     assert result._name != result2._name
 
 
+def test_value_counts_approx():
+    df = pd.DataFrame({'x': [1, 2, 1, 3, 3, 1, 4] * 10 + list(range(10, 40))})
+    ddf = dd.from_pandas(df, npartitions=5)
+    result = ddf.x.value_counts_approx(k=3).compute()
+    assert list(result.index[:2]) == [1, 3]
+    assert (result <= df.x.value_counts()[result.index]).all()
+    assert len(result) <= 3
+
+    result = ddf.x.value_counts_approx(k=100).compute()
+    assert_eq(result.sort_index(), df.x.value_counts().sort_index())
+    assert (ddf.x.value_counts_approx(split_every=2)._name !=
+            ddf.x.value_counts_approx()._name)
+
+
 def test_unique():
     pdf = pd.DataFrame({'x': [1, 2, 1, 3, 3, 1, 4, 2, 3, 1],
                         'y': ['a', 'c', 'b', np.nan, 'c',
@@ -797,6 +811,31 @@ def test_quantile():
     assert 4 < result < 6
 
 
+def test_quantile_sketch():
+    s = pd.Series(np.random.RandomState(0).exponential(size=50000))
+    ds = dd.from_pandas(s, npartitions=7)
+
+    result = ds.quantile([.5, .99, .999], method='sketch')
+    assert isinstance(result, dd.Series)
+    assert result.divisions == (.5, .999)
+    expected = s.quantile([.5, .99, .999])
+    assert np.allclose(result.compute(), expected, rtol=0.03)
+    assert_eq(result.index, expected.index)
+
+    result = ds.quantile(.5, method='sketch')
+    assert isinstance(result, dd.core.Scalar)
+    assert abs(result.compute() - s.median()) < 0.02
+
+    df = pd.DataFrame({'x': np.arange(100), 'y': ['a'] * 100})
+    ddf = dd.from_pandas(df, npartitions=4)
+    assert_eq(ddf.quantile(.5, method='sketch'), df.quantile(.5))
+
+    with pytest.raises(NotImplementedError):
+        ddf.y.quantile(.5, method='sketch')
+    with pytest.raises(ValueError):
+        ds.quantile(.5, method='foo')
+
+
 def test_empty_quantile():
     result = d.b.quantile([])
     exp = full.b.quantile([])
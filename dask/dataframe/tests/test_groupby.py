@@ -299,6 +299,16 @@ def test_groupby_set_index():
                   lambda: ddf.groupby(df.index.month, as_index=False))
 
 
+def test_groupby_var_poorly_conditioned():
+    pdf = pd.DataFrame({'a': np.random.random(100) + 1e8,
+                        'b': np.random.randint(0, 5, 100)})
+    ddf = dd.from_pandas(pdf, npartitions=6)
+    for ddof in [0, 1]:
+        assert_eq(ddf.groupby('b').a.var(ddof), pdf.groupby('b').a.var(ddof))
+        assert_eq(ddf.groupby('b').var(ddof, split_every=2),
+                  pdf.groupby('b').var(ddof))
+
+
 def test_split_apply_combine_on_series():
     pdf = pd.DataFrame({'a': [1, 2, 6, 4, 4, 6, 4, 3, 7],
                         'b': [4, 2, 7, 3, 3, 1, 1, 1, 2]},
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import dask.dataframe as dd
+from dask.dataframe.hyperloglog import (compute_hll_array, estimate_count,
+                                        hash_values)
+
+
+rs = np.random.RandomState(96)
+
+
+@pytest.mark.parametrize("df", [
+    pd.DataFrame({'x': [1, 2, 3] * 3, 'y': [1.2, 3.4, 5.6] * 3,
+                  'z': rs.randint(0, 10, size=9)}),
+    pd.DataFrame({'x': rs.randint(0, 10000, size=20000),
+                  'y': rs.randint(0, 10, size=20000)}),
+    pd.DataFrame({'x': ['a', 'b', 'c', 'd'] * 250,
+                  'y': pd.date_range('2000', periods=1000)}),
+])
+def test_basic(df):
+    ddf = dd.from_pandas(df, npartitions=5)
+    for col in df.columns:
+        approx = ddf[col].nunique_approx().compute()
+        exact = len(df[col].drop_duplicates())
+        assert abs(approx - exact) <= 2 or abs(approx - exact) / exact < 0.05
+
+    approx = ddf.nunique_approx().compute()
+    exact = len(df.drop_duplicates())
+    assert abs(approx - exact) <= 2 or abs(approx - exact) / exact < 0.05
+
+
+def test_split_every():
+    df = pd.DataFrame({'x': rs.randint(0, 1000, size=5000)})
+    ddf = dd.from_pandas(df, npartitions=20)
+    assert (ddf.x.nunique_approx(split_every=2).compute() ==
+            ddf.x.nunique_approx(split_every=False).compute())
+    assert (ddf.x.nunique_approx(split_every=2)._name !=
+            ddf.x.nunique_approx()._name)
+
+
+def test_hash_values():
+    assert (hash_values(pd.Series([0.0, -0.0]))[0] ==
+            hash_values(pd.Series([0.0, -0.0]))[1])
+    h = hash_values(pd.Series(['a', 'b', 'a']))
+    assert h[0] == h[2] != h[1]
+
+
+def test_registers_merge():
+    s = pd.Series(rs.randint(0, 500, size=2000))
+    parts = [compute_hll_array(p, 10) for p in np.array_split(s, 4)]
+    whole = compute_hll_array(s, 10)
+    assert estimate_count(np.concatenate(parts), 10) == estimate_count(whole, 10)
@@ -54,6 +54,11 @@ def get(dsk, keys, num_workers=None, func_loads=None, func_dumps=None,
         (defaults to cloudpickle.loads)
     optimize_graph : bool
         If True [default], `fuse` is applied to the graph before computation.
+
+    Setting ``set_options(bag_serializer='typed')`` changes the defaults of
+    ``func_dumps`` and ``func_loads`` to ``dask.bag.serialize.dumps`` and
+    ``loads``, which pack partitions of uniform tuples or dicts column by
+    column.
     """
     pool = _globals['pool']
     if pool is None:
@@ -71,8 +76,14 @@ def get(dsk, keys, num_workers=None, func_loads=None, func_dumps=None,
 
     # We specify marshalling functions in order to catch serialization
     # errors and report them to the user.
-    loads = func_loads or _globals.get('func_loads') or _loads
-    dumps = func_dumps or _globals.get('func_dumps') or _dumps
+    loads = func_loads or _globals.get('func_loads')
+    dumps = func_dumps or _globals.get('func_dumps')
+    if _globals.get('bag_serializer') == 'typed':
+        from .bag import serialize
+        loads = loads or serialize.loads
+        dumps = dumps or serialize.dumps
+    loads = loads or _loads
+    dumps = dumps or _dumps
 
     # Note former versions used a multiprocessing Manager to share
     # a Queue between parent and workers, but this is fragile on Windows
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+import dask
+from dask.cache import IncrementalCache, lineage_tokens
+from dask.utils import tmpdir
+from dask.utils_test import inc, add
+
+db = pytest.importorskip('dask.bag')
+
+
+def test_lineage_tokens():
+    dsk = {'x': 1, 'y': (inc, 'x'), 'z': (add, 'y', (inc, 'x'))}
+    tokens = lineage_tokens(dsk)
+    renamed = lineage_tokens({'x': 1, 'a': (inc, 'x'),
+                              'b': (add, 'a', (inc, 'x'))})
+    assert tokens['y'] == renamed['a']
+    assert tokens['z'] == renamed['b']
+    assert tokens['x'] != lineage_tokens({'x': 2})['x']
+    assert tokens['y'] != lineage_tokens({'x': 2, 'y': (inc, 'x')})['y']
+
+
+lines_read = []
+
+
+def strip_line(line):
+    lines_read.append(line)
+    return line.strip()
+
+
+def test_incremental_read_text():
+    with tmpdir() as d:
+        data = os.path.join(d, 'data')
+        os.mkdir(data)
+        for i in range(3):
+            with open(os.path.join(data, '%d.txt' % i), 'w') as f:
+                f.write('a\nb\n%d\n' % i)
+
+        cache = IncrementalCache(os.path.join(d, 'cache'))
+        pattern = os.path.join(data, '*.txt')
+
+        def run():
+            del lines_read[:]
+            with cache:
+                b = db.read_text(pattern).map(strip_line)
+                return dict(b.frequencies().compute(get=dask.get))
+
+        expected = {'a': 3, 'b': 3, '0': 1, '1': 1, '2': 1}
+        assert run() == expected
+        assert len(lines_read) == 9
+        assert len(os.listdir(os.path.join(d, 'cache'))) == 3
+
+        assert run() == expected
+        assert not lines_read
+
+        with open(os.path.join(data, '3.txt'), 'w') as f:
+            f.write('a\n3\n')
+        assert run() == {'a': 4, 'b': 3, '0': 1, '1': 1, '2': 1, '3': 1}
+        assert sorted(lines_read) == ['3\n', 'a\n']
+
+        with open(os.path.join(data, '0.txt'), 'a') as f:
+            f.write('c\n')
+        assert run() == {'a': 4, 'b': 3, 'c': 1,
+                         '0': 1, '1': 1, '2': 1, '3': 1}
+        assert sorted(lines_read) == ['0\n', 'a\n', 'b\n', 'c\n']
+
+        cache.clear()
+        assert not os.listdir(os.path.join(d, 'cache'))
+        assert len(run()) == 7
+        assert len(lines_read) == 12
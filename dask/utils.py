@@ -775,6 +775,45 @@ def dependency_depth(dsk):
     return max(max_depth_by_deps(dep_key) for dep_key in deps.keys())
 
 
+def prefix_scan(dsk, binop, name, keys):
+    """ Add tasks to ``dsk`` computing inclusive prefixes of ``keys``
+
+    Builds a Brent-Kung scan: about ``2 * len(keys)`` calls to the
+    associative ``binop`` with a dependency depth of ``2 * log2(len(keys))``
+    rather than ``len(keys)`` for a sequential chain.  Returns the keys
+    holding ``binop(...binop(keys[0], keys[1])..., keys[i])``.
+
+    >>> from operator import add
+    >>> dsk = {('x', 0): 1, ('x', 1): 2, ('x', 2): 3, ('x', 3): 4}
+    >>> keys = prefix_scan(dsk, add, 'scan', sorted(dsk))
+    >>> from dask import get
+    >>> get(dsk, keys)
+    (1, 3, 6, 10)
+    """
+    keys = list(keys)
+    n = len(keys)
+
+    def combine(i, j, level):
+        key = (name, level, j)
+        dsk[key] = (binop, keys[i], keys[j])
+        keys[j] = key
+
+    level = 0
+    stride = 1
+    while stride < n:
+        for j in range(2 * stride - 1, n, 2 * stride):
+            combine(j - stride, j, level)
+        level += 1
+        stride *= 2
+    stride //= 2
+    while stride >= 1:
+        for j in range(3 * stride - 1, n, 2 * stride):
+            combine(j - stride, j, level)
+        level += 1
+        stride //= 2
+    return keys
+
+
 def eq_strict(a, b):
     """Returns True if both values have the same type and are equal."""
     if type(a) is type(b):